@@ -0,0 +1,163 @@
+"""Concurrent public-submit throughput for each SQLite pragma profile.
+
+Usage:
+    PYTHONHASHSEED=0 python benchmarks/submit_concurrency.py --writers 8 --submits 200 --readers 2
+    PYTHONHASHSEED=0 python benchmarks/submit_concurrency.py --profiles wal --write-queue
+
+Each profile runs against a fresh, migrated database. Writers call
+``SubmissionService.command_submit_public`` in their own session (as uvicorn's
+threadpool would) while readers page through submissions. ``--write-queue`` routes the inserts
+through the group-commit ``SubmissionWriteQueue``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy.exc import OperationalError
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _prepare_env(db_path: Path, profile: str) -> None:
+    os.environ["HFORMS_DB_PATH"] = str(db_path)
+    os.environ["HFORMS_SQLITE_PROFILE"] = profile
+    os.environ.setdefault("HFORMS_ADMIN_TOKEN", "bench-admin-token")
+    os.environ.setdefault("HFORMS_TIMEZONE", "UTC")
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "-c", "migrations/alembic.ini", "upgrade", "head"],
+        cwd=ROOT,
+        env=os.environ.copy(),
+        check=True,
+        capture_output=True,
+    )
+    from hitech_forms.db.engine import reset_engine_cache
+    from hitech_forms.platform.settings import reset_settings_cache
+    from hitech_forms.services.public_form_cache import reset_public_form_cache
+    from hitech_forms.services.submission_validation import reset_submission_validator_cache
+
+    reset_settings_cache()
+    reset_engine_cache()
+    reset_submission_validator_cache()
+    reset_public_form_cache()
+
+
+def _seed_form() -> tuple[int, str]:
+    from hitech_forms.db import session_scope
+    from hitech_forms.db.repositories import FormRepository
+    from hitech_forms.services import FormService
+
+    with session_scope() as session:
+        service = FormService(FormRepository(session))
+        created = service.command_create_form(title="Bench Intake")
+        service.command_replace_fields(
+            form_id=created["id"],
+            fields=[
+                {"key": "name", "label": "Name", "type": "text", "required": True},
+                {"key": "email", "label": "Email", "type": "email", "required": True},
+                {"key": "priority", "label": "Priority", "type": "select", "options": ["low", "high"]},
+            ],
+        )
+        published = service.command_publish_form(created["id"])
+    return int(published["id"]), str(published["slug"])
+
+
+def run_profile(
+    profile: str, *, writers: int, submits: int, readers: int, write_queue: bool = False
+) -> dict[str, float | int | str | bool]:
+    from hitech_forms.db import session_scope
+    from hitech_forms.db.repositories import FormRepository, SubmissionRepository
+    from hitech_forms.db.write_queue import (
+        get_submission_write_queue,
+        shutdown_submission_write_queue,
+    )
+    from hitech_forms.services import SubmissionService
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _prepare_env(Path(tmp) / "bench.db", profile)
+        form_id, slug = _seed_form()
+        writer = get_submission_write_queue() if write_queue else None
+        failures = {"locked": 0}
+        lock = threading.Lock()
+        stop_readers = threading.Event()
+        start = threading.Barrier(writers + readers + 1)
+
+        def _writer(worker: int) -> None:
+            start.wait()
+            for idx in range(submits):
+                values = {"name": f"W{worker}-{idx}", "email": f"w{worker}.{idx}@example.com", "priority": "low"}
+                try:
+                    with session_scope() as session:
+                        service = SubmissionService(
+                            FormRepository(session), SubmissionRepository(session), writer=writer
+                        )
+                        service.command_submit_public(slug=slug, values=values)
+                except OperationalError:
+                    with lock:
+                        failures["locked"] += 1
+
+        def _reader() -> None:
+            start.wait()
+            while not stop_readers.is_set():
+                with session_scope() as session:
+                    service = SubmissionService(FormRepository(session), SubmissionRepository(session))
+                    service.query_list_submissions(form_id=form_id, page=1, page_size=100)
+
+        threads = [threading.Thread(target=_writer, args=(idx,)) for idx in range(writers)]
+        threads += [threading.Thread(target=_reader) for _ in range(readers)]
+        for thread in threads:
+            thread.start()
+        start.wait()
+        began = time.perf_counter()
+        for thread in threads[:writers]:
+            thread.join()
+        elapsed = time.perf_counter() - began
+        stop_readers.set()
+        for thread in threads[writers:]:
+            thread.join()
+
+        from hitech_forms.db.engine import reset_engine_cache
+
+        shutdown_submission_write_queue()
+        reset_engine_cache()
+        attempted = writers * submits
+        return {
+            "profile": profile,
+            "write_queue": write_queue,
+            "attempted": attempted,
+            "failed_locked": failures["locked"],
+            "elapsed_s": round(elapsed, 3),
+            "submits_per_s": round((attempted - failures["locked"]) / elapsed, 1),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--submits", type=int, default=200, help="submits per writer")
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--profiles", default="legacy,wal")
+    parser.add_argument("--write-queue", action="store_true")
+    args = parser.parse_args()
+    from hitech_forms.platform.determinism import canonical_json_dumps
+
+    for profile in args.profiles.split(","):
+        result = run_profile(
+            profile.strip(),
+            writers=args.writers,
+            submits=args.submits,
+            readers=args.readers,
+            write_queue=args.write_queue,
+        )
+        print(canonical_json_dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""0003_submission_counters
+
+Revision ID: 0003_submission_counters
+Revises: 0002_submission_seq
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0003_submission_counters"
+down_revision = "0002_submission_seq"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "submission_counters",
+        sa.Column(
+            "form_id",
+            sa.Integer(),
+            sa.ForeignKey("forms.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("last_seq", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        sa.text(
+            "INSERT INTO submission_counters (form_id, last_seq) "
+            "SELECT form_id, MAX(submission_seq) FROM submissions GROUP BY form_id"
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("submission_counters")
@@ -0,0 +1,28 @@
+"""0004_submission_order_index
+
+Revision ID: 0004_submission_order_index
+Revises: 0003_submission_counters
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0004_submission_order_index"
+down_revision = "0003_submission_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_submissions_form_order",
+        "submissions",
+        ["form_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_submissions_form_order", table_name="submissions")
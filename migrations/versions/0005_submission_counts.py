@@ -0,0 +1,34 @@
+"""0005_submission_counts
+
+Revision ID: 0005_submission_counts
+Revises: 0004_submission_order_index
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0005_submission_counts"
+down_revision = "0004_submission_order_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("submission_counters", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("submission_count", sa.Integer(), nullable=False, server_default="0")
+        )
+    op.execute(
+        sa.text(
+            "UPDATE submission_counters SET submission_count = "
+            "(SELECT COUNT(*) FROM submissions WHERE submissions.form_id = submission_counters.form_id)"
+        )
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("submission_counters", schema=None) as batch_op:
+        batch_op.drop_column("submission_count")
@@ -0,0 +1,35 @@
+"""0006_submission_answers_packed
+
+Revision ID: 0006_submission_answers_packed
+Revises: 0005_submission_counts
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0006_submission_answers_packed"
+down_revision = "0005_submission_counts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("submissions", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("answers_packed", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    # Unpack packed submissions into answer rows so no data is lost.
+    op.execute(
+        sa.text(
+            "INSERT INTO answers (submission_id, field_key, value_text, created_at) "
+            "SELECT s.id, j.key, j.value, s.created_at "
+            "FROM submissions AS s, json_each(s.answers_packed) AS j "
+            "WHERE s.answers_packed IS NOT NULL ORDER BY s.id, j.key"
+        )
+    )
+    with op.batch_alter_table("submissions", schema=None) as batch_op:
+        batch_op.drop_column("answers_packed")
@@ -0,0 +1,68 @@
+"""0007_submission_search
+
+Revision ID: 0007_submission_search
+Revises: 0006_submission_answers_packed
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0007_submission_search"
+down_revision = "0006_submission_answers_packed"
+branch_labels = None
+depends_on = None
+
+_STRIDE = 1 << 16
+
+
+def upgrade() -> None:
+    op.create_index("ix_answers_field_value", "answers", ["field_key", "value_text"], unique=False)
+    op.execute(
+        sa.text(
+            "CREATE VIRTUAL TABLE submission_search USING fts5("
+            "form_id UNINDEXED, submission_id UNINDEXED, field_key, value_text, "
+            "tokenize = 'unicode61 remove_diacritics 2')"
+        )
+    )
+    op.execute(
+        sa.text(
+            "CREATE TRIGGER submissions_search_ad AFTER DELETE ON submissions BEGIN "
+            f"DELETE FROM submission_search WHERE rowid BETWEEN old.id * {_STRIDE} "
+            f"AND old.id * {_STRIDE} + {_STRIDE - 1}; "
+            "END"
+        )
+    )
+    op.execute(
+        sa.text(
+            "INSERT INTO submission_search (rowid, form_id, submission_id, field_key, value_text) "
+            f"SELECT s.id * {_STRIDE} + a.ordinal, s.form_id, s.id, a.field_key, a.value_text "
+            "FROM submissions AS s JOIN ("
+            "  SELECT submission_id, field_key, value_text, "
+            "  ROW_NUMBER() OVER (PARTITION BY submission_id ORDER BY field_key) - 1 AS ordinal "
+            "  FROM answers"
+            ") AS a ON a.submission_id = s.id "
+            "WHERE a.value_text <> ''"
+        )
+    )
+    op.execute(
+        sa.text(
+            "INSERT INTO submission_search (rowid, form_id, submission_id, field_key, value_text) "
+            f"SELECT s.id * {_STRIDE} + j.ordinal, s.form_id, s.id, j.key, j.value "
+            "FROM submissions AS s JOIN ("
+            "  SELECT s2.id AS submission_id, e.key AS key, e.value AS value, "
+            "  ROW_NUMBER() OVER (PARTITION BY s2.id ORDER BY e.key) - 1 AS ordinal "
+            "  FROM submissions AS s2, json_each(s2.answers_packed) AS e "
+            "  WHERE s2.answers_packed IS NOT NULL"
+            ") AS j ON j.submission_id = s.id "
+            "WHERE j.value <> ''"
+        )
+    )
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DROP TRIGGER IF EXISTS submissions_search_ad"))
+    op.execute(sa.text("DROP TABLE IF EXISTS submission_search"))
+    op.drop_index("ix_answers_field_value", table_name="answers")
@@ -0,0 +1,65 @@
+"""0008_field_stats
+
+Revision ID: 0008_field_stats
+Revises: 0007_submission_search
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0008_field_stats"
+down_revision = "0007_submission_search"
+branch_labels = None
+depends_on = None
+
+_ANSWER_VALUES = (
+    "SELECT s.form_id AS form_id, s.form_version_id AS form_version_id, "
+    "a.field_key AS field_key, a.value_text AS value_text "
+    "FROM submissions AS s JOIN answers AS a ON a.submission_id = s.id "
+    "UNION ALL "
+    "SELECT s.form_id, s.form_version_id, e.key, e.value "
+    "FROM submissions AS s, json_each(s.answers_packed) AS e "
+    "WHERE s.answers_packed IS NOT NULL"
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "field_fill_counts",
+        sa.Column("form_id", sa.Integer(), sa.ForeignKey("forms.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("field_key", sa.String(length=120), nullable=False),
+        sa.Column("filled_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("form_id", "field_key"),
+    )
+    op.create_table(
+        "field_value_counts",
+        sa.Column("form_id", sa.Integer(), sa.ForeignKey("forms.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("field_key", sa.String(length=120), nullable=False),
+        sa.Column("value_text", sa.Text(), nullable=False),
+        sa.Column("value_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("form_id", "field_key", "value_text"),
+    )
+    op.execute(
+        sa.text(
+            "INSERT INTO field_fill_counts (form_id, field_key, filled_count) "
+            f"SELECT v.form_id, v.field_key, COUNT(*) FROM ({_ANSWER_VALUES}) AS v "
+            "WHERE v.value_text <> '' GROUP BY v.form_id, v.field_key"
+        )
+    )
+    op.execute(
+        sa.text(
+            "INSERT INTO field_value_counts (form_id, field_key, value_text, value_count) "
+            f"SELECT v.form_id, v.field_key, v.value_text, COUNT(*) FROM ({_ANSWER_VALUES}) AS v "
+            "JOIN fields AS f ON f.form_version_id = v.form_version_id AND f.field_key = v.field_key "
+            "WHERE v.value_text <> '' AND f.type IN ('checkbox', 'date', 'number', 'select') "
+            "GROUP BY v.form_id, v.field_key, v.value_text"
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("field_value_counts")
+    op.drop_table("field_fill_counts")
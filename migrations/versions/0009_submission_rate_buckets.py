@@ -0,0 +1,41 @@
+"""0009_submission_rate_buckets
+
+Revision ID: 0009_submission_rate_buckets
+Revises: 0008_field_stats
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0009_submission_rate_buckets"
+down_revision = "0008_field_stats"
+branch_labels = None
+depends_on = None
+
+_BUCKET_SECONDS = (60, 3600, 86400)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "submission_rate_buckets",
+        sa.Column("form_id", sa.Integer(), sa.ForeignKey("forms.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("bucket_seconds", sa.Integer(), nullable=False),
+        sa.Column("bucket_start", sa.Integer(), nullable=False),
+        sa.Column("submission_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("form_id", "bucket_seconds", "bucket_start"),
+    )
+    for seconds in _BUCKET_SECONDS:
+        op.execute(
+            sa.text(
+                "INSERT INTO submission_rate_buckets (form_id, bucket_seconds, bucket_start, submission_count) "
+                f"SELECT form_id, {seconds}, created_at - (created_at % {seconds}), COUNT(*) "
+                f"FROM submissions GROUP BY form_id, created_at - (created_at % {seconds})"
+            )
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("submission_rate_buckets")
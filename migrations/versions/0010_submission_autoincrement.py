@@ -0,0 +1,44 @@
+"""0010_submission_autoincrement
+
+Revision ID: 0010_submission_autoincrement
+Revises: 0009_submission_rate_buckets
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0010_submission_autoincrement"
+down_revision = "0009_submission_rate_buckets"
+branch_labels = None
+depends_on = None
+
+_STRIDE = 1 << 16
+_SEARCH_TRIGGER = (
+    "CREATE TRIGGER submissions_search_ad AFTER DELETE ON submissions BEGIN "
+    f"DELETE FROM submission_search WHERE rowid BETWEEN old.id * {_STRIDE} "
+    f"AND old.id * {_STRIDE} + {_STRIDE - 1}; "
+    "END"
+)
+
+
+def _rebuild_submissions(*, autoincrement: bool) -> None:
+    # Recreating the table drops its triggers, so the search trigger is
+    # restored afterwards. Existing ids are copied as is; with AUTOINCREMENT
+    # sqlite_sequence starts from the highest of them.
+    op.execute(sa.text("DROP TRIGGER IF EXISTS submissions_search_ad"))
+    with op.batch_alter_table(
+        "submissions", recreate="always", table_kwargs={"sqlite_autoincrement": autoincrement}
+    ):
+        pass
+    op.execute(sa.text(_SEARCH_TRIGGER))
+
+
+def upgrade() -> None:
+    _rebuild_submissions(autoincrement=True)
+
+
+def downgrade() -> None:
+    _rebuild_submissions(autoincrement=False)
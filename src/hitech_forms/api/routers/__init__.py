@@ -2,10 +2,12 @@ from hitech_forms.api.routers.admin_export import build_admin_export_router
 from hitech_forms.api.routers.admin_forms import build_admin_forms_router
 from hitech_forms.api.routers.admin_submissions import build_admin_submissions_router
 from hitech_forms.api.routers.health import build_health_router
+from hitech_forms.api.routers.metrics import build_metrics_router
 from hitech_forms.api.routers.public_forms import build_public_forms_router
 
 __all__ = [
     "build_health_router",
+    "build_metrics_router",
     "build_admin_forms_router",
     "build_admin_submissions_router",
     "build_admin_export_router",
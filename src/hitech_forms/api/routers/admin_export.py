@@ -1,23 +1,64 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
 
 from hitech_forms.app.dependencies import admin_guard, get_export_service
 from hitech_forms.contracts import ExportServicePort
+from hitech_forms.platform.errors import bad_request, not_found
+from hitech_forms.platform.feature_flags import get_feature_flags
+from hitech_forms.platform.metrics import EXPORT_BYTES, count_bytes
 
 
 def build_admin_export_router() -> APIRouter:
     router = APIRouter(prefix="/admin/forms", dependencies=[Depends(admin_guard)])
 
-    @router.get("/{form_id}/export.csv")
-    def admin_export_csv(
+    @router.get("/{form_id}/export.{export_format}")
+    def admin_export(
         form_id: int,
+        export_format: str,
         version: str = "v1",
+        since_seq: int | None = None,
+        since_id: int | None = None,
+        snapshot: bool = False,
         export_service: ExportServicePort = Depends(get_export_service),
     ):
-        stream = export_service.stream_form_csv(form_id=form_id, export_version=version)
-        headers = {"Content-Disposition": f'attachment; filename="form_{form_id}.csv"'}
-        return StreamingResponse(stream, media_type="text/csv; charset=utf-8", headers=headers)
+        if snapshot:
+            return _snapshot_response(export_service, form_id=form_id, export_format=export_format)
+        stream = export_service.stream_form_export(
+            form_id=form_id,
+            export_format=export_format,
+            export_version=version,
+            since_seq=since_seq,
+            since_id=since_id,
+        )
+        headers = {
+            "Content-Disposition": f'attachment; filename="{stream.filename}"',
+            "X-Export-High-Water-Seq": str(stream.high_water_seq),
+            "X-Export-High-Water-Id": str(stream.high_water_id),
+        }
+        chunks = stream.chunks
+        if get_feature_flags().metrics:
+            chunks = count_bytes(chunks, EXPORT_BYTES, (export_format,))
+        return StreamingResponse(chunks, media_type=stream.media_type, headers=headers)
 
     return router
+
+
+def _snapshot_response(export_service: ExportServicePort, *, form_id: int, export_format: str) -> FileResponse:
+    if export_format != "csv":
+        raise bad_request("snapshots are only available for csv exports")
+    artifact = export_service.get_csv_artifact(form_id)
+    if artifact is None:
+        raise not_found("export snapshot not built")
+    # The gzip file is sent as-is (no Content-Encoding), so Range offsets
+    # address the stored bytes and resumed downloads stay consistent.
+    return FileResponse(
+        artifact.path,
+        media_type="application/gzip",
+        filename=f"form_{artifact.form_id}.csv.gz",
+        headers={
+            "X-Export-High-Water-Seq": str(artifact.high_water_seq),
+            "X-Export-High-Water-Id": str(artifact.high_water_id),
+        },
+    )
@@ -37,9 +37,15 @@ def build_admin_forms_router() -> APIRouter:
     def admin_list_forms(
         page: int = 1,
         page_size: int = 20,
+        cursor: str | None = None,
+        include_total: bool = True,
         form_service: FormServicePort = Depends(get_form_service),
     ):
-        return canonical_json_response(form_service.query_list_forms(page=page, page_size=page_size))
+        return canonical_json_response(
+            form_service.query_list_forms(
+                page=page, page_size=page_size, cursor=cursor, include_total=include_total
+            )
+        )
 
     @router.post("")
     def admin_create_form(
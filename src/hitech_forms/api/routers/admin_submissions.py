@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from starlette.concurrency import run_in_threadpool
 
 from hitech_forms.app.dependencies import admin_guard, get_submission_service
+from hitech_forms.app.ndjson import iter_body_lines
 from hitech_forms.app.responses import canonical_json_response
 from hitech_forms.contracts import SubmissionServicePort
 
@@ -15,12 +17,64 @@ def build_admin_submissions_router() -> APIRouter:
         form_id: int,
         page: int = 1,
         page_size: int = 20,
+        cursor: str | None = None,
+        include_total: bool = True,
+        q: str | None = None,
+        field: str | None = None,
+        value: str | None = None,
         submission_service: SubmissionServicePort = Depends(get_submission_service),
     ):
         return canonical_json_response(
-            submission_service.query_list_submissions(form_id=form_id, page=page, page_size=page_size)
+            submission_service.query_list_submissions(
+                form_id=form_id,
+                page=page,
+                page_size=page_size,
+                cursor=cursor,
+                include_total=include_total,
+                q=q,
+                field=field,
+                value=value,
+            )
         )
 
+    @router.get("/{form_id}/stats")
+    def admin_form_stats(
+        form_id: int,
+        submission_service: SubmissionServicePort = Depends(get_submission_service),
+    ):
+        return canonical_json_response(submission_service.query_form_stats(form_id))
+
+    @router.get("/{form_id}/submission-rates")
+    def admin_submission_rates(
+        form_id: int,
+        granularity: str = "minute",
+        start: int | None = None,
+        end: int | None = None,
+        submission_service: SubmissionServicePort = Depends(get_submission_service),
+    ):
+        return canonical_json_response(
+            submission_service.query_submission_rates(
+                form_id=form_id, granularity=granularity, start=start, end=end
+            )
+        )
+
+    @router.post("/{form_id}/submissions:bulk")
+    async def admin_bulk_submit(
+        request: Request,
+        form_id: int,
+        chunk_size: int = 1000,
+        submission_service: SubmissionServicePort = Depends(get_submission_service),
+    ):
+        # The command pulls lines from the body as it validates, so memory is
+        # bounded by chunk_size rather than the size of the upload.
+        report = await run_in_threadpool(
+            submission_service.command_bulk_submit,
+            form_id=form_id,
+            lines=iter_body_lines(request.stream()),
+            chunk_size=chunk_size,
+        )
+        return canonical_json_response(report)
+
     @router.get("/{form_id}/submissions/{submission_id}")
     def admin_get_submission(
         form_id: int,
@@ -31,4 +85,13 @@ def build_admin_submissions_router() -> APIRouter:
             submission_service.query_submission_detail(form_id=form_id, submission_id=submission_id)
         )
 
+    @router.delete("/{form_id}/submissions/{submission_id}")
+    def admin_delete_submission(
+        form_id: int,
+        submission_id: int,
+        submission_service: SubmissionServicePort = Depends(get_submission_service),
+    ):
+        submission_service.command_delete_submission(form_id=form_id, submission_id=submission_id)
+        return canonical_json_response({"ok": True})
+
     return router
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from hitech_forms.platform.errors import not_found
+from hitech_forms.platform.feature_flags import get_feature_flags
+from hitech_forms.platform.metrics import render_metrics
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def build_metrics_router() -> APIRouter:
+    router = APIRouter()
+
+    @router.get("/metrics")
+    def metrics():
+        if not get_feature_flags().metrics:
+            raise not_found("metrics are disabled")
+        return Response(content=render_metrics(), media_type=PROMETHEUS_MEDIA_TYPE)
+
+    return router
@@ -2,12 +2,20 @@ from __future__ import annotations
 
 from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from pydantic import BaseModel
 
-from hitech_forms.app.dependencies import get_form_service, get_submission_service
-from hitech_forms.app.responses import canonical_json_response
-from hitech_forms.contracts import FormServicePort, SubmissionServicePort
+from hitech_forms.app.dependencies import (
+    get_async_form_service,
+    get_async_submission_service,
+    public_submit_guard,
+)
+from hitech_forms.app.responses import (
+    JSON_MEDIA_TYPE,
+    canonical_json_response,
+    conditional_response,
+)
+from hitech_forms.contracts import AsyncFormServicePort, AsyncSubmissionServicePort
 
 
 class SubmitFormRequest(BaseModel):
@@ -18,16 +26,24 @@ def build_public_forms_router() -> APIRouter:
     router = APIRouter(prefix="/f")
 
     @router.get("/{slug}")
-    def public_get_form(slug: str, form_service: FormServicePort = Depends(get_form_service)):
-        return canonical_json_response(form_service.query_public_form(slug))
-
-    @router.post("/{slug}/submit")
-    def public_submit_form(
+    async def public_get_form(
+        request: Request, slug: str, form_service: AsyncFormServicePort = Depends(get_async_form_service)
+    ):
+        document = await form_service.query_public_form_document(slug)
+        return conditional_response(
+            request.headers.get("if-none-match"),
+            body=document.body,
+            etag=document.etag,
+            media_type=JSON_MEDIA_TYPE,
+        )
+
+    @router.post("/{slug}/submit", dependencies=[Depends(public_submit_guard)])
+    async def public_submit_form(
         slug: str,
         payload: SubmitFormRequest,
-        submission_service: SubmissionServicePort = Depends(get_submission_service),
+        submission_service: AsyncSubmissionServicePort = Depends(get_async_submission_service),
     ):
-        created: dict[str, Any] = submission_service.command_submit_public(slug=slug, values=payload.values)
+        created: dict[str, Any] = await submission_service.command_submit_public(slug=slug, values=payload.values)
         return canonical_json_response(created, status_code=201)
 
     return router
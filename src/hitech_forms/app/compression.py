@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import importlib
+import zlib
+from collections.abc import Callable
+from typing import Any, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from hitech_forms.platform.settings import get_settings
+
+COMPRESSIBLE_MEDIA_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/vnd.apache.arrow.stream",
+    "application/xml",
+    "application/javascript",
+)
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes, *, final: bool) -> bytes: ...
+
+
+class _GzipCompressor:
+    def __init__(self) -> None:
+        self._codec = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        # Sync-flush every streamed chunk so slow clients receive data as it
+        # is produced instead of when zlib's window fills.
+        return self._codec.compress(data) + self._codec.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class _BrotliCompressor:
+    def __init__(self, module: Any) -> None:
+        self._codec = module.Compressor(quality=5)
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        out: bytes = self._codec.process(data)
+        tail: bytes = self._codec.finish() if final else self._codec.flush()
+        return out + tail
+
+
+class _ZstdCompressor:
+    def __init__(self, module: Any) -> None:
+        self._module = module
+        self._codec = module.ZstdCompressor(level=3).compressobj()
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        mode = self._module.COMPRESSOBJ_FLUSH_FINISH if final else self._module.COMPRESSOBJ_FLUSH_BLOCK
+        return bytes(self._codec.compress(data)) + bytes(self._codec.flush(mode))
+
+
+def _optional_module(name: str) -> Any | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _available_codecs() -> dict[str, Callable[[], Compressor]]:
+    codecs: dict[str, Callable[[], Compressor]] = {"gzip": _GzipCompressor}
+    brotli = _optional_module("brotli")
+    if brotli is not None:
+        codecs["br"] = lambda: _BrotliCompressor(brotli)
+    zstandard = _optional_module("zstandard")
+    if zstandard is not None:
+        codecs["zstd"] = lambda: _ZstdCompressor(zstandard)
+    return codecs
+
+
+AVAILABLE_CODECS = _available_codecs()
+
+
+def negotiate_encoding(accept_encoding: str, preferred: tuple[str, ...]) -> str | None:
+    """Pick the first server-preferred encoding the client accepts with q > 0."""
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    wildcard = accepted.get("*", 0.0)
+    for encoding in preferred:
+        if encoding in AVAILABLE_CODECS and accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+class NegotiatedCompressionMiddleware:
+    """Compresses eligible responses with the best encoding both sides support.
+
+    Only ``200`` responses with a compressible media type and no existing
+    ``Content-Encoding`` are touched. Single-message bodies below
+    ``HFORMS_COMPRESSION_MIN_BYTES`` pass through unchanged; streamed bodies
+    are compressed chunk by chunk without buffering.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        settings = get_settings()
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), settings.compression_encodings
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(send, encoding=encoding, minimum_size=settings.compression_min_bytes)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    def __init__(self, send: Send, *, encoding: str, minimum_size: int) -> None:
+        self._send = send
+        self._encoding = encoding
+        self._minimum_size = minimum_size
+        self._start: Message | None = None
+        self._compressor: Compressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            media_type = headers.get("content-type", "")
+            self._passthrough = (
+                message["status"] != 200
+                or "content-encoding" in headers
+                or not media_type.startswith(COMPRESSIBLE_MEDIA_TYPES)
+            )
+            if self._passthrough:
+                await self._send(message)
+            else:
+                self._start = message
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            if self._start is not None:
+                # e.g. http.response.pathsend: the body bypasses us entirely.
+                start, self._start = self._start, None
+                await self._send(start)
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        if self._start is not None:
+            start, self._start = self._start, None
+            headers = MutableHeaders(raw=start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body and len(body) < self._minimum_size:
+                self._passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+            self._compressor = AVAILABLE_CODECS[self._encoding]()
+            headers["Content-Encoding"] = self._encoding
+            if "content-length" in headers:
+                del headers["content-length"]
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            await self._send(start)
+
+        compressor = self._compressor
+        if compressor is None:
+            await self._send(message)
+            return
+        compressed = compressor.compress(body, final=not more_body)
+        if compressed or not more_body:
+            await self._send({"type": "http.response.body", "body": compressed, "more_body": more_body})
@@ -1,18 +1,32 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+
 from fastapi import Depends, Header, Query, Request
 from sqlalchemy.orm import Session
 
-from hitech_forms.app.security.rate_limit import InMemoryRateLimiter
-from hitech_forms.contracts import ExportServicePort, FormServicePort, SubmissionServicePort
-from hitech_forms.db import get_session
+from hitech_forms.app.security.rate_limit import enforce_rate_limit, get_rate_limiter
+from hitech_forms.app.session_runners import get_session_runner
+from hitech_forms.contracts import (
+    AsyncFormServicePort,
+    AsyncSubmissionServicePort,
+    ExportServicePort,
+    FormServicePort,
+    SubmissionRepositoryPort,
+    SubmissionServicePort,
+)
+from hitech_forms.db import get_session, read_session_scope
 from hitech_forms.db.repositories import FormRepository, SubmissionRepository
+from hitech_forms.db.write_queue import get_submission_write_queue
 from hitech_forms.platform.errors import unauthorized
+from hitech_forms.platform.feature_flags import get_feature_flags
 from hitech_forms.platform.logging import get_logger, log_security_event
 from hitech_forms.platform.settings import get_settings
 from hitech_forms.services import ExportService, FormService, SubmissionService
+from hitech_forms.services.async_services import AsyncFormService, AsyncSubmissionService
+from hitech_forms.services.export_artifacts import get_export_artifact_store
 
-_rate_limiter = InMemoryRateLimiter()
 _logger = get_logger("hitech_forms.security")
 
 
@@ -41,7 +55,19 @@ async def admin_guard(
         raise unauthorized()
     scope = "admin"
     identity = request.client.host if request.client else "unknown"
-    _rate_limiter.check(key=identity, scope=scope, limit_per_minute=settings.rate_limit_per_minute)
+    await enforce_rate_limit(
+        get_rate_limiter(), key=identity, scope=scope, limit_per_minute=settings.rate_limit_per_minute
+    )
+
+
+async def public_submit_guard(request: Request) -> None:
+    identity = request.client.host if request.client else "unknown"
+    await enforce_rate_limit(
+        get_rate_limiter(),
+        key=identity,
+        scope="public_submit",
+        limit_per_minute=get_settings().public_submit_rate_limit_per_minute,
+    )
 
 
 def get_form_service(session: Session = Depends(get_session)) -> FormServicePort:
@@ -49,8 +75,42 @@ def get_form_service(session: Session = Depends(get_session)) -> FormServicePort
 
 
 def get_submission_service(session: Session = Depends(get_session)) -> SubmissionServicePort:
-    return SubmissionService(FormRepository(session), SubmissionRepository(session))
+    writer = get_submission_write_queue() if get_feature_flags().submit_write_queue else None
+    return SubmissionService(FormRepository(session), SubmissionRepository(session), writer=writer)
+
+
+# Public routes are async handlers: the dependencies below are async too, so that
+# resolving them never borrows a threadpool slot.
+async def get_async_form_service() -> AsyncFormServicePort:
+    return AsyncFormService(get_session_runner(), lambda session: FormService(FormRepository(session)))
+
+
+async def get_async_submission_service() -> AsyncSubmissionServicePort:
+    writer = get_submission_write_queue() if get_feature_flags().submit_write_queue else None
+    return AsyncSubmissionService(
+        get_session_runner(),
+        lambda session: SubmissionService(FormRepository(session), SubmissionRepository(session)),
+        writer=writer,
+    )
+
+
+@contextmanager
+def _export_shard_reader() -> Iterator[SubmissionRepositoryPort]:
+    with read_session_scope() as session:
+        yield SubmissionRepository(session)
+
+
+def build_export_service(session: Session) -> ExportService:
+    settings = get_settings()
+    return ExportService(
+        FormRepository(session),
+        SubmissionRepository(session),
+        shard_reader=_export_shard_reader,
+        shards=settings.export_shards,
+        shard_min_rows=settings.export_shard_min_rows,
+        artifacts=get_export_artifact_store(),
+    )
 
 
 def get_export_service(session: Session = Depends(get_session)) -> ExportServicePort:
-    return ExportService(FormRepository(session), SubmissionRepository(session))
+    return build_export_service(session)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+
+from hitech_forms.app.dependencies import build_export_service
+from hitech_forms.db import session_scope
+from hitech_forms.platform.logging import get_logger, log_event
+from hitech_forms.platform.settings import get_settings
+
+_logger = get_logger("hitech_forms.export_refresher")
+
+
+class ExportArtifactRefresher:
+    """Background thread that keeps every form's CSV snapshot up to date."""
+
+    def __init__(self, *, interval_seconds: int) -> None:
+        self._interval = interval_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="hforms-export-refresher", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def refresh_once(self) -> int:
+        with session_scope() as session:
+            return len(build_export_service(session).refresh_csv_artifacts())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                refreshed = self.refresh_once()
+            except Exception as exc:
+                log_event(_logger, "export_refresh_failed", error=type(exc).__name__)
+            else:
+                log_event(_logger, "export_refresh_completed", forms=refreshed)
+
+
+_REFRESHER: ExportArtifactRefresher | None = None
+
+
+def start_export_refresher() -> None:
+    global _REFRESHER
+    interval = get_settings().export_artifact_refresh_seconds
+    if interval > 0 and _REFRESHER is None:
+        _REFRESHER = ExportArtifactRefresher(interval_seconds=interval)
+        _REFRESHER.start()
+
+
+def shutdown_export_refresher() -> None:
+    global _REFRESHER
+    if _REFRESHER is not None:
+        _REFRESHER.stop()
+    _REFRESHER = None
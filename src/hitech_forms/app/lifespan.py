@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from contextlib import asynccontextmanager
 
+from hitech_forms.app.export_refresher import shutdown_export_refresher, start_export_refresher
+from hitech_forms.db import dispose_async_engine
+from hitech_forms.db.write_queue import shutdown_submission_write_queue
 from hitech_forms.platform.determinism import ensure_determinism_env
 from hitech_forms.platform.logging import configure_logging
 from hitech_forms.platform.settings import get_settings
@@ -12,4 +15,10 @@ async def lifespan(app):
     settings = get_settings()
     configure_logging(settings.log_level)
     ensure_determinism_env()
-    yield
+    start_export_refresher()
+    try:
+        yield
+    finally:
+        shutdown_export_refresher()
+        shutdown_submission_write_queue()
+        await dispose_async_engine()
@@ -4,12 +4,21 @@ from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 
 from hitech_forms.api.router import api_router
+from hitech_forms.api.routers import build_metrics_router
+from hitech_forms.app.compression import NegotiatedCompressionMiddleware
 from hitech_forms.app.lifespan import lifespan
+from hitech_forms.app.metrics import RequestMetricsMiddleware
+from hitech_forms.app.query_profiler import QueryProfilerMiddleware
 from hitech_forms.app.responses import canonical_json_response
 from hitech_forms.platform.errors import AppError
 from hitech_forms.web.router import web_router
 
 app = FastAPI(title="HITECH_FORMS", lifespan=lifespan)
+app.add_middleware(NegotiatedCompressionMiddleware)
+app.add_middleware(QueryProfilerMiddleware)
+# Added last so it wraps everything, including compression.
+app.add_middleware(RequestMetricsMiddleware)
+app.include_router(build_metrics_router())
 app.include_router(api_router)
 app.include_router(web_router)
 
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from hitech_forms.platform.feature_flags import get_feature_flags
+from hitech_forms.platform.metrics import HTTP_IN_FLIGHT, HTTP_REQUEST_SECONDS, HTTP_REQUESTS
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestMetricsMiddleware:
+    """Per-route request counts, latency and in-flight gauge.
+
+    Requests are labelled with the matched route template (``/api/f/{slug}``),
+    never the raw path, so label cardinality stays bounded. Latency runs until
+    the last body chunk is sent, which includes streamed exports.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not get_feature_flags().metrics:
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = int(message["status"])
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            # The router records the matched route in the shared scope dict.
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            method = str(scope["method"])
+            HTTP_REQUESTS.inc((method, route, str(status)))
+            HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, (method, route))
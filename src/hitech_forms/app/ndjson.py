@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+
+from anyio import from_thread
+
+MAX_NDJSON_LINE_BYTES = 1 << 20
+
+
+async def _next_chunk(chunks: AsyncIterator[bytes]) -> bytes | None:
+    return await anext(chunks, None)
+
+
+def iter_body_lines(
+    chunks: AsyncIterator[bytes], *, max_line_bytes: int = MAX_NDJSON_LINE_BYTES
+) -> Iterator[bytes]:
+    """Yield the ``\\n``-separated lines of a streamed request body.
+
+    Consume it inside ``run_in_threadpool``: each chunk is awaited on the event
+    loop through ``anyio.from_thread``, so only one chunk and one partial line
+    are held at a time. A line longer than ``max_line_bytes`` is yielded cut to
+    that length, which fails JSON parsing, and the rest of it is dropped.
+    """
+    partial = bytearray()
+    skipping = False
+    while (chunk := from_thread.run(_next_chunk, chunks)) is not None:
+        start = 0
+        while (end := chunk.find(b"\n", start)) >= 0:
+            if not skipping:
+                partial += chunk[start:end]
+                yield bytes(partial[:max_line_bytes])
+            partial.clear()
+            skipping = False
+            start = end + 1
+        if not skipping:
+            partial += chunk[start:]
+            if len(partial) > max_line_bytes:
+                yield bytes(partial[:max_line_bytes])
+                partial.clear()
+                skipping = True
+    if partial:
+        yield bytes(partial)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from hitech_forms.app.metrics import UNMATCHED_ROUTE
+from hitech_forms.db.query_profiler import profile_queries
+from hitech_forms.platform.feature_flags import get_feature_flags
+from hitech_forms.platform.logging import get_logger, log_performance_event
+from hitech_forms.platform.settings import get_settings
+
+_logger = get_logger("hitech_forms.db.profiler")
+
+
+class QueryProfilerMiddleware:
+    """Counts SQL statements per request when ``HFORMS_FLAG_QUERY_PROFILER`` is on
+    and logs a ``query_profile`` warning for requests over the thresholds."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not get_feature_flags().query_profiler:
+            await self.app(scope, receive, send)
+            return
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = int(message["status"])
+            await send(message)
+
+        with profile_queries() as profile:
+            await self.app(scope, receive, send_wrapper)
+        settings = get_settings()
+        findings = profile.findings(
+            max_queries=settings.query_profiler_max_queries,
+            repeat_threshold=settings.query_profiler_repeat_threshold,
+        )
+        if findings is not None:
+            log_performance_event(
+                _logger,
+                "query_profile",
+                method=scope["method"],
+                route=getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE,
+                status=status,
+                **findings,
+            )
@@ -6,10 +6,33 @@ from fastapi import Response
 
 from hitech_forms.platform.determinism import canonical_json_dumps
 
+JSON_MEDIA_TYPE = "application/json; charset=utf-8"
+HTML_MEDIA_TYPE = "text/html; charset=utf-8"
+
 
 def canonical_json_response(payload: Any, status_code: int = 200) -> Response:
     return Response(
         content=canonical_json_dumps(payload),
-        media_type="application/json; charset=utf-8",
+        media_type=JSON_MEDIA_TYPE,
         status_code=status_code,
     )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {item.strip() for item in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def variant_etag(etag: str, variant: str) -> str:
+    """Strong ETag for another representation of the resource behind ``etag``;
+    representations must not share a strong validator."""
+    return f'{etag[:-1]}-{variant}"'
+
+
+def conditional_response(if_none_match: str | None, *, body: bytes, etag: str, media_type: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
@@ -1,3 +1,21 @@
-from hitech_forms.app.security.rate_limit import InMemoryRateLimiter
+from hitech_forms.app.security.rate_limit import (
+    InMemoryRateLimiter,
+    RateLimiter,
+    SlidingWindow,
+    SqliteRateLimiter,
+    TokenBucket,
+    enforce_rate_limit,
+    get_rate_limiter,
+    reset_rate_limiter,
+)
 
-__all__ = ["InMemoryRateLimiter"]
+__all__ = [
+    "InMemoryRateLimiter",
+    "RateLimiter",
+    "SlidingWindow",
+    "SqliteRateLimiter",
+    "TokenBucket",
+    "enforce_rate_limit",
+    "get_rate_limiter",
+    "reset_rate_limiter",
+]
@@ -1,18 +1,230 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from datetime import datetime, timezone
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Protocol
+
+from starlette.concurrency import run_in_threadpool
 
 from hitech_forms.platform.errors import rate_limited
+from hitech_forms.platform.settings import Settings, get_settings
+
+WINDOW_SECONDS = 60.0
+# After two idle windows every algorithm's state equals a fresh key's, so
+# dropping it is lossless.
+STATE_TTL_SECONDS = 2 * WINDOW_SECONDS
+
+State = tuple[float, ...]
+Clock = Callable[[], float]
+
+
+class RateLimitAlgorithm(Protocol):
+    name: str
+
+    def step(self, state: State | None, now: float, limit: int) -> tuple[State, bool]: ...
+
+
+class SlidingWindow:
+    """Sliding-window counter: the previous fixed window's count, weighted by
+    how much of it still overlaps the trailing minute, plus the current one's."""
+
+    name = "sliding_window"
+
+    def step(self, state: State | None, now: float, limit: int) -> tuple[State, bool]:
+        window = (now // WINDOW_SECONDS) * WINDOW_SECONDS
+        if state is None:
+            start, current, previous = window, 0.0, 0.0
+        else:
+            start, current, previous = state
+            if window != start:
+                previous = current if window - start == WINDOW_SECONDS else 0.0
+                start, current = window, 0.0
+        overlap = 1.0 - (now - start) / WINDOW_SECONDS
+        allowed = previous * overlap + current < limit
+        if allowed:
+            current += 1
+        return (start, current, previous), allowed
+
+
+class TokenBucket:
+    """Bucket of ``limit`` tokens refilled continuously over one minute."""
+
+    name = "token_bucket"
+
+    def step(self, state: State | None, now: float, limit: int) -> tuple[State, bool]:
+        tokens, updated_at = (float(limit), now) if state is None else state
+        tokens = min(float(limit), tokens + max(0.0, now - updated_at) * limit / WINDOW_SECONDS)
+        allowed = tokens >= 1.0
+        if allowed:
+            tokens -= 1.0
+        return (tokens, now), allowed
+
+
+RATE_LIMIT_ALGORITHMS: dict[str, Callable[[], RateLimitAlgorithm]] = {
+    SlidingWindow.name: SlidingWindow,
+    TokenBucket.name: TokenBucket,
+}
+
+
+class RateLimiter(Protocol):
+    # True when check() does I/O and should run off the event loop.
+    blocking: bool
+
+    def check(self, *, key: str, scope: str, limit_per_minute: int) -> None: ...
 
 
 class InMemoryRateLimiter:
-    def __init__(self) -> None:
-        self._buckets: dict[tuple[str, str, int], int] = defaultdict(int)
+    """Per-process limiter. Keys are kept in last-use order, so stale keys
+    and any excess over ``max_keys`` are evicted from the front in O(1)
+    amortized per check."""
+
+    blocking = False
+
+    def __init__(
+        self,
+        algorithm: RateLimitAlgorithm | None = None,
+        *,
+        max_keys: int = 100_000,
+        clock: Clock = time.time,
+    ) -> None:
+        self._algorithm = algorithm or SlidingWindow()
+        self._max_keys = max_keys
+        self._clock = clock
+        self._states: OrderedDict[tuple[str, str], tuple[State, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._states)
 
     def check(self, *, key: str, scope: str, limit_per_minute: int) -> None:
-        minute_bucket = int(datetime.now(timezone.utc).timestamp()) // 60
-        bucket_key = (scope, key, minute_bucket)
-        self._buckets[bucket_key] += 1
-        if self._buckets[bucket_key] > limit_per_minute:
+        now = self._clock()
+        with self._lock:
+            entry = self._states.pop((scope, key), None)
+            state = entry[0] if entry is not None and now - entry[1] < STATE_TTL_SECONDS else None
+            new_state, allowed = self._algorithm.step(state, now, limit_per_minute)
+            self._states[(scope, key)] = (new_state, now)
+            while self._states:
+                _oldest_key, (_state, touched_at) = next(iter(self._states.items()))
+                if len(self._states) <= self._max_keys and now - touched_at < STATE_TTL_SECONDS:
+                    break
+                self._states.popitem(last=False)
+        if not allowed:
             raise rate_limited()
+
+
+class SqliteRateLimiter:
+    """Limiter state in a small SQLite file shared by every worker process.
+
+    Each check is one ``BEGIN IMMEDIATE`` read-modify-write of a single
+    primary-key row; stale rows are swept at most once per window per process.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        path: str,
+        algorithm: RateLimitAlgorithm | None = None,
+        *,
+        busy_timeout_ms: int = 5000,
+        clock: Clock = time.time,
+    ) -> None:
+        self._path = path
+        self._algorithm = algorithm or SlidingWindow()
+        self._busy_timeout = busy_timeout_ms / 1000
+        self._clock = clock
+        self._local = threading.local()
+        self._sweep_lock = threading.Lock()
+        self._next_sweep = 0.0
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if connection is None:
+            Path(self._path).resolve().parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._path, timeout=self._busy_timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_state ("
+                "scope TEXT NOT NULL, key TEXT NOT NULL, algorithm TEXT NOT NULL, "
+                "state TEXT NOT NULL, touched_at REAL NOT NULL, "
+                "PRIMARY KEY (scope, key)) WITHOUT ROWID"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_rate_limit_state_touched_at ON rate_limit_state (touched_at)"
+            )
+            self._local.connection = connection
+        return connection
+
+    def check(self, *, key: str, scope: str, limit_per_minute: int) -> None:
+        connection = self._connection()
+        now = self._clock()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT algorithm, state, touched_at FROM rate_limit_state WHERE scope = ? AND key = ?",
+                (scope, key),
+            ).fetchone()
+            state: State | None = None
+            if row is not None and row[0] == self._algorithm.name and now - row[2] < STATE_TTL_SECONDS:
+                state = tuple(json.loads(row[1]))
+            new_state, allowed = self._algorithm.step(state, now, limit_per_minute)
+            connection.execute(
+                "INSERT INTO rate_limit_state (scope, key, algorithm, state, touched_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (scope, key) DO UPDATE SET "
+                "algorithm = excluded.algorithm, state = excluded.state, touched_at = excluded.touched_at",
+                (scope, key, self._algorithm.name, json.dumps(list(new_state)), now),
+            )
+            if self._claim_sweep(now):
+                connection.execute(
+                    "DELETE FROM rate_limit_state WHERE touched_at < ?", (now - STATE_TTL_SECONDS,)
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        if not allowed:
+            raise rate_limited()
+
+    def _claim_sweep(self, now: float) -> bool:
+        with self._sweep_lock:
+            if now < self._next_sweep:
+                return False
+            self._next_sweep = now + WINDOW_SECONDS
+            return True
+
+
+async def enforce_rate_limit(limiter: RateLimiter, *, key: str, scope: str, limit_per_minute: int) -> None:
+    if limiter.blocking:
+        await run_in_threadpool(limiter.check, key=key, scope=scope, limit_per_minute=limit_per_minute)
+    else:
+        limiter.check(key=key, scope=scope, limit_per_minute=limit_per_minute)
+
+
+def build_rate_limiter(settings: Settings) -> RateLimiter:
+    algorithm = RATE_LIMIT_ALGORITHMS[settings.rate_limit_algorithm]()
+    if settings.rate_limit_backend == "sqlite":
+        return SqliteRateLimiter(
+            settings.rate_limit_db_path, algorithm, busy_timeout_ms=settings.sqlite_busy_timeout_ms
+        )
+    return InMemoryRateLimiter(algorithm, max_keys=settings.rate_limit_max_keys)
+
+
+_RATE_LIMITER: RateLimiter | None = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    global _RATE_LIMITER
+    if _RATE_LIMITER is None:
+        _RATE_LIMITER = build_rate_limiter(get_settings())
+    return _RATE_LIMITER
+
+
+def reset_rate_limiter() -> None:
+    global _RATE_LIMITER
+    _RATE_LIMITER = None
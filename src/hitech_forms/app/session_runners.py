@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TypeVar
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from hitech_forms.contracts import SessionRunnerPort
+from hitech_forms.db import async_session_scope, session_scope
+from hitech_forms.platform.settings import get_settings
+
+T = TypeVar("T")
+
+
+def _run_in_session(work: Callable[[Session], T]) -> T:
+    with session_scope() as session:
+        return work(session)
+
+
+class ThreadpoolSessionRunner:
+    """``HFORMS_DB_DRIVER=sync``: the unit of work takes a threadpool slot."""
+
+    async def run(self, work: Callable[[Session], T]) -> T:
+        return await run_in_threadpool(_run_in_session, work)
+
+
+class AsyncSessionRunner:
+    """``HFORMS_DB_DRIVER=async``: the unit of work runs on the event loop
+    through ``AsyncSession.run_sync``; only aiosqlite's connection thread
+    blocks on SQLite."""
+
+    async def run(self, work: Callable[[Session], T]) -> T:
+        async with async_session_scope() as session:
+            return await session.run_sync(work)
+
+
+def get_session_runner() -> SessionRunnerPort:
+    if get_settings().db_driver == "async":
+        return AsyncSessionRunner()
+    return ThreadpoolSessionRunner()
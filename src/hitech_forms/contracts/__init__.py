@@ -1,24 +1,38 @@
 from hitech_forms.contracts.dto import (
     ErrorDTO,
+    ExportArtifact,
+    ExportStream,
     FieldDTO,
+    FieldStatsDTO,
     FormDetailDTO,
+    FormStatsDTO,
     FormSummaryDTO,
+    PublicFormDocument,
     SubmissionDetailDTO,
+    SubmissionRatePoint,
+    SubmissionRateSeriesDTO,
+    SubmissionSearch,
     SubmissionSummaryDTO,
 )
 from hitech_forms.contracts.interfaces import (
+    AsyncFormServicePort,
+    AsyncSubmissionServicePort,
     ExportServicePort,
     FormRepositoryPort,
     FormServicePort,
+    SessionRunnerPort,
     SubmissionRepositoryPort,
     SubmissionServicePort,
+    SubmissionWriterPort,
 )
 from hitech_forms.contracts.invariants import (
     ANSWER_ORDER,
     EXPORT_VERSION_V1,
     FIELD_ORDER,
     FORM_LIST_ORDER,
+    RATE_GRANULARITIES,
     SUBMISSION_ORDER,
+    VALUE_STATS_FIELD_TYPES,
 )
 
 __all__ = [
@@ -26,16 +40,30 @@ __all__ = [
     "EXPORT_VERSION_V1",
     "FIELD_ORDER",
     "FORM_LIST_ORDER",
+    "RATE_GRANULARITIES",
     "SUBMISSION_ORDER",
+    "VALUE_STATS_FIELD_TYPES",
     "ErrorDTO",
+    "ExportArtifact",
+    "ExportStream",
     "FieldDTO",
+    "FieldStatsDTO",
     "FormDetailDTO",
+    "FormStatsDTO",
     "FormSummaryDTO",
+    "PublicFormDocument",
     "SubmissionDetailDTO",
+    "SubmissionRatePoint",
+    "SubmissionRateSeriesDTO",
+    "SubmissionSearch",
     "SubmissionSummaryDTO",
     "FormRepositoryPort",
     "SubmissionRepositoryPort",
     "FormServicePort",
     "SubmissionServicePort",
+    "SubmissionWriterPort",
     "ExportServicePort",
+    "SessionRunnerPort",
+    "AsyncFormServicePort",
+    "AsyncSubmissionServicePort",
 ]
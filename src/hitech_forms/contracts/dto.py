@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -56,8 +57,82 @@ class SubmissionDetailDTO:
     answers: dict[str, str]
 
 
+@dataclass(frozen=True)
+class PublicFormDocument:
+    form_id: int
+    slug: str
+    etag: str
+    detail: dict[str, Any]
+    body: bytes
+
+
+@dataclass(frozen=True)
+class SubmissionSearch:
+    """Answer filter for submission listings: full-text ``q``, optionally within
+    one ``field``, or an exact ``field`` = ``value`` lookup."""
+
+    q: str | None = None
+    field: str | None = None
+    value: str | None = None
+
+
+@dataclass(frozen=True)
+class FieldStatsDTO:
+    key: str
+    label: str
+    field_type: str
+    filled: int
+    fill_rate: float | None
+    aggregates: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class FormStatsDTO:
+    form_id: int
+    form_version_id: int
+    submission_count: int
+    fields: list[FieldStatsDTO]
+
+
+@dataclass(frozen=True)
+class SubmissionRatePoint:
+    bucket_start: int
+    count: int
+
+
+@dataclass(frozen=True)
+class SubmissionRateSeriesDTO:
+    form_id: int
+    granularity: str
+    bucket_seconds: int
+    start: int
+    end: int
+    total: int
+    points: list[SubmissionRatePoint]
+
+
 @dataclass(frozen=True)
 class ErrorDTO:
     code: str
     message: str
     details: dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class ExportStream:
+    filename: str
+    media_type: str
+    chunks: Iterator[bytes]
+    high_water_seq: int
+    high_water_id: int
+
+
+@dataclass(frozen=True)
+class ExportArtifact:
+    form_id: int
+    path: str
+    field_keys: tuple[str, ...]
+    rows: int
+    high_water_seq: int
+    high_water_id: int
+    size_bytes: int
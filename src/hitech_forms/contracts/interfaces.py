@@ -1,27 +1,48 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
-from typing import Any, Protocol
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future
+from typing import Any, Protocol, TypeVar
+
+from hitech_forms.contracts.dto import (
+    ExportArtifact,
+    ExportStream,
+    PublicFormDocument,
+    SubmissionSearch,
+    SubmissionSummaryDTO,
+)
+
+T = TypeVar("T")
 
 
 class FormRepositoryPort(Protocol):
+    def after_commit(self, callback: Callable[[], None]) -> None: ...
+
     def list_taken_slugs(self) -> set[str]: ...
 
-    def list_forms(self, *, offset: int, limit: int) -> tuple[list[Any], int]: ...
+    def list_forms(self, *, after: tuple[int, int] | None, offset: int, limit: int) -> list[Any]: ...
+
+    def count_forms(self) -> int: ...
 
     def create_form(self, *, title: str, slug: str, now_epoch: int) -> Any: ...
 
     def get_form(self, form_id: int) -> Any: ...
 
-    def get_form_by_slug(self, slug: str) -> Any: ...
+    def get_form_summary(self, form_id: int) -> Any: ...
+
+    def get_active_form(self, form_id: int, *, with_fields: bool = True) -> Any: ...
+
+    def get_active_form_by_slug(self, slug: str) -> Any: ...
+
+    def get_active_version_ref(self, form_id: int) -> Any: ...
+
+    def get_active_version_ref_by_slug(self, slug: str) -> Any: ...
 
     def update_form_metadata(self, *, form: Any, title: str, slug: str, now_epoch: int) -> Any: ...
 
     def delete_form(self, form: Any) -> None: ...
 
-    def publish_form(self, *, form: Any, now_epoch: int) -> Any: ...
-
-    def get_active_version(self, form: Any) -> Any: ...
+    def publish_form(self, *, form: Any, version: Any, now_epoch: int) -> Any: ...
 
     def replace_fields(
         self,
@@ -46,18 +67,98 @@ class SubmissionRepositoryPort(Protocol):
         now_epoch: int,
     ) -> Any: ...
 
-    def list_submissions(self, *, form_id: int, offset: int, limit: int) -> tuple[list[Any], int]: ...
+    def bulk_create_submissions(
+        self,
+        *,
+        form_id: int,
+        form_version_id: int,
+        answers: Sequence[dict[str, str]],
+        now_epoch: int,
+    ) -> range: ...
+
+    def commit(self) -> None: ...
+
+    def list_submissions(
+        self,
+        *,
+        form_id: int,
+        after: tuple[int, int] | None,
+        offset: int,
+        limit: int,
+        search: SubmissionSearch | None = None,
+    ) -> list[Any]: ...
+
+    def count_submissions(self, form_id: int) -> int: ...
+
+    def delete_submission(self, *, form_id: int, submission_id: int) -> None: ...
+
+    def repair_submission_counters(self) -> int: ...
+
+    def get_field_fill_counts(self, form_id: int) -> dict[str, int]: ...
+
+    def get_field_value_counts(self, form_id: int) -> dict[str, dict[str, int]]: ...
+
+    def rebuild_field_stats(self, form_id: int | None = None) -> int: ...
+
+    def get_rate_buckets(self, *, form_id: int, bucket_seconds: int, start: int, end: int) -> dict[int, int]: ...
 
     def get_submission(self, *, form_id: int, submission_id: int) -> Any: ...
 
-    def iter_submissions_for_export(self, form_id: int) -> Iterator[Any]: ...
+    def get_answer_map(self, submission: Any) -> dict[str, str]: ...
+
+    def export_high_water(self, form_id: int) -> tuple[int, int]: ...
+
+    def count_export_rows(
+        self, form_id: int, *, since_seq: int | None = None, max_seq: int | None = None
+    ) -> int: ...
+
+    def list_form_ids_with_submissions(self) -> list[int]: ...
+
+    def export_split_keys(self, *, form_id: int, parts: int) -> list[tuple[int, int]]: ...
+
+    def iter_export_rows(
+        self,
+        *,
+        form_id: int,
+        field_keys: Sequence[str],
+        batch_size: int,
+        after: tuple[int, int] | None = None,
+        until: tuple[int, int] | None = None,
+        since_seq: int | None = None,
+        since_id: int | None = None,
+        max_seq: int | None = None,
+    ) -> Iterator[tuple[int, int, str | None, str | None]]: ...
+
+
+class SubmissionWriterPort(Protocol):
+    def submit(
+        self,
+        *,
+        form_id: int,
+        form_version_id: int,
+        answers: dict[str, str],
+        now_epoch: int,
+    ) -> SubmissionSummaryDTO: ...
+
+    def enqueue(
+        self,
+        *,
+        form_id: int,
+        form_version_id: int,
+        answers: dict[str, str],
+        now_epoch: int,
+    ) -> Future[SubmissionSummaryDTO]: ...
 
 
 class FormServicePort(Protocol):
-    def query_list_forms(self, *, page: int, page_size: int) -> dict[str, Any]: ...
+    def query_list_forms(
+        self, *, page: int, page_size: int, cursor: str | None = None, include_total: bool = True
+    ) -> dict[str, Any]: ...
 
     def command_create_form(self, *, title: str, slug: str | None = None) -> dict[str, Any]: ...
 
+    def query_form_summary(self, form_id: int) -> dict[str, Any]: ...
+
     def query_form_detail(self, form_id: int) -> dict[str, Any]: ...
 
     def command_update_form(self, *, form_id: int, title: str, slug: str | None) -> dict[str, Any]: ...
@@ -70,14 +171,88 @@ class FormServicePort(Protocol):
 
     def query_public_form(self, slug: str) -> dict[str, Any]: ...
 
+    def query_public_form_document(self, slug: str) -> PublicFormDocument: ...
+
+    def render_public_form(
+        self, document: PublicFormDocument, variant: str, render: Callable[[], bytes]
+    ) -> bytes: ...
+
 
 class SubmissionServicePort(Protocol):
     def command_submit_public(self, *, slug: str, values: dict[str, str]) -> dict[str, Any]: ...
 
-    def query_list_submissions(self, *, form_id: int, page: int, page_size: int) -> dict[str, Any]: ...
+    def prepare_public_submission(self, *, slug: str, values: dict[str, str]) -> dict[str, Any]: ...
+
+    def command_bulk_submit(
+        self, *, form_id: int, lines: Iterable[bytes | str], chunk_size: int = 1000
+    ) -> dict[str, Any]: ...
+
+    def query_list_submissions(
+        self,
+        *,
+        form_id: int,
+        page: int,
+        page_size: int,
+        cursor: str | None = None,
+        include_total: bool = True,
+        q: str | None = None,
+        field: str | None = None,
+        value: str | None = None,
+    ) -> dict[str, Any]: ...
 
     def query_submission_detail(self, *, form_id: int, submission_id: int) -> dict[str, Any]: ...
 
+    def command_delete_submission(self, *, form_id: int, submission_id: int) -> None: ...
+
+    def query_form_stats(self, form_id: int) -> dict[str, Any]: ...
+
+    def query_submission_rates(
+        self,
+        *,
+        form_id: int,
+        granularity: str,
+        start: int | None = None,
+        end: int | None = None,
+    ) -> dict[str, Any]: ...
+
 
 class ExportServicePort(Protocol):
-    def stream_form_csv(self, *, form_id: int, export_version: str = "v1") -> Iterator[str]: ...
+    def stream_form_csv(self, *, form_id: int, export_version: str = "v1") -> Iterator[bytes]: ...
+
+    def stream_form_export(
+        self,
+        *,
+        form_id: int,
+        export_format: str,
+        export_version: str = "v1",
+        since_seq: int | None = None,
+        since_id: int | None = None,
+    ) -> ExportStream: ...
+
+    def get_csv_artifact(self, form_id: int) -> ExportArtifact | None: ...
+
+    def refresh_csv_artifact(self, *, form_id: int, rebuild: bool = False) -> ExportArtifact: ...
+
+    def refresh_csv_artifacts(self, *, rebuild: bool = False) -> list[ExportArtifact]: ...
+
+
+class SessionRunnerPort(Protocol):
+    """Runs a sync unit of work against a fresh, committed-on-success session."""
+
+    def run(self, work: Callable[[Any], T]) -> Awaitable[T]: ...
+
+
+class AsyncFormServicePort(Protocol):
+    async def query_public_form(self, slug: str) -> dict[str, Any]: ...
+
+    async def query_public_form_document(self, slug: str) -> PublicFormDocument: ...
+
+    def cached_public_form_rendering(self, document: PublicFormDocument, variant: str) -> bytes | None: ...
+
+    def render_public_form(
+        self, document: PublicFormDocument, variant: str, render: Callable[[], bytes]
+    ) -> bytes: ...
+
+
+class AsyncSubmissionServicePort(Protocol):
+    async def command_submit_public(self, *, slug: str, values: dict[str, str]) -> dict[str, Any]: ...
@@ -5,4 +5,11 @@ FIELD_ORDER: tuple[str, str] = ("position", "id")
 SUBMISSION_ORDER: tuple[str, str] = ("created_at", "id")
 ANSWER_ORDER: tuple[str] = ("field_key",)
 
+# Field types whose answer values are counted per distinct value for form stats;
+# free-text types only contribute to fill counts.
+VALUE_STATS_FIELD_TYPES: frozenset[str] = frozenset({"checkbox", "date", "number", "select"})
+
+# Submission rate rollup granularities, in seconds per bucket.
+RATE_GRANULARITIES: dict[str, int] = {"minute": 60, "hour": 3600, "day": 86400}
+
 EXPORT_VERSION_V1 = "v1"
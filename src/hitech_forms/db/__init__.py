@@ -1,6 +1,33 @@
 from __future__ import annotations
 
-from .engine import get_engine, reset_engine_cache
-from .session import SessionLocal, get_session, session_scope
+from .engine import (
+    dispose_async_engine,
+    get_async_engine,
+    get_engine,
+    get_read_engine,
+    reset_engine_cache,
+)
+from .session import (
+    AsyncSessionLocal,
+    ReadSessionLocal,
+    SessionLocal,
+    async_session_scope,
+    get_session,
+    read_session_scope,
+    session_scope,
+)
 
-__all__ = ["get_engine", "session_scope", "get_session", "SessionLocal", "reset_engine_cache"]
+__all__ = [
+    "get_engine",
+    "get_read_engine",
+    "get_async_engine",
+    "dispose_async_engine",
+    "session_scope",
+    "read_session_scope",
+    "async_session_scope",
+    "get_session",
+    "SessionLocal",
+    "ReadSessionLocal",
+    "AsyncSessionLocal",
+    "reset_engine_cache",
+]
@@ -1,36 +1,166 @@
 from __future__ import annotations
 
+import time
+from functools import partial
 from typing import Any
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
-from hitech_forms.platform.settings import get_settings
+from hitech_forms.db.query_profiler import record_statement
+from hitech_forms.platform.feature_flags import get_feature_flags
+from hitech_forms.platform.metrics import DB_QUERIES, DB_QUERY_SECONDS, statement_verb
+from hitech_forms.platform.settings import Settings, get_settings
 
 _ENGINE: Engine | None = None
+_READ_ENGINE: Engine | None = None
+_ASYNC_ENGINE: AsyncEngine | None = None
+
+
+def sqlite_pragmas(settings: Settings) -> list[tuple[str, str]]:
+    """Per-connection PRAGMAs for the configured profile, in execution order.
+
+    ``wal`` lets readers run alongside the single writer and waits on the busy
+    handler instead of failing fast with "database is locked"; ``legacy`` keeps
+    SQLite's rollback journal and library defaults.
+    """
+    pragmas = [("foreign_keys", "ON")]
+    if settings.sqlite_profile == "legacy":
+        return pragmas
+    pragmas.extend(
+        [
+            ("journal_mode", "WAL"),
+            ("synchronous", "NORMAL"),
+            ("busy_timeout", str(settings.sqlite_busy_timeout_ms)),
+            ("cache_size", str(-settings.sqlite_cache_size_kib)),
+            ("mmap_size", str(settings.sqlite_mmap_size_bytes)),
+            ("temp_store", "MEMORY"),
+        ]
+    )
+    return pragmas
+
+
+def _build_engine(settings: Settings, pragmas: list[tuple[str, str]]) -> Engine:
+    url = f"sqlite:///{settings.db_path}"
+    engine = create_engine(
+        url,
+        future=True,
+        echo=False,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        connect_args={"check_same_thread": False, "timeout": settings.sqlite_busy_timeout_ms / 1000},
+    )
+    if url.startswith("sqlite"):
+        event.listen(engine, "connect", partial(_apply_sqlite_pragmas, pragmas))
+    _instrument_engine(engine)
+    return engine
 
 
 def get_engine() -> Engine:
     global _ENGINE
     if _ENGINE is None:
         s = get_settings()
-        url = f"sqlite:///{s.db_path}"
-        _ENGINE = create_engine(
-            url, future=True, echo=False, connect_args={"check_same_thread": False}
-        )
-        if url.startswith("sqlite"):
-            event.listen(_ENGINE, "connect", _enable_sqlite_fk)
+        _ENGINE = _build_engine(s, sqlite_pragmas(s))
     return _ENGINE
 
 
-def _enable_sqlite_fk(dbapi_connection: Any, _connection_record: Any) -> None:
+def get_read_engine() -> Engine:
+    """Engine whose connections refuse writes (``PRAGMA query_only``).
+
+    Used by bulk readers such as sharded exports so they never contend with
+    the request pool.
+    """
+    global _READ_ENGINE
+    if _READ_ENGINE is None:
+        s = get_settings()
+        _READ_ENGINE = _build_engine(s, [*sqlite_pragmas(s), ("query_only", "ON")])
+    return _READ_ENGINE
+
+
+def get_async_engine() -> AsyncEngine:
+    """``aiosqlite`` engine for ``HFORMS_DB_DRIVER=async``, same PRAGMAs and pool
+    limits as the sync engine."""
+    global _ASYNC_ENGINE
+    if _ASYNC_ENGINE is None:
+        s = get_settings()
+        _ASYNC_ENGINE = create_async_engine(
+            f"sqlite+aiosqlite:///{s.db_path}",
+            echo=False,
+            pool_size=s.db_pool_size,
+            max_overflow=s.db_max_overflow,
+            connect_args={"timeout": s.sqlite_busy_timeout_ms / 1000},
+        )
+        event.listen(_ASYNC_ENGINE.sync_engine, "connect", partial(_apply_sqlite_pragmas, sqlite_pragmas(s)))
+        _instrument_engine(_ASYNC_ENGINE.sync_engine)
+    return _ASYNC_ENGINE
+
+
+async def dispose_async_engine() -> None:
+    global _ASYNC_ENGINE
+    engine, _ASYNC_ENGINE = _ASYNC_ENGINE, None
+    if engine is not None:
+        await engine.dispose()
+
+
+def _apply_sqlite_pragmas(
+    pragmas: list[tuple[str, str]], dbapi_connection: Any, _connection_record: Any
+) -> None:
     cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
+    for name, value in pragmas:
+        cursor.execute(f"PRAGMA {name}={value}")
     cursor.close()
 
 
+def _instrument_engine(engine: Engine) -> None:
+    """Feed statements into the ``hforms_db_*`` metrics and the query profiler.
+
+    Listeners are only attached for the flags that are on, so with both off
+    statements pay nothing.
+    """
+    flags = get_feature_flags()
+    if not (flags.metrics or flags.query_profiler):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", partial(_after_cursor_execute, flags.metrics, flags.query_profiler))
+
+
+def _before_cursor_execute(
+    _conn: Any, _cursor: Any, _statement: str, _parameters: Any, context: Any, _executemany: bool
+) -> None:
+    context._hforms_started = time.perf_counter()
+
+
+def _after_cursor_execute(
+    metrics: bool,
+    profile: bool,
+    conn: Any,
+    _cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    started = getattr(context, "_hforms_started", None)
+    if started is None:
+        return
+    seconds = time.perf_counter() - started
+    if metrics:
+        labels = (statement_verb(statement),)
+        DB_QUERIES.inc(labels)
+        DB_QUERY_SECONDS.observe(seconds, labels)
+    if profile:
+        record_statement(conn, statement, parameters, executemany=executemany, seconds=seconds)
+
+
 def reset_engine_cache() -> None:
-    global _ENGINE
-    if _ENGINE is not None:
-        _ENGINE.dispose()
+    global _ENGINE, _READ_ENGINE, _ASYNC_ENGINE
+    for engine in (_ENGINE, _READ_ENGINE):
+        if engine is not None:
+            engine.dispose()
+    if _ASYNC_ENGINE is not None:
+        # Closing aiosqlite connections needs their event loop; just drop the pool.
+        _ASYNC_ENGINE.sync_engine.dispose(close=False)
     _ENGINE = None
+    _READ_ENGINE = None
+    _ASYNC_ENGINE = None
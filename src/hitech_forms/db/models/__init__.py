@@ -3,8 +3,26 @@ from __future__ import annotations
 from .answer import Answer
 from .base import Base
 from .field import Field
+from .field_fill_count import FieldFillCount
+from .field_value_count import FieldValueCount
 from .form import Form
 from .form_version import FormVersion
 from .submission import Submission
+from .submission_counter import SubmissionCounter
+from .submission_rate_bucket import SubmissionRateBucket
+from .submission_search import SEARCH_ROWID_STRIDE, submission_search
 
-__all__ = ["Base", "Form", "FormVersion", "Field", "Submission", "Answer"]
+__all__ = [
+    "Base",
+    "Form",
+    "FormVersion",
+    "Field",
+    "FieldFillCount",
+    "FieldValueCount",
+    "Submission",
+    "SubmissionCounter",
+    "SubmissionRateBucket",
+    "Answer",
+    "SEARCH_ROWID_STRIDE",
+    "submission_search",
+]
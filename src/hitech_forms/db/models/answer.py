@@ -11,6 +11,7 @@ class Answer(Base):
     __table_args__ = (
         Index("ix_answers_submission_id", "submission_id"),
         Index("ix_answers_field_key", "field_key"),
+        Index("ix_answers_field_value", "field_key", "value_text"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from hitech_forms.db.models.base import Base
+
+
+class FieldFillCount(Base):
+    __tablename__ = "field_fill_counts"
+
+    form_id: Mapped[int] = mapped_column(
+        ForeignKey("forms.id", ondelete="CASCADE"), primary_key=True
+    )
+    field_key: Mapped[str] = mapped_column(String(120), primary_key=True)
+    filled_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Index, Integer, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Integer, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from hitech_forms.db.models.base import Base
@@ -12,7 +12,10 @@ class Submission(Base):
         UniqueConstraint("form_id", "submission_seq", name="uq_submissions_form_seq"),
         Index("ix_submissions_form_id", "form_id"),
         Index("ix_submissions_form_seq", "form_id", "submission_seq"),
+        Index("ix_submissions_form_order", "form_id", "created_at", "id"),
         Index("ix_submissions_created_at", "created_at"),
+        # Ids are never reused after a delete, so since_id stays exclusive.
+        {"sqlite_autoincrement": True},
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -22,5 +25,7 @@ class Submission(Base):
     )
     submission_seq: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     created_at: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Canonical JSON of the answers when stored packed; NULL means `answers` rows.
+    answers_packed: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     answers = relationship("Answer", back_populates="submission", cascade="all, delete-orphan")
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from hitech_forms.db.models.base import Base
+
+
+class SubmissionCounter(Base):
+    __tablename__ = "submission_counters"
+
+    form_id: Mapped[int] = mapped_column(
+        ForeignKey("forms.id", ondelete="CASCADE"), primary_key=True
+    )
+    last_seq: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    submission_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
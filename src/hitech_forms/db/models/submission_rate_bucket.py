@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from hitech_forms.db.models.base import Base
+
+
+class SubmissionRateBucket(Base):
+    __tablename__ = "submission_rate_buckets"
+
+    form_id: Mapped[int] = mapped_column(
+        ForeignKey("forms.id", ondelete="CASCADE"), primary_key=True
+    )
+    bucket_seconds: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Epoch of the bucket's first second, a multiple of bucket_seconds (UTC).
+    bucket_start: Mapped[int] = mapped_column(Integer, primary_key=True)
+    submission_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from sqlalchemy import Integer, Text, column, table
+
+# FTS5 virtual table created by migration 0007; it is deliberately not part of
+# Base.metadata because SQLAlchemy cannot emit CREATE VIRTUAL TABLE.
+# One row per non-empty answer, rowid = submission_id * SEARCH_ROWID_STRIDE +
+# ordinal of the field key, so a submission's rows form one contiguous rowid
+# range (used by the delete trigger).
+SEARCH_ROWID_STRIDE = 1 << 16
+
+submission_search = table(
+    "submission_search",
+    column("rowid", Integer),
+    column("form_id", Integer),
+    column("submission_id", Integer),
+    column("field_key", Text),
+    column("value_text", Text),
+)
@@ -0,0 +1,124 @@
+"""Per-request SQL profiling behind ``HFORMS_FLAG_QUERY_PROFILER``.
+
+The engine listeners in ``db/engine.py`` report every statement here. Inside
+``profile_queries`` the statement is attributed to the current request's
+``QueryProfile``. The profile lives in a context variable, so it follows the
+request into threadpool workers and ``AsyncSession.run_sync`` greenlets.
+Statements at or over ``HFORMS_QUERY_PROFILER_SLOW_MS`` also capture
+``EXPLAIN QUERY PLAN`` on the same connection.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from hitech_forms.platform.logging import get_logger, log_performance_event
+from hitech_forms.platform.metrics import statement_verb
+from hitech_forms.platform.settings import get_settings
+
+MAX_REPORTED_SHAPES = 5
+MAX_REPORTED_SLOW = 10
+_SHAPE_CHARS = 400
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_EXPLAINABLE_VERBS = frozenset({"SELECT", "WITH", "INSERT", "UPDATE", "DELETE"})
+_logger = get_logger("hitech_forms.db.profiler")
+
+
+def statement_shape(statement: str) -> str:
+    """Statement text with whitespace collapsed and ``IN (?, ?, ...)`` lists
+    folded, so the same query with different parameters has one shape."""
+    return _IN_LIST.sub("(?...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+@dataclass
+class QueryProfile:
+    count: int = 0
+    total_seconds: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+    slow_count: int = 0
+    slow: list[dict[str, Any]] = field(default_factory=list)
+
+    def findings(self, *, max_queries: int, repeat_threshold: int) -> dict[str, Any] | None:
+        """Structured report when the request issued too many statements,
+        repeated one shape (the N+1 pattern) or ran slow ones; else None."""
+        repeated = [
+            {"shape": shape[:_SHAPE_CHARS], "count": count}
+            for shape, count in self.shapes.most_common(MAX_REPORTED_SHAPES)
+            if count >= repeat_threshold
+        ]
+        if self.count <= max_queries and not repeated and not self.slow_count:
+            return None
+        return {
+            "query_count": self.count,
+            "query_ms": round(self.total_seconds * 1000, 3),
+            "too_many_queries": self.count > max_queries,
+            "repeated": repeated,
+            "slow_count": self.slow_count,
+            "slow": self.slow,
+        }
+
+
+_CURRENT: ContextVar[QueryProfile | None] = ContextVar("hforms_query_profile", default=None)
+
+
+@contextmanager
+def profile_queries() -> Iterator[QueryProfile]:
+    profile = QueryProfile()
+    token = _CURRENT.set(profile)
+    try:
+        yield profile
+    finally:
+        _CURRENT.reset(token)
+
+
+def record_statement(
+    connection: Any, statement: str, parameters: Any, *, executemany: bool, seconds: float
+) -> None:
+    """Attribute one executed statement to the current profile, if any."""
+    profile = _CURRENT.get()
+    slow = seconds * 1000 >= get_settings().query_profiler_slow_ms
+    if profile is None and not slow:
+        return
+    shape = statement_shape(statement)
+    if profile is not None:
+        profile.count += 1
+        profile.total_seconds += seconds
+        profile.shapes[shape] += 1
+    if not slow:
+        return
+    if profile is not None:
+        profile.slow_count += 1
+        if len(profile.slow) >= MAX_REPORTED_SLOW:
+            return
+    entry = {
+        "shape": shape[:_SHAPE_CHARS],
+        "ms": round(seconds * 1000, 3),
+        "plan": [] if executemany else explain_query_plan(connection, statement, parameters),
+    }
+    if profile is not None:
+        profile.slow.append(entry)
+    else:
+        # Outside a request (CLI, write queue thread) there is no summary to join.
+        log_performance_event(_logger, "slow_query", **entry)
+
+
+def explain_query_plan(connection: Any, statement: str, parameters: Any) -> list[str]:
+    """``EXPLAIN QUERY PLAN`` detail lines, or [] when the statement has no plan."""
+    if statement_verb(statement) not in _EXPLAINABLE_VERBS:
+        return []
+    try:
+        cursor = connection.connection.cursor()
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+            return [str(row[-1]) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+    except Exception:
+        return []
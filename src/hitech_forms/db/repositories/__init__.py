@@ -1,4 +1,8 @@
-from hitech_forms.db.repositories.form_repository import FormRepository
+from hitech_forms.db.repositories.form_repository import (
+    ActiveForm,
+    ActiveVersionRef,
+    FormRepository,
+)
 from hitech_forms.db.repositories.submission_repository import SubmissionRepository
 
-__all__ = ["FormRepository", "SubmissionRepository"]
+__all__ = ["ActiveForm", "ActiveVersionRef", "FormRepository", "SubmissionRepository"]
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import json
-from typing import Any, cast
+from collections.abc import Callable
+from typing import Any, NamedTuple
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import ColumnElement, Select, delete, event, func, literal, select, tuple_
 from sqlalchemy.orm import Session, joinedload
 
 from hitech_forms.contracts import FIELD_ORDER, FORM_LIST_ORDER
@@ -11,26 +12,46 @@ from hitech_forms.db.models import Field, Form, FormVersion
 from hitech_forms.platform.errors import not_found
 
 
+class ActiveVersionRef(NamedTuple):
+    form_id: int
+    form_status: str
+    form_version_id: int | None
+    version_status: str | None
+    published_at: int | None
+
+
+class ActiveForm(NamedTuple):
+    """A form with only its active version and that version's fields, in
+    ``FIELD_ORDER``; the admin paths never need the other versions."""
+
+    form: Form
+    version: FormVersion
+    fields: list[Field]
+
+
 class FormRepository:
     def __init__(self, session: Session):
         self._session = session
 
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        event.listen(self._session, "after_commit", lambda _session: callback(), once=True)
+
     def list_taken_slugs(self) -> set[str]:
         rows = self._session.execute(select(Form.slug)).scalars().all()
         return set(rows)
 
-    def list_forms(self, *, offset: int, limit: int) -> tuple[list[Form], int]:
-        total = self._session.execute(select(func.count(Form.id))).scalar_one()
-        stmt = (
-            select(Form)
-            .order_by(getattr(Form, FORM_LIST_ORDER[0]).asc(), getattr(Form, FORM_LIST_ORDER[1]).asc())
-            .offset(offset)
-            .limit(limit)
-        )
-        forms = list(self._session.execute(stmt).scalars().all())
-        return forms, int(total)
+    def list_forms(self, *, after: tuple[int, int] | None, offset: int, limit: int) -> list[Form]:
+        order_columns = (getattr(Form, FORM_LIST_ORDER[0]), getattr(Form, FORM_LIST_ORDER[1]))
+        stmt = select(Form)
+        if after is not None:
+            stmt = stmt.where(tuple_(*order_columns) > tuple_(*(literal(value) for value in after)))
+        stmt = stmt.order_by(order_columns[0].asc(), order_columns[1].asc()).offset(offset).limit(limit)
+        return list(self._session.execute(stmt).scalars().all())
 
-    def create_form(self, *, title: str, slug: str, now_epoch: int) -> Form:
+    def count_forms(self) -> int:
+        return int(self._session.execute(select(func.count(Form.id))).scalar_one())
+
+    def create_form(self, *, title: str, slug: str, now_epoch: int) -> ActiveForm:
         form = Form(title=title, slug=slug, status="draft", created_at=now_epoch, updated_at=now_epoch)
         self._session.add(form)
         self._session.flush()
@@ -45,7 +66,7 @@ class FormRepository:
         self._session.flush()
         form.active_version_id = version.id
         self._session.flush()
-        return form
+        return ActiveForm(form, version, [])
 
     def get_form(self, form_id: int) -> Form:
         self._session.expire_all()
@@ -59,18 +80,60 @@ class FormRepository:
             raise not_found("form not found")
         return form
 
-    def get_form_by_slug(self, slug: str) -> Form:
-        self._session.expire_all()
-        stmt: Select[tuple[Form]] = (
-            select(Form)
-            .where(Form.slug == slug)
-            .options(joinedload(Form.versions).joinedload(FormVersion.fields))
-        )
-        form = self._session.execute(stmt).unique().scalars().first()
+    def get_form_summary(self, form_id: int) -> Form:
+        stmt = select(Form).where(Form.id == form_id).execution_options(populate_existing=True)
+        form = self._session.execute(stmt).scalars().first()
         if form is None:
             raise not_found("form not found")
         return form
 
+    def get_active_form(self, form_id: int, *, with_fields: bool = True) -> ActiveForm:
+        return self._active_form(Form.id == form_id, with_fields=with_fields)
+
+    def get_active_form_by_slug(self, slug: str) -> ActiveForm:
+        return self._active_form(Form.slug == slug, with_fields=True)
+
+    def _active_form(self, condition: ColumnElement[bool], *, with_fields: bool) -> ActiveForm:
+        # One round trip: the form, its active version and (optionally) the
+        # version's fields as joined rows. populate_existing stands in for the
+        # expire_all() in get_form without discarding unrelated session state.
+        columns: tuple[Any, ...] = (Form, FormVersion, Field) if with_fields else (Form, FormVersion)
+        stmt = (
+            select(*columns)
+            .outerjoin(FormVersion, FormVersion.id == Form.active_version_id)
+            .where(condition)
+            .execution_options(populate_existing=True)
+        )
+        if with_fields:
+            stmt = stmt.outerjoin(Field, Field.form_version_id == FormVersion.id).order_by(
+                getattr(Field, FIELD_ORDER[0]).asc(), getattr(Field, FIELD_ORDER[1]).asc()
+            )
+        rows = self._session.execute(stmt).all()
+        if not rows:
+            raise not_found("form not found")
+        form, version = rows[0][0], rows[0][1]
+        if version is None:
+            raise not_found("active form version not found")
+        fields = [row[2] for row in rows if row[2] is not None] if with_fields else []
+        return ActiveForm(form, version, fields)
+
+    def get_active_version_ref(self, form_id: int) -> ActiveVersionRef:
+        return self._active_version_ref(Form.id == form_id)
+
+    def get_active_version_ref_by_slug(self, slug: str) -> ActiveVersionRef:
+        return self._active_version_ref(Form.slug == slug)
+
+    def _active_version_ref(self, condition: ColumnElement[bool]) -> ActiveVersionRef:
+        stmt = (
+            select(Form.id, Form.status, FormVersion.id, FormVersion.status, FormVersion.published_at)
+            .outerjoin(FormVersion, FormVersion.id == Form.active_version_id)
+            .where(condition)
+        )
+        row = self._session.execute(stmt).first()
+        if row is None:
+            raise not_found("form not found")
+        return ActiveVersionRef(*row)
+
     def update_form_metadata(self, *, form: Form, title: str, slug: str, now_epoch: int) -> Form:
         form.title = title
         form.slug = slug
@@ -82,28 +145,14 @@ class FormRepository:
         self._session.delete(form)
         self._session.flush()
 
-    def publish_form(self, *, form: Form, now_epoch: int) -> Form:
-        active = self.get_active_version(form)
+    def publish_form(self, *, form: Form, version: FormVersion, now_epoch: int) -> Form:
         form.status = "published"
         form.updated_at = now_epoch
-        active.status = "published"
-        active.published_at = now_epoch
+        version.status = "published"
+        version.published_at = now_epoch
         self._session.flush()
         return form
 
-    def get_active_version(self, form: Form) -> FormVersion:
-        if form.active_version_id is None:
-            raise not_found("active form version not found")
-        for version in form.versions:
-            typed_version = cast(FormVersion, version)
-            if typed_version.id == form.active_version_id:
-                return typed_version
-        stmt = select(FormVersion).where(FormVersion.id == form.active_version_id)
-        version = self._session.execute(stmt).scalars().first()
-        if version is None:
-            raise not_found("active form version not found")
-        return version
-
     def replace_fields(
         self,
         *,
@@ -111,12 +160,9 @@ class FormRepository:
         field_inputs: list[dict[str, Any]],
         now_epoch: int,
     ) -> list[Field]:
-        old_fields = self._session.execute(
-            select(Field).where(Field.form_version_id == form_version_id)
-        ).scalars()
-        for existing in old_fields:
-            self._session.delete(existing)
-        self._session.flush()
+        # A single DELETE instead of loading every old field to delete it row by
+        # row; matching objects already in the session are synchronized.
+        self._session.execute(delete(Field).where(Field.form_version_id == form_version_id))
 
         inserted: list[Field] = []
         for payload in field_inputs:
@@ -1,18 +1,75 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+import json
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
 
-from sqlalchemy import func, insert, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import (
+    Select,
+    Subquery,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    true,
+    tuple_,
+    union,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
 
-from hitech_forms.contracts import SUBMISSION_ORDER
-from hitech_forms.db.models import Answer, Submission
-from hitech_forms.platform.errors import not_found
+from hitech_forms.contracts import (
+    RATE_GRANULARITIES,
+    SUBMISSION_ORDER,
+    VALUE_STATS_FIELD_TYPES,
+    SubmissionSearch,
+)
+from hitech_forms.db.models import (
+    SEARCH_ROWID_STRIDE,
+    Answer,
+    Field,
+    FieldFillCount,
+    FieldValueCount,
+    Form,
+    Submission,
+    SubmissionCounter,
+    SubmissionRateBucket,
+    submission_search,
+)
+from hitech_forms.platform.determinism import canonical_json_dumps
+from hitech_forms.platform.errors import bad_request, not_found
+from hitech_forms.platform.settings import get_settings
+
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def fts_match_expression(query: str, *, field: str | None = None) -> str:
+    """FTS5 MATCH string for user input: every whitespace-separated term must
+    match (``term*`` keeps its prefix star); FTS operators are never parsed."""
+    terms = []
+    for raw in query.split():
+        prefix = raw.endswith("*") and len(raw) > 1
+        body = raw[:-1] if prefix else raw
+        terms.append(_fts_phrase(body) + ("*" if prefix else ""))
+    if not terms:
+        raise bad_request("search query is empty")
+    expression = "value_text : (" + " AND ".join(terms) + ")"
+    if field is not None:
+        expression = f"field_key : {_fts_phrase(field)} AND {expression}"
+    return expression
 
 
 class SubmissionRepository:
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, *, answer_storage: str | None = None):
         self._session = session
+        self._packed = (answer_storage or get_settings().answer_storage) == "packed"
+        self._value_stat_keys: dict[int, frozenset[str]] = {}
 
     def create_submission(
         self,
@@ -22,25 +79,24 @@ class SubmissionRepository:
         answers: dict[str, str],
         now_epoch: int,
     ) -> Submission:
-        next_submission_seq = (
-            select(func.coalesce(func.max(Submission.submission_seq), 0) + 1)
-            .where(Submission.form_id == form_id)
-            .scalar_subquery()
-        )
+        submission_seq = self._allocate_seqs(form_id=form_id, count=1)
         insert_stmt = (
             insert(Submission)
             .values(
                 form_id=form_id,
                 form_version_id=form_version_id,
-                submission_seq=next_submission_seq,
+                submission_seq=submission_seq,
                 created_at=now_epoch,
+                answers_packed=canonical_json_dumps(answers) if self._packed else None,
             )
-            .returning(Submission.id)
+            .returning(Submission)
         )
-        submission_id = int(self._session.execute(insert_stmt).scalar_one())
-        submission = self._session.get(Submission, submission_id)
-        if submission is None:
-            raise not_found("submission not found")
+        submission = self._session.scalars(insert_stmt).one()
+        self._index_answers(form_id=form_id, entries=[(submission.id, answers)])
+        self._record_field_stats(form_id=form_id, form_version_id=form_version_id, answer_maps=[answers], delta=1)
+        self._record_rate(form_id=form_id, created_at=now_epoch, count=1)
+        if self._packed:
+            return submission
 
         answer_rows = [
             Answer(
@@ -55,42 +111,605 @@ class SubmissionRepository:
         self._session.flush()
         return submission
 
-    def list_submissions(self, *, form_id: int, offset: int, limit: int) -> tuple[list[Submission], int]:
-        total = self._session.execute(
-            select(func.count(Submission.id)).where(Submission.form_id == form_id)
-        ).scalar_one()
+    def bulk_create_submissions(
+        self,
+        *,
+        form_id: int,
+        form_version_id: int,
+        answers: Sequence[dict[str, str]],
+        now_epoch: int,
+    ) -> range:
+        count = len(answers)
+        if count == 0:
+            return range(0)
+        last_seq = self._allocate_seqs(form_id=form_id, count=count)
+        first_seq = last_seq - count + 1
+        submission_ids = self._session.scalars(
+            insert(Submission).returning(Submission.id, sort_by_parameter_order=True),
+            [
+                {
+                    "form_id": form_id,
+                    "form_version_id": form_version_id,
+                    "submission_seq": first_seq + offset,
+                    "created_at": now_epoch,
+                    "answers_packed": canonical_json_dumps(row) if self._packed else None,
+                }
+                for offset, row in enumerate(answers)
+            ],
+        ).all()
+        self._index_answers(form_id=form_id, entries=zip(submission_ids, answers, strict=True))
+        self._record_field_stats(form_id=form_id, form_version_id=form_version_id, answer_maps=answers, delta=1)
+        self._record_rate(form_id=form_id, created_at=now_epoch, count=count)
+        if self._packed:
+            return range(first_seq, last_seq + 1)
+        answer_rows = [
+            {
+                "submission_id": submission_id,
+                "field_key": field_key,
+                "value_text": value,
+                "created_at": now_epoch,
+            }
+            for submission_id, row in zip(submission_ids, answers, strict=True)
+            for field_key, value in sorted(row.items(), key=lambda item: item[0])
+        ]
+        if answer_rows:
+            self._session.execute(insert(Answer), answer_rows)
+        return range(first_seq, last_seq + 1)
+
+    def load_submissions(
+        self,
+        *,
+        form_id: int,
+        form_version_id: int,
+        rows: Sequence[tuple[int, dict[str, str]]],
+    ) -> range:
+        """Bulk-load ``(created_at, answers)`` rows with driver-level ``executemany``.
+
+        For seeding and imports: sequences, answers and the search index are
+        written as ``bulk_create_submissions`` would, but the field-stats and
+        rate rollups are left stale; run ``rebuild_field_stats`` and
+        ``rebuild_submission_rates`` once loading is done.
+        """
+        count = len(rows)
+        if count == 0:
+            return range(0)
+        # Allocating sequences writes first, so the id range below is read
+        # under this transaction's write lock.
+        last_seq = self._allocate_seqs(form_id=form_id, count=count)
+        first_seq = last_seq - count + 1
+        connection = self._session.connection()
+        # Start past sqlite_sequence too, so ids freed by deletes are not reused.
+        first_id = int(
+            connection.exec_driver_sql(
+                "SELECT MAX(COALESCE(MAX(id), 0), "
+                "COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'submissions'), 0)) + 1 "
+                "FROM submissions"
+            ).scalar_one()
+        )
+        connection.exec_driver_sql(
+            "INSERT INTO submissions (id, form_id, form_version_id, submission_seq, created_at, answers_packed) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    first_id + offset,
+                    form_id,
+                    form_version_id,
+                    first_seq + offset,
+                    created_at,
+                    canonical_json_dumps(answers) if self._packed else None,
+                )
+                for offset, (created_at, answers) in enumerate(rows)
+            ],
+        )
+        connection.exec_driver_sql(
+            "INSERT INTO submission_search (rowid, form_id, submission_id, field_key, value_text) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                ((first_id + offset) * SEARCH_ROWID_STRIDE + ordinal, form_id, first_id + offset, key, value)
+                for offset, (_created_at, answers) in enumerate(rows)
+                for ordinal, (key, value) in enumerate(sorted(answers.items()))
+                if value
+            ],
+        )
+        if not self._packed:
+            connection.exec_driver_sql(
+                "INSERT INTO answers (submission_id, field_key, value_text, created_at) VALUES (?, ?, ?, ?)",
+                [
+                    (first_id + offset, key, value, created_at)
+                    for offset, (created_at, answers) in enumerate(rows)
+                    for key, value in sorted(answers.items())
+                ],
+            )
+        return range(first_seq, last_seq + 1)
+
+    def commit(self) -> None:
+        self._session.commit()
+
+    def _allocate_seqs(self, *, form_id: int, count: int) -> int:
+        """Reserve ``count`` sequence numbers for a form and return the last one.
+
+        The counter row is upserted inside the caller's transaction, so a rollback
+        releases the reservation and sequences stay gapless. The maintained
+        ``submission_count`` moves in the same statement.
+        """
         stmt = (
-            select(Submission)
-            .where(Submission.form_id == form_id)
-            .order_by(
-                getattr(Submission, SUBMISSION_ORDER[0]).asc(),
-                getattr(Submission, SUBMISSION_ORDER[1]).asc(),
+            sqlite_insert(SubmissionCounter)
+            .values(form_id=form_id, last_seq=count, submission_count=count)
+            .on_conflict_do_update(
+                index_elements=[SubmissionCounter.form_id],
+                set_={
+                    "last_seq": SubmissionCounter.last_seq + count,
+                    "submission_count": SubmissionCounter.submission_count + count,
+                },
             )
-            .offset(offset)
-            .limit(limit)
+            .returning(SubmissionCounter.last_seq)
         )
-        rows = list(self._session.execute(stmt).scalars().all())
-        return rows, int(total)
+        return int(self._session.execute(stmt).scalar_one())
 
-    def get_submission(self, *, form_id: int, submission_id: int) -> Submission:
+    def _record_rate(self, *, form_id: int, created_at: int, count: int) -> None:
+        """Add ``count`` (negative on delete) to the form's minute, hour and day buckets."""
+        upsert = sqlite_insert(SubmissionRateBucket)
+        self._session.execute(
+            upsert.on_conflict_do_update(
+                index_elements=[
+                    SubmissionRateBucket.form_id,
+                    SubmissionRateBucket.bucket_seconds,
+                    SubmissionRateBucket.bucket_start,
+                ],
+                set_={"submission_count": SubmissionRateBucket.submission_count + upsert.excluded.submission_count},
+            ),
+            [
+                {
+                    "form_id": form_id,
+                    "bucket_seconds": seconds,
+                    "bucket_start": created_at - created_at % seconds,
+                    "submission_count": count,
+                }
+                for seconds in sorted(RATE_GRANULARITIES.values())
+            ],
+        )
+
+    def list_submissions(
+        self,
+        *,
+        form_id: int,
+        after: tuple[int, int] | None,
+        offset: int,
+        limit: int,
+        search: SubmissionSearch | None = None,
+    ) -> list[Submission]:
+        order_columns = (
+            getattr(Submission, SUBMISSION_ORDER[0]),
+            getattr(Submission, SUBMISSION_ORDER[1]),
+        )
+        stmt = select(Submission).where(Submission.form_id == form_id)
+        if search is not None:
+            stmt = stmt.where(Submission.id.in_(self._search_matches(form_id, search)))
+        if after is not None:
+            stmt = stmt.where(tuple_(*order_columns) > tuple_(*(literal(value) for value in after)))
+        stmt = stmt.order_by(order_columns[0].asc(), order_columns[1].asc()).offset(offset).limit(limit)
+        return list(self._session.execute(stmt).scalars().all())
+
+    def _search_matches(self, form_id: int, search: SubmissionSearch) -> Select[tuple[int]]:
+        """Ids of the form's submissions whose answers match ``search``.
+
+        Exact ``field``/``value`` lookups use ``ix_answers_field_value`` for
+        row-stored answers and compare the packed JSON directly for packed
+        ones, since the FTS index holds neither empty values nor values that
+        tokenize to nothing; ``q`` is a full-text match over answer values.
+        """
+        if search.q is not None:
+            match = fts_match_expression(search.q, field=search.field)
+            stmt = select(submission_search.c.submission_id).where(
+                submission_search.c.form_id == form_id,
+                text("submission_search MATCH :search_match").bindparams(search_match=match),
+            )
+            if search.field is not None:
+                stmt = stmt.where(submission_search.c.field_key == search.field)
+            return stmt
+        field = search.field or ""
+        value = search.value or ""
+        from_rows = select(Answer.submission_id).where(Answer.field_key == field, Answer.value_text == value)
+        if '"' in field:
+            # Not a valid JSON path key, and stored keys never contain quotes.
+            return from_rows
+        from_packed = select(Submission.id).where(
+            Submission.form_id == form_id,
+            Submission.answers_packed.is_not(None),
+            func.json_extract(Submission.answers_packed, f'$."{field}"') == value,
+        )
+        return union(from_rows, from_packed)  # type: ignore[return-value]
+
+    def _index_answers(self, *, form_id: int, entries: Iterable[tuple[int, dict[str, str]]]) -> None:
+        params = [
+            {
+                "rowid": submission_id * SEARCH_ROWID_STRIDE + ordinal,
+                "form_id": form_id,
+                "submission_id": submission_id,
+                "field_key": field_key,
+                "value_text": value,
+            }
+            for submission_id, answers in entries
+            for ordinal, (field_key, value) in enumerate(sorted(answers.items()))
+            if value
+        ]
+        if params:
+            self._session.execute(insert(submission_search), params)
+
+    def count_submissions(self, form_id: int) -> int:
+        stmt = select(SubmissionCounter.submission_count).where(SubmissionCounter.form_id == form_id)
+        return int(self._session.execute(stmt).scalar() or 0)
+
+    def delete_submission(self, *, form_id: int, submission_id: int) -> None:
+        row = self._session.execute(
+            select(Submission.form_version_id, Submission.created_at, Submission.answers_packed).where(
+                Submission.form_id == form_id, Submission.id == submission_id
+            )
+        ).first()
+        if row is None:
+            raise not_found("submission not found")
+        form_version_id, created_at, packed = row
+        if packed is not None:
+            answers = {str(key): str(value) for key, value in json.loads(packed).items()}
+        else:
+            answers = dict(
+                self._session.execute(
+                    select(Answer.field_key, Answer.value_text).where(Answer.submission_id == submission_id)
+                )
+                .tuples()
+                .all()
+            )
+        self._session.execute(delete(Submission).where(Submission.id == submission_id))
+        self._session.execute(
+            update(SubmissionCounter)
+            .where(SubmissionCounter.form_id == form_id)
+            .values(submission_count=SubmissionCounter.submission_count - 1)
+        )
+        self._record_field_stats(form_id=form_id, form_version_id=form_version_id, answer_maps=[answers], delta=-1)
+        # Buckets count surviving submissions, matching rebuild_submission_rates.
+        self._record_rate(form_id=form_id, created_at=created_at, count=-1)
+
+    def repair_submission_counters(self) -> int:
+        """Recompute every form's counter from ``submissions``; returns rows changed."""
+        actual = (
+            select(
+                Submission.form_id.label("form_id"),
+                func.count(Submission.id).label("submission_count"),
+                func.max(Submission.submission_seq).label("max_seq"),
+            )
+            .group_by(Submission.form_id)
+            .subquery()
+        )
+        stmt = select(
+            Form.id,
+            func.coalesce(actual.c.submission_count, 0),
+            func.coalesce(actual.c.max_seq, 0),
+            SubmissionCounter.submission_count,
+            SubmissionCounter.last_seq,
+        ).select_from(
+            Form.__table__.outerjoin(actual, actual.c.form_id == Form.id).outerjoin(
+                SubmissionCounter.__table__, SubmissionCounter.form_id == Form.id
+            )
+        )
+        changed = 0
+        for form_id, count, max_seq, stored_count, stored_seq in self._session.execute(stmt).all():
+            last_seq = max(int(max_seq), int(stored_seq or 0))
+            if stored_count == count and stored_seq == last_seq:
+                continue
+            self._session.execute(
+                sqlite_insert(SubmissionCounter)
+                .values(form_id=form_id, last_seq=last_seq, submission_count=count)
+                .on_conflict_do_update(
+                    index_elements=[SubmissionCounter.form_id],
+                    set_={"last_seq": last_seq, "submission_count": count},
+                )
+            )
+            changed += 1
+        return changed
+
+    def get_field_fill_counts(self, form_id: int) -> dict[str, int]:
+        stmt = select(FieldFillCount.field_key, FieldFillCount.filled_count).where(
+            FieldFillCount.form_id == form_id, FieldFillCount.filled_count > 0
+        )
+        return {field_key: int(count) for field_key, count in self._session.execute(stmt)}
+
+    def get_field_value_counts(self, form_id: int) -> dict[str, dict[str, int]]:
         stmt = (
-            select(Submission)
-            .where(Submission.form_id == form_id, Submission.id == submission_id)
-            .options(selectinload(Submission.answers))
+            select(FieldValueCount.field_key, FieldValueCount.value_text, FieldValueCount.value_count)
+            .where(FieldValueCount.form_id == form_id, FieldValueCount.value_count > 0)
+            .order_by(FieldValueCount.field_key.asc(), FieldValueCount.value_text.asc())
+        )
+        counts: dict[str, dict[str, int]] = {}
+        for field_key, value_text, count in self._session.execute(stmt):
+            counts.setdefault(field_key, {})[value_text] = int(count)
+        return counts
+
+    def rebuild_field_stats(self, form_id: int | None = None) -> int:
+        """Recompute the stats rollups from stored answers; returns rollup rows written."""
+        fill_delete = delete(FieldFillCount)
+        value_delete = delete(FieldValueCount)
+        if form_id is not None:
+            fill_delete = fill_delete.where(FieldFillCount.form_id == form_id)
+            value_delete = value_delete.where(FieldValueCount.form_id == form_id)
+        self._session.execute(fill_delete)
+        self._session.execute(value_delete)
+
+        source = self._answer_values(form_id)
+        filled = self._session.execute(
+            insert(FieldFillCount).from_select(
+                ["form_id", "field_key", "filled_count"],
+                select(source.c.form_id, source.c.field_key, func.count())
+                .where(source.c.value_text != "")
+                .group_by(source.c.form_id, source.c.field_key),
+            )
+        )
+        values = self._session.execute(
+            insert(FieldValueCount).from_select(
+                ["form_id", "field_key", "value_text", "value_count"],
+                select(source.c.form_id, source.c.field_key, source.c.value_text, func.count())
+                .join(
+                    Field,
+                    (Field.form_version_id == source.c.form_version_id) & (Field.field_key == source.c.field_key),
+                )
+                .where(source.c.value_text != "", Field.type.in_(sorted(VALUE_STATS_FIELD_TYPES)))
+                .group_by(source.c.form_id, source.c.field_key, source.c.value_text),
+            )
+        )
+        return int(filled.rowcount) + int(values.rowcount)  # type: ignore[attr-defined]
+
+    def rebuild_submission_rates(self, form_id: int | None = None) -> int:
+        """Recompute the rate buckets from the surviving submissions' timestamps,
+        which is what the maintained buckets hold; returns buckets written."""
+        stale = delete(SubmissionRateBucket)
+        if form_id is not None:
+            stale = stale.where(SubmissionRateBucket.form_id == form_id)
+        self._session.execute(stale)
+        written = 0
+        for seconds in sorted(RATE_GRANULARITIES.values()):
+            bucket_start = Submission.created_at - Submission.created_at % seconds
+            source = select(Submission.form_id, literal(seconds), bucket_start, func.count()).group_by(
+                Submission.form_id, bucket_start
+            )
+            if form_id is not None:
+                source = source.where(Submission.form_id == form_id)
+            result = self._session.execute(
+                insert(SubmissionRateBucket).from_select(
+                    ["form_id", "bucket_seconds", "bucket_start", "submission_count"], source
+                )
+            )
+            written += int(result.rowcount)  # type: ignore[attr-defined]
+        return written
+
+    def _answer_values(self, form_id: int | None) -> Subquery:
+        """``(form_id, form_version_id, field_key, value_text)`` for every stored
+        answer, from answer rows and packed submissions alike."""
+        packed = func.json_each(Submission.answers_packed).table_valued("key", "value")
+        from_rows = select(
+            Submission.form_id,
+            Submission.form_version_id,
+            Answer.field_key.label("field_key"),
+            Answer.value_text.label("value_text"),
+        ).join(Answer, Answer.submission_id == Submission.id)
+        from_packed = (
+            select(
+                Submission.form_id,
+                Submission.form_version_id,
+                packed.c.key.label("field_key"),
+                packed.c.value.label("value_text"),
+            )
+            .join(packed, true())
+            .where(Submission.answers_packed.is_not(None))
+        )
+        if form_id is not None:
+            from_rows = from_rows.where(Submission.form_id == form_id)
+            from_packed = from_packed.where(Submission.form_id == form_id)
+        return union_all(from_rows, from_packed).subquery()
+
+    def _record_field_stats(
+        self,
+        *,
+        form_id: int,
+        form_version_id: int,
+        answer_maps: Iterable[dict[str, str]],
+        delta: int,
+    ) -> None:
+        """Move the stats rollups by ``delta`` per non-empty answer, in the caller's transaction."""
+        tracked = self._value_stat_keys.get(form_version_id)
+        if tracked is None:
+            tracked = frozenset(
+                self._session.execute(
+                    select(Field.field_key).where(
+                        Field.form_version_id == form_version_id,
+                        Field.type.in_(sorted(VALUE_STATS_FIELD_TYPES)),
+                    )
+                ).scalars()
+            )
+            self._value_stat_keys[form_version_id] = tracked
+        filled: Counter[str] = Counter()
+        values: Counter[tuple[str, str]] = Counter()
+        for answers in answer_maps:
+            for field_key, value in answers.items():
+                if not value:
+                    continue
+                filled[field_key] += delta
+                if field_key in tracked:
+                    values[(field_key, value)] += delta
+        if filled:
+            fill_upsert = sqlite_insert(FieldFillCount)
+            self._session.execute(
+                fill_upsert.on_conflict_do_update(
+                    index_elements=[FieldFillCount.form_id, FieldFillCount.field_key],
+                    set_={"filled_count": FieldFillCount.filled_count + fill_upsert.excluded.filled_count},
+                ),
+                [
+                    {"form_id": form_id, "field_key": field_key, "filled_count": count}
+                    for field_key, count in sorted(filled.items())
+                ],
+            )
+        if values:
+            value_upsert = sqlite_insert(FieldValueCount)
+            self._session.execute(
+                value_upsert.on_conflict_do_update(
+                    index_elements=[FieldValueCount.form_id, FieldValueCount.field_key, FieldValueCount.value_text],
+                    set_={"value_count": FieldValueCount.value_count + value_upsert.excluded.value_count},
+                ),
+                [
+                    {"form_id": form_id, "field_key": field_key, "value_text": value, "value_count": count}
+                    for (field_key, value), count in sorted(values.items())
+                ],
+            )
+        if delta < 0 and values:
+            self._session.execute(
+                delete(FieldValueCount).where(
+                    FieldValueCount.form_id == form_id,
+                    tuple_(FieldValueCount.field_key, FieldValueCount.value_text).in_(list(values)),
+                    FieldValueCount.value_count <= 0,
+                )
+            )
+
+    def get_rate_buckets(self, *, form_id: int, bucket_seconds: int, start: int, end: int) -> dict[int, int]:
+        """Non-empty buckets with ``start <= bucket_start < end``, keyed by bucket start."""
+        stmt = select(SubmissionRateBucket.bucket_start, SubmissionRateBucket.submission_count).where(
+            SubmissionRateBucket.form_id == form_id,
+            SubmissionRateBucket.bucket_seconds == bucket_seconds,
+            SubmissionRateBucket.bucket_start >= start,
+            SubmissionRateBucket.bucket_start < end,
         )
+        return {int(bucket_start): int(count) for bucket_start, count in self._session.execute(stmt)}
+
+    def get_submission(self, *, form_id: int, submission_id: int) -> Submission:
+        stmt = select(Submission).where(Submission.form_id == form_id, Submission.id == submission_id)
         submission = self._session.execute(stmt).scalars().first()
         if submission is None:
             raise not_found("submission not found")
         return submission
 
-    def iter_submissions_for_export(self, form_id: int) -> Iterator[Submission]:
+    def export_high_water(self, form_id: int) -> tuple[int, int]:
+        """Current ``(max submission_seq, max id)`` for the form, ``(0, 0)`` when empty."""
+        # One statement, so both marks come from the same snapshot even when
+        # the session is not inside an explicit read transaction.
+        max_seq, max_id = self._session.execute(
+            select(func.max(Submission.submission_seq), func.max(Submission.id)).where(
+                Submission.form_id == form_id
+            )
+        ).one()
+        return int(max_seq or 0), int(max_id or 0)
+
+    def count_export_rows(
+        self, form_id: int, *, since_seq: int | None = None, max_seq: int | None = None
+    ) -> int:
+        stmt = select(func.count()).select_from(Submission).where(Submission.form_id == form_id)
+        if since_seq is not None:
+            stmt = stmt.where(Submission.submission_seq > since_seq)
+        if max_seq is not None:
+            stmt = stmt.where(Submission.submission_seq <= max_seq)
+        return int(self._session.execute(stmt).scalar_one())
+
+    def list_form_ids_with_submissions(self) -> list[int]:
+        stmt = (
+            select(SubmissionCounter.form_id)
+            .where(SubmissionCounter.submission_count > 0)
+            .order_by(SubmissionCounter.form_id.asc())
+        )
+        return list(self._session.execute(stmt).scalars())
+
+    def export_split_keys(self, *, form_id: int, parts: int) -> list[tuple[int, int]]:
+        """Order keys that split the export into up to ``parts`` ranges.
+
+        Only the inner boundaries are returned; the last range stays open and
+        is bounded by the caller's high-water mark. Sizes come from the
+        maintained counter, which may drift or race a delete, so a wrong count
+        only skews range sizes and never leaves rows out of every range.
+        """
+        total = self.count_submissions(form_id)
+        targets = sorted({total * part // parts for part in range(1, parts)} - {0})
+        if not targets:
+            return []
+        order_cols = (
+            getattr(Submission, SUBMISSION_ORDER[0]),
+            getattr(Submission, SUBMISSION_ORDER[1]),
+        )
+        numbered = (
+            select(
+                *order_cols,
+                func.row_number().over(order_by=[col.asc() for col in order_cols]).label("rn"),
+            )
+            .where(Submission.form_id == form_id)
+            .subquery()
+        )
+        stmt = select(numbered.c[SUBMISSION_ORDER[0]], numbered.c[SUBMISSION_ORDER[1]]).where(
+            numbered.c.rn.in_(targets)
+        ).order_by(numbered.c.rn.asc())
+        return [(int(row[0]), int(row[1])) for row in self._session.execute(stmt)]
+
+    def get_answer_map(self, submission: Submission) -> dict[str, str]:
+        """Answers of a loaded submission, whichever storage mode wrote them."""
+        if submission.answers_packed is not None:
+            return {str(key): str(value) for key, value in json.loads(submission.answers_packed).items()}
+        return {answer.field_key: answer.value_text for answer in submission.answers}
+
+    def iter_export_rows(
+        self,
+        *,
+        form_id: int,
+        field_keys: Sequence[str],
+        batch_size: int,
+        after: tuple[int, int] | None = None,
+        until: tuple[int, int] | None = None,
+        since_seq: int | None = None,
+        since_id: int | None = None,
+        max_seq: int | None = None,
+    ) -> Iterator[tuple[int, int, str | None, str | None]]:
+        """Yield ``(submission_id, created_at, field_key, value_text)`` in export order.
+
+        ``after`` (exclusive) and ``until`` (inclusive) bound the range by
+        ``SUBMISSION_ORDER`` key; ``since_seq``/``since_id`` (exclusive) and
+        ``max_seq`` (inclusive) filter on ``submission_seq`` and ``id``.
+        Submissions without a matching answer still produce one row with
+        ``field_key`` set to ``None``.
+        """
+        order_key = tuple_(
+            getattr(Submission, SUBMISSION_ORDER[0]),
+            getattr(Submission, SUBMISSION_ORDER[1]),
+        )
         stmt = (
-            select(Submission)
+            select(
+                Submission.id,
+                Submission.created_at,
+                Answer.field_key,
+                Answer.value_text,
+                Submission.answers_packed,
+            )
+            .outerjoin(
+                Answer,
+                (Answer.submission_id == Submission.id) & Answer.field_key.in_(list(field_keys)),
+            )
             .where(Submission.form_id == form_id)
             .order_by(
                 getattr(Submission, SUBMISSION_ORDER[0]).asc(),
                 getattr(Submission, SUBMISSION_ORDER[1]).asc(),
+                Answer.id.asc(),
             )
-            .options(selectinload(Submission.answers))
+            .execution_options(yield_per=batch_size)
         )
-        yield from self._session.execute(stmt).scalars()
+        if after is not None:
+            stmt = stmt.where(order_key > tuple_(*(literal(value) for value in after)))
+        if until is not None:
+            stmt = stmt.where(order_key <= tuple_(*(literal(value) for value in until)))
+        if since_seq is not None:
+            stmt = stmt.where(Submission.submission_seq > since_seq)
+        if since_id is not None:
+            stmt = stmt.where(Submission.id > since_id)
+        if max_seq is not None:
+            stmt = stmt.where(Submission.submission_seq <= max_seq)
+        # Core execution on the session's connection skips ORM result processing.
+        for submission_id, created_at, field_key, value_text, packed in self._session.connection().execute(stmt):
+            if packed is None:
+                yield submission_id, created_at, field_key, value_text
+                continue
+            answers = json.loads(packed)
+            present = [key for key in field_keys if key in answers]
+            if not present:
+                yield submission_id, created_at, None, None
+            for key in present:
+                yield submission_id, created_at, key, answers[key]
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
 
-from hitech_forms.db.engine import get_engine
+from hitech_forms.db.engine import get_async_engine, get_engine, get_read_engine
 
 SessionLocal = sessionmaker(autoflush=False, autocommit=False, future=True)
+ReadSessionLocal = sessionmaker(autoflush=False, autocommit=False, future=True)
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
 
 
 @contextmanager
@@ -24,6 +27,31 @@ def session_scope() -> Iterator[Session]:
         session.close()
 
 
+@contextmanager
+def read_session_scope() -> Iterator[Session]:
+    ReadSessionLocal.configure(bind=get_read_engine())
+    session = ReadSessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncIterator[AsyncSession]:
+    AsyncSessionLocal.configure(bind=get_async_engine())
+    session = AsyncSessionLocal()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
 def get_session() -> Iterator[Session]:
     with session_scope() as session:
         yield session
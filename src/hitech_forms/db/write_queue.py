@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+from hitech_forms.contracts import SubmissionSummaryDTO
+from hitech_forms.db.repositories import SubmissionRepository
+from hitech_forms.db.session import session_scope
+from hitech_forms.platform.errors import service_unavailable
+from hitech_forms.platform.logging import get_logger, log_event
+from hitech_forms.platform.settings import get_settings
+
+_logger = get_logger("hitech_forms.write_queue")
+
+
+@dataclass
+class _PendingWrite:
+    payload: dict[str, Any]
+    future: Future[SubmissionSummaryDTO] = field(default_factory=Future)
+
+
+class SubmissionWriteQueue:
+    """Group-commits submissions from many request threads on a single writer thread.
+
+    Callers block until the transaction holding their row has committed, so a
+    returned summary is as durable as a direct insert. A batch that fails is
+    replayed one row per transaction so only the offending submission errors.
+    Each writer thread owns its queue, so a writer that outlives ``stop`` never
+    competes with its replacement.
+    """
+
+    def __init__(self, *, max_batch: int, max_delay_ms: int) -> None:
+        self._max_batch = max_batch
+        self._max_delay = max_delay_ms / 1000
+        self._queue: queue.Queue[_PendingWrite | None] | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        *,
+        form_id: int,
+        form_version_id: int,
+        answers: dict[str, str],
+        now_epoch: int,
+    ) -> SubmissionSummaryDTO:
+        return self.enqueue(
+            form_id=form_id, form_version_id=form_version_id, answers=answers, now_epoch=now_epoch
+        ).result()
+
+    def enqueue(
+        self,
+        *,
+        form_id: int,
+        form_version_id: int,
+        answers: dict[str, str],
+        now_epoch: int,
+    ) -> Future[SubmissionSummaryDTO]:
+        """Queue a submission and return the future its commit resolves; for
+        callers that must not block, such as async request handlers."""
+        pending = _PendingWrite(
+            payload={
+                "form_id": form_id,
+                "form_version_id": form_version_id,
+                "answers": answers,
+                "now_epoch": now_epoch,
+            }
+        )
+        with self._lock:
+            self._ensure_started().put(pending)
+        return pending.future
+
+    def stop(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            thread, work = self._thread, self._queue
+            self._thread = self._queue = None
+        if thread is None or work is None:
+            return
+        work.put(None)
+        thread.join(timeout)
+        if thread.is_alive():
+            # The writer is stuck on a batch; fail what it has not taken yet
+            # so callers waiting on future.result() are released.
+            self._fail_queued(work)
+
+    def _fail_queued(self, work: queue.Queue[_PendingWrite | None]) -> None:
+        failed = 0
+        while True:
+            try:
+                item = work.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None and item.future.set_running_or_notify_cancel():
+                item.future.set_exception(service_unavailable("submission writer is shutting down"))
+                failed += 1
+        # Let the stuck writer exit once its batch finishes.
+        work.put(None)
+        if failed:
+            log_event(_logger, "write_queue_stopped_with_pending", failed=failed)
+
+    def _ensure_started(self) -> queue.Queue[_PendingWrite | None]:
+        """Return the live writer's queue, starting a writer if there is none
+        or it has died. Callers hold ``_lock``."""
+        if self._queue is None:
+            self._queue = queue.Queue()
+        if self._thread is None or not self._thread.is_alive():
+            # A dead writer left its queue behind; the replacement takes it over.
+            self._thread = threading.Thread(
+                target=self._run, args=(self._queue,), name="hforms-submission-writer", daemon=True
+            )
+            self._thread.start()
+        return self._queue
+
+    def _run(self, work: queue.Queue[_PendingWrite | None]) -> None:
+        while True:
+            first = work.get()
+            if first is None:
+                self._drain(work)
+                return
+            batch = [first]
+            deadline = time.monotonic() + self._max_delay
+            while len(batch) < self._max_batch:
+                try:
+                    remaining = deadline - time.monotonic()
+                    item = work.get(timeout=remaining) if remaining > 0 else work.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._write_batch(batch)
+                    self._drain(work)
+                    return
+                batch.append(item)
+            self._write_batch(batch)
+
+    def _drain(self, work: queue.Queue[_PendingWrite | None]) -> None:
+        leftovers: list[_PendingWrite] = []
+        while True:
+            try:
+                item = work.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                leftovers.append(item)
+        for start in range(0, len(leftovers), self._max_batch):
+            self._write_batch(leftovers[start : start + self._max_batch])
+
+    def _write_batch(self, batch: list[_PendingWrite]) -> None:
+        # Callers may cancel a write they are no longer waiting for; only rows
+        # whose futures are now running (and so uncancellable) get written.
+        live = [pending for pending in batch if pending.future.set_running_or_notify_cancel()]
+        if not live:
+            return
+        try:
+            self._resolve(live)
+        except Exception as exc:
+            # Never let one batch take down the only writer thread.
+            log_event(_logger, "write_queue_writer_error", size=len(live), error=type(exc).__name__)
+            for pending in live:
+                if not pending.future.done():
+                    pending.future.set_exception(exc)
+
+    def _resolve(self, batch: list[_PendingWrite]) -> None:
+        try:
+            results = self._commit(batch)
+        except Exception as exc:
+            log_event(_logger, "write_queue_batch_failed", size=len(batch), error=type(exc).__name__)
+            for pending in batch:
+                try:
+                    (result,) = self._commit([pending])
+                except Exception as item_exc:
+                    pending.future.set_exception(item_exc)
+                else:
+                    pending.future.set_result(result)
+            return
+        for pending, result in zip(batch, results, strict=True):
+            pending.future.set_result(result)
+
+    def _commit(self, batch: list[_PendingWrite]) -> list[SubmissionSummaryDTO]:
+        with session_scope() as session:
+            repo = SubmissionRepository(session)
+            results = []
+            for pending in batch:
+                row = repo.create_submission(**pending.payload)
+                results.append(
+                    SubmissionSummaryDTO(
+                        id=row.id,
+                        form_id=row.form_id,
+                        form_version_id=row.form_version_id,
+                        submission_seq=row.submission_seq,
+                        created_at=row.created_at,
+                    )
+                )
+        return results
+
+
+_WRITE_QUEUE: SubmissionWriteQueue | None = None
+
+
+def get_submission_write_queue() -> SubmissionWriteQueue:
+    global _WRITE_QUEUE
+    if _WRITE_QUEUE is None:
+        settings = get_settings()
+        _WRITE_QUEUE = SubmissionWriteQueue(
+            max_batch=settings.write_queue_max_batch,
+            max_delay_ms=settings.write_queue_max_delay_ms,
+        )
+    return _WRITE_QUEUE
+
+
+def shutdown_submission_write_queue() -> None:
+    global _WRITE_QUEUE
+    if _WRITE_QUEUE is not None:
+        _WRITE_QUEUE.stop()
+    _WRITE_QUEUE = None
@@ -0,0 +1,391 @@
+"""In-process benchmarks for the HTTP hot paths.
+
+Requests go through the real ASGI app over ``httpx.ASGITransport`` against
+whatever database the current settings point at, so routing, dependency
+wiring, serialization and compression are all included in the numbers.
+``hforms bench`` runs this against a fresh temporary database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import func, select
+
+from hitech_forms import __version__
+from hitech_forms.platform.cursor import encode_cursor
+from hitech_forms.platform.settings import get_settings
+
+SCENARIOS = (
+    "public_get",
+    "public_submit",
+    "admin_list_deep_offset",
+    "admin_list_deep_cursor",
+    "submission_detail",
+    "export_csv",
+)
+BENCH_FIELDS: list[dict[str, Any]] = [
+    {"key": "name", "label": "Name", "type": "text", "required": True, "options": []},
+    {"key": "email", "label": "Email", "type": "email", "required": True, "options": []},
+    {
+        "key": "priority",
+        "label": "Priority",
+        "type": "select",
+        "required": True,
+        "options": ["low", "normal", "high"],
+    },
+    {"key": "score", "label": "Score", "type": "number", "required": False, "options": []},
+    {"key": "visited", "label": "Visited", "type": "date", "required": False, "options": []},
+    {"key": "notify", "label": "Notify", "type": "checkbox", "required": False, "options": []},
+]
+SEED_BATCH_SIZE = 5000
+BENCH_PAGE_SIZE = 50
+_SEED_EPOCH = 1700000000
+_DETAIL_SAMPLE = 512
+UNLIMITED_RATE = 1_000_000_000
+
+
+@dataclass(frozen=True)
+class BenchConfig:
+    submissions: int = 1000
+    requests: int = 200
+    concurrency: int = 1
+    export_runs: int = 3
+    warmup: int = 5
+    seed: int = 0
+    scenarios: Sequence[str] = SCENARIOS
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    scenario: str
+    operations: int
+    elapsed_s: float
+    ops_per_s: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    peak_rss_kb: int | None
+    bytes_per_op: int
+
+
+@dataclass(frozen=True)
+class _Target:
+    form_id: int
+    slug: str
+    submission_count: int
+    deep_page: int
+    deep_cursor: str | None
+    detail_ids: list[int]
+
+
+def bench_answers(rng: random.Random, index: int) -> dict[str, str]:
+    """One valid answer map for ``BENCH_FIELDS``."""
+    return {
+        "name": f"Bench {index}",
+        "email": f"bench{index}@example.com",
+        "priority": rng.choice(("low", "normal", "high")),
+        "score": str(rng.randint(0, 1000)),
+        "visited": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "notify": rng.choice(("true", "false")),
+    }
+
+
+def seed_bench_form(*, submissions: int, seed: int = 0) -> tuple[int, str]:
+    """Create and publish the bench form and bulk-load ``submissions`` rows,
+    committing every ``SEED_BATCH_SIZE`` rows. Returns ``(form_id, slug)``."""
+    from hitech_forms.db import session_scope
+    from hitech_forms.db.repositories import FormRepository, SubmissionRepository
+    from hitech_forms.services import FormService
+
+    with session_scope() as session:
+        service = FormService(FormRepository(session))
+        created = service.command_create_form(title="Bench Intake")
+        service.command_replace_fields(form_id=created["id"], fields=BENCH_FIELDS)
+        published = service.command_publish_form(created["id"])
+    form_id, version_id = int(published["id"]), int(published["active_version_id"])
+    rng = random.Random(seed)
+    for start in range(0, submissions, SEED_BATCH_SIZE):
+        stop = min(start + SEED_BATCH_SIZE, submissions)
+        rows = [(_SEED_EPOCH + index, bench_answers(rng, index)) for index in range(start, stop)]
+        with session_scope() as session:
+            SubmissionRepository(session).load_submissions(form_id=form_id, form_version_id=version_id, rows=rows)
+    with session_scope() as session:
+        repository = SubmissionRepository(session)
+        repository.rebuild_field_stats(form_id)
+        repository.rebuild_submission_rates(form_id)
+    return form_id, str(published["slug"])
+
+
+def prepare_bench_database(db_path: Path) -> None:
+    """Point the process at a freshly migrated database at ``db_path`` with
+    rate limits lifted, and drop every cache built from the old settings."""
+    os.environ["HFORMS_DB_PATH"] = str(db_path)
+    os.environ["HFORMS_RATE_LIMIT_PER_MINUTE"] = str(UNLIMITED_RATE)
+    os.environ["HFORMS_PUBLIC_SUBMIT_RATE_LIMIT_PER_MINUTE"] = str(UNLIMITED_RATE)
+    os.environ.setdefault("HFORMS_ADMIN_TOKEN", "bench-admin-token")
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "-c", "migrations/alembic.ini", "upgrade", "head"],
+        env=os.environ.copy(),
+        check=True,
+        capture_output=True,
+    )
+    from hitech_forms.app.security.rate_limit import reset_rate_limiter
+    from hitech_forms.db.engine import reset_engine_cache
+    from hitech_forms.platform.feature_flags import reset_feature_flags_cache
+    from hitech_forms.platform.settings import reset_settings_cache
+    from hitech_forms.services.public_form_cache import reset_public_form_cache
+    from hitech_forms.services.submission_validation import reset_submission_validator_cache
+
+    reset_settings_cache()
+    reset_engine_cache()
+    reset_submission_validator_cache()
+    reset_public_form_cache()
+    reset_feature_flags_cache()
+    reset_rate_limiter()
+
+
+def _resolve_target(form_id: int, slug: str, *, seed: int) -> _Target:
+    from hitech_forms.db import session_scope
+    from hitech_forms.db.models import Submission
+    from hitech_forms.db.repositories import SubmissionRepository
+
+    with session_scope() as session:
+        count = SubmissionRepository(session).count_submissions(form_id)
+        # Aim two pages before the end so the deep page is always full.
+        deep_offset = max(0, count - 2 * BENCH_PAGE_SIZE)
+        deep_row = session.execute(
+            select(Submission.created_at, Submission.id)
+            .where(Submission.form_id == form_id)
+            .order_by(Submission.created_at.asc(), Submission.id.asc())
+            .offset(max(0, deep_offset - 1))
+            .limit(1)
+        ).first()
+        low, high = session.execute(
+            select(func.min(Submission.id), func.max(Submission.id)).where(Submission.form_id == form_id)
+        ).one()
+        detail_ids: list[int] = []
+        if low is not None:
+            rng = random.Random(seed)
+            candidates = {rng.randint(low, high) for _ in range(_DETAIL_SAMPLE)}
+            detail_ids = sorted(
+                session.scalars(
+                    select(Submission.id).where(Submission.form_id == form_id, Submission.id.in_(candidates))
+                ).all()
+            )
+            rng.shuffle(detail_ids)
+    return _Target(
+        form_id=form_id,
+        slug=slug,
+        submission_count=count,
+        deep_page=deep_offset // BENCH_PAGE_SIZE + 1,
+        deep_cursor=encode_cursor(tuple(deep_row)) if deep_row is not None and deep_offset else None,
+        detail_ids=detail_ids or [0],
+    )
+
+
+def percentile(sorted_values: Sequence[float], pct: int) -> float:
+    """Nearest-rank percentile of an already sorted sample."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _reset_peak_rss() -> None:
+    # Linux only: writing 5 resets VmHWM so each scenario reports its own peak.
+    with contextlib.suppress(OSError):
+        Path("/proc/self/clear_refs").write_text("5")
+
+
+def _peak_rss_kb() -> int | None:
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and KiB elsewhere.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+Operation = Callable[[int], Awaitable[int]]
+
+
+async def _measure(
+    scenario: str, operation: Operation, *, operations: int, concurrency: int, warmup: int
+) -> BenchResult:
+    for index in range(warmup):
+        await operation(index)
+    _reset_peak_rss()
+    latencies: list[float] = []
+    sizes: list[int] = []
+    counter = iter(range(operations))
+
+    async def _worker() -> None:
+        for index in counter:
+            began = time.perf_counter()
+            sizes.append(await operation(warmup + index))
+            latencies.append(time.perf_counter() - began)
+
+    began = time.perf_counter()
+    await asyncio.gather(*(_worker() for _ in range(max(1, concurrency))))
+    elapsed = time.perf_counter() - began
+    latencies.sort()
+    return BenchResult(
+        scenario=scenario,
+        operations=operations,
+        elapsed_s=round(elapsed, 4),
+        ops_per_s=round(operations / elapsed, 1) if elapsed else 0.0,
+        p50_ms=round(percentile(latencies, 50) * 1000, 3),
+        p95_ms=round(percentile(latencies, 95) * 1000, 3),
+        p99_ms=round(percentile(latencies, 99) * 1000, 3),
+        max_ms=round(latencies[-1] * 1000, 3),
+        peak_rss_kb=_peak_rss_kb(),
+        bytes_per_op=sum(sizes) // operations,
+    )
+
+
+def _operations(client: Any, target: _Target, config: BenchConfig) -> dict[str, Operation]:
+    headers = {"X-Admin-Token": get_settings().admin_token}
+    rng = random.Random(config.seed)
+
+    async def _request(method: str, url: str, **kwargs: Any) -> int:
+        response = await client.request(method, url, **kwargs)
+        if response.status_code >= 400:
+            raise RuntimeError(f"{method} {url} returned {response.status_code}")
+        return len(response.content)
+
+    async def public_get(_index: int) -> int:
+        return await _request("GET", f"/api/f/{target.slug}")
+
+    async def public_submit(index: int) -> int:
+        values = bench_answers(rng, target.submission_count + index)
+        return await _request("POST", f"/api/f/{target.slug}/submit", json={"values": values})
+
+    async def admin_list_deep_offset(_index: int) -> int:
+        return await _request(
+            "GET",
+            f"/api/admin/forms/{target.form_id}/submissions",
+            params={"page": target.deep_page, "page_size": BENCH_PAGE_SIZE},
+            headers=headers,
+        )
+
+    async def admin_list_deep_cursor(_index: int) -> int:
+        params: dict[str, Any] = {"page_size": BENCH_PAGE_SIZE}
+        if target.deep_cursor is not None:
+            params["cursor"] = target.deep_cursor
+        return await _request(
+            "GET", f"/api/admin/forms/{target.form_id}/submissions", params=params, headers=headers
+        )
+
+    async def submission_detail(index: int) -> int:
+        submission_id = target.detail_ids[index % len(target.detail_ids)]
+        return await _request(
+            "GET", f"/api/admin/forms/{target.form_id}/submissions/{submission_id}", headers=headers
+        )
+
+    async def export_csv(_index: int) -> int:
+        return await _request("GET", f"/api/admin/forms/{target.form_id}/export.csv", headers=headers)
+
+    return {
+        "public_get": public_get,
+        "public_submit": public_submit,
+        "admin_list_deep_offset": admin_list_deep_offset,
+        "admin_list_deep_cursor": admin_list_deep_cursor,
+        "submission_detail": submission_detail,
+        "export_csv": export_csv,
+    }
+
+
+async def _run(config: BenchConfig) -> list[BenchResult]:
+    import httpx
+
+    from hitech_forms.app.main import app
+
+    form_id, slug = seed_bench_form(submissions=config.submissions, seed=config.seed)
+    target = _resolve_target(form_id, slug, seed=config.seed)
+    results: list[BenchResult] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        operations = _operations(client, target, config)
+        for scenario in config.scenarios:
+            # Exports are whole-table scans; one request already measures throughput.
+            export = scenario == "export_csv"
+            results.append(
+                await _measure(
+                    scenario,
+                    operations[scenario],
+                    operations=config.export_runs if export else config.requests,
+                    concurrency=1 if export else config.concurrency,
+                    warmup=1 if export else config.warmup,
+                )
+            )
+    return results
+
+
+def run_benchmarks(config: BenchConfig) -> dict[str, Any]:
+    """Seed the configured database and run every requested scenario.
+
+    Returns a JSON-ready report; ``compare_reports`` diffs two of them.
+    """
+    unknown = sorted(set(config.scenarios) - set(SCENARIOS))
+    if unknown:
+        raise ValueError(f"unknown scenario(s): {', '.join(unknown)}")
+    settings = get_settings()
+    began = time.perf_counter()
+    results = asyncio.run(_run(config))
+    return {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "submissions": config.submissions,
+            "requests": config.requests,
+            "concurrency": config.concurrency,
+            "seed": config.seed,
+            "answer_storage": settings.answer_storage,
+            "db_driver": settings.db_driver,
+            "sqlite_profile": settings.sqlite_profile,
+            "total_s": round(time.perf_counter() - began, 3),
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def _ratio(current: float, baseline: float) -> float | None:
+    return round(current / baseline, 3) if baseline else None
+
+
+def compare_reports(current: dict[str, Any], baseline: dict[str, Any]) -> list[dict[str, Any]]:
+    """Per-scenario throughput and p95 ratios of ``current`` over ``baseline``."""
+    previous = {result["scenario"]: result for result in baseline.get("results", [])}
+    rows: list[dict[str, Any]] = []
+    for result in current["results"]:
+        base = previous.get(result["scenario"])
+        if base is None:
+            continue
+        rows.append(
+            {
+                "scenario": result["scenario"],
+                "ops_per_s_ratio": _ratio(result["ops_per_s"], base["ops_per_s"]),
+                "p95_ratio": _ratio(result["p95_ms"], base["p95_ms"]),
+            }
+        )
+    return rows
@@ -1,16 +1,29 @@
 from __future__ import annotations
 
+import json
 import os
 import subprocess
 import sys
+import tempfile
+from pathlib import Path
 
 import typer
 
+from hitech_forms.app.dependencies import build_export_service
 from hitech_forms.db import session_scope
 from hitech_forms.db.repositories import FormRepository, SubmissionRepository
-from hitech_forms.platform.determinism import ensure_determinism_env
+from hitech_forms.ops.bench import (
+    SCENARIOS,
+    BenchConfig,
+    compare_reports,
+    prepare_bench_database,
+    run_benchmarks,
+)
+from hitech_forms.ops.loadtest import DEFAULT_LOADTEST_MIX, LoadtestConfig, parse_mix, run_loadtest
+from hitech_forms.ops.seed import DEFAULT_FIELD_MIX, SeedConfig, parse_field_mix, seed_database
+from hitech_forms.platform.determinism import canonical_json_dumps, ensure_determinism_env
 from hitech_forms.platform.settings import get_settings
-from hitech_forms.services import ExportService, FormService
+from hitech_forms.services import FormService
 
 app = typer.Typer(add_completion=False, help="HITECH_FORMS CLI")
 db = typer.Typer(add_completion=False, help="Database commands")
@@ -42,6 +55,20 @@ def db_upgrade() -> None:
     )
 
 
+@db.command("repair-counts")
+def db_repair_counts() -> None:
+    with session_scope() as session:
+        changed = SubmissionRepository(session).repair_submission_counters()
+    typer.echo(f"repair-counts: updated {changed} form counter(s)")
+
+
+@db.command("rebuild-stats")
+def db_rebuild_stats(form_id: int | None = None) -> None:
+    with session_scope() as session:
+        written = SubmissionRepository(session).rebuild_field_stats(form_id)
+    typer.echo(f"rebuild-stats: wrote {written} rollup row(s)")
+
+
 @app.command("seed-demo")
 def seed_demo() -> None:
     with session_scope() as session:
@@ -72,13 +99,126 @@ def seed_demo() -> None:
 
 
 @app.command("export-csv")
-def export_csv(form_id: int, output: str, version: str = "v1") -> None:
+def export_csv(form_id: int, output: str, version: str = "v1", since_seq: int | None = None) -> None:
     with session_scope() as session:
-        export_service = ExportService(FormRepository(session), SubmissionRepository(session))
-        with open(output, "w", encoding="utf-8", newline="") as handle:
-            for chunk in export_service.stream_form_csv(form_id=form_id, export_version=version):
+        export_service = build_export_service(session)
+        stream = export_service.stream_form_export(
+            form_id=form_id, export_format="csv", export_version=version, since_seq=since_seq
+        )
+        with open(output, "wb") as handle:
+            for chunk in stream.chunks:
                 handle.write(chunk)
-    typer.echo(f"export-csv: wrote {output}")
+    typer.echo(f"export-csv: wrote {output} (high-water seq {stream.high_water_seq})")
+
+
+@app.command("export-snapshot")
+def export_snapshot(form_id: int | None = None, rebuild: bool = False) -> None:
+    with session_scope() as session:
+        export_service = build_export_service(session)
+        if form_id is None:
+            artifacts = export_service.refresh_csv_artifacts(rebuild=rebuild)
+        else:
+            artifacts = [export_service.refresh_csv_artifact(form_id=form_id, rebuild=rebuild)]
+    for artifact in artifacts:
+        typer.echo(
+            f"export-snapshot: form {artifact.form_id} rows={artifact.rows} "
+            f"high-water seq {artifact.high_water_seq} -> {artifact.path}"
+        )
+
+
+@app.command("seed")
+def seed(
+    forms: int = 1,
+    fields: int = 6,
+    submissions: int = 1000,
+    field_mix: str = ",".join(f"{name}={weight}" for name, weight in DEFAULT_FIELD_MIX.items()),
+    seed: int = 0,
+    batch_size: int = 10000,
+) -> None:
+    try:
+        config = SeedConfig(
+            forms=forms,
+            fields=fields,
+            submissions=submissions,
+            field_mix=parse_field_mix(field_mix),
+            seed=seed,
+            batch_size=batch_size,
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    report = seed_database(config)
+    typer.echo(
+        f"seed: {report.submissions} submission(s) across form(s) {report.form_ids} "
+        f"in {report.elapsed_s}s ({report.rows_per_s} rows/s)"
+    )
+
+
+@app.command("loadtest")
+def loadtest(
+    base_url: str | None = None,
+    concurrency: int = 16,
+    requests: int = 1000,
+    duration: float = 0.0,
+    mix: str = ",".join(f"{name}={weight}" for name, weight in DEFAULT_LOADTEST_MIX.items()),
+    slug: str | None = None,
+    seed: int = 0,
+    output: str | None = None,
+    keep_rate_limits: bool = False,
+) -> None:
+    try:
+        parsed_mix = parse_mix(mix)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    report = run_loadtest(
+        LoadtestConfig(
+            base_url=base_url,
+            concurrency=concurrency,
+            requests=requests,
+            duration_s=duration,
+            mix=parsed_mix,
+            slug=slug,
+            seed=seed,
+            keep_rate_limits=keep_rate_limits,
+        )
+    )
+    rendered = canonical_json_dumps(report)
+    if output is None:
+        typer.echo(rendered)
+    else:
+        Path(output).write_text(rendered + "\n", encoding="utf-8")
+        typer.echo(f"loadtest: wrote {output}")
+
+
+@app.command("bench")
+def bench(
+    submissions: int = 1000,
+    requests: int = 200,
+    concurrency: int = 1,
+    export_runs: int = 3,
+    scenarios: str = ",".join(SCENARIOS),
+    seed: int = 0,
+    output: str | None = None,
+    baseline: str | None = None,
+) -> None:
+    config = BenchConfig(
+        submissions=submissions,
+        requests=requests,
+        concurrency=concurrency,
+        export_runs=export_runs,
+        seed=seed,
+        scenarios=tuple(name.strip() for name in scenarios.split(",") if name.strip()),
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        prepare_bench_database(Path(tmp) / "bench.db")
+        report = run_benchmarks(config)
+    if baseline is not None:
+        report["baseline"] = compare_reports(report, json.loads(Path(baseline).read_text(encoding="utf-8")))
+    rendered = canonical_json_dumps(report)
+    if output is None:
+        typer.echo(rendered)
+    else:
+        Path(output).write_text(rendered + "\n", encoding="utf-8")
+        typer.echo(f"bench: wrote {output}")
 
 
 @app.command("quality-check")
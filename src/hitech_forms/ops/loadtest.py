@@ -0,0 +1,209 @@
+"""Closed-loop load generator for the public and admin routes.
+
+``concurrency`` workers issue requests back to back, each picking a scenario
+by weight, either in-process over ``httpx.ASGITransport`` or against a
+running server (``base_url``). The target form is discovered through the
+admin API, so a database filled by ``hforms seed`` works as is. In-process
+runs lift the rate limits for their duration unless ``keep_rate_limits`` is
+set, so the report measures the app rather than the limiter.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from hitech_forms.ops.bench import UNLIMITED_RATE, percentile
+from hitech_forms.ops.seed import parse_weights, seed_value
+from hitech_forms.platform.settings import get_settings
+
+LOADTEST_SCENARIOS = ("public_get", "public_submit", "admin_list")
+DEFAULT_LOADTEST_MIX: dict[str, int] = {"public_get": 8, "public_submit": 2, "admin_list": 0}
+LATENCY_PERCENTILES = (50, 90, 95, 99)
+
+
+@dataclass(frozen=True)
+class LoadtestConfig:
+    base_url: str | None = None
+    concurrency: int = 16
+    requests: int = 1000
+    # Stops early once this many seconds have passed; 0 disables it.
+    duration_s: float = 0.0
+    mix: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_LOADTEST_MIX))
+    slug: str | None = None
+    seed: int = 0
+    # In-process only: measure with the configured rate limits in place.
+    keep_rate_limits: bool = False
+
+
+@dataclass(frozen=True)
+class ScenarioStats:
+    scenario: str
+    requests: int
+    errors: int
+    statuses: dict[str, int]
+    latency_ms: dict[str, float]
+
+
+def parse_mix(spec: str) -> dict[str, int]:
+    """Parse ``scenario=weight`` pairs, e.g. ``"public_get=8,public_submit=2"``."""
+    return parse_weights(spec, LOADTEST_SCENARIOS, kind="scenario")
+
+
+def _latency_summary(latencies: list[float]) -> dict[str, float]:
+    if not latencies:
+        return {}
+    latencies.sort()
+    summary = {f"p{pct}": round(percentile(latencies, pct) * 1000, 3) for pct in LATENCY_PERCENTILES}
+    summary["max"] = round(latencies[-1] * 1000, 3)
+    summary["mean"] = round(sum(latencies) / len(latencies) * 1000, 3)
+    return summary
+
+
+async def _discover_form(client: Any, headers: dict[str, str], slug: str | None) -> dict[str, Any]:
+    if slug is None:
+        listed = await client.get("/api/admin/forms", params={"page_size": 100}, headers=headers)
+        listed.raise_for_status()
+        published = [item for item in listed.json()["items"] if item["status"] == "published"]
+        if not published:
+            raise RuntimeError("no published form to load; run `hforms seed` first or pass --slug")
+        slug = str(published[0]["slug"])
+    response = await client.get(f"/api/f/{slug}")
+    response.raise_for_status()
+    return dict(response.json())
+
+
+@contextmanager
+def _lifted_rate_limits() -> Iterator[None]:
+    from hitech_forms.app.security.rate_limit import reset_rate_limiter
+    from hitech_forms.platform.settings import reset_settings_cache
+
+    names = ("HFORMS_RATE_LIMIT_PER_MINUTE", "HFORMS_PUBLIC_SUBMIT_RATE_LIMIT_PER_MINUTE")
+    saved = {name: os.environ.get(name) for name in names}
+    os.environ.update({name: str(UNLIMITED_RATE) for name in names})
+    reset_settings_cache()
+    reset_rate_limiter()
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        reset_settings_cache()
+        reset_rate_limiter()
+
+
+def _rate_limit_mode(config: LoadtestConfig) -> str:
+    if config.base_url is not None:
+        return "server"
+    return "enforced" if config.keep_rate_limits else "lifted"
+
+
+async def _drive(client: Any, config: LoadtestConfig) -> dict[str, Any]:
+    headers = {"X-Admin-Token": get_settings().admin_token}
+    form = await _discover_form(client, headers, config.slug)
+    specs = [
+        {"key": item["key"], "type": item["field_type"], "required": item["required"], "options": item["options"]}
+        for item in form["fields"]
+    ]
+    slug, form_id = form["slug"], form["id"]
+    rng = random.Random(config.seed)
+
+    async def public_get() -> Any:
+        return await client.get(f"/api/f/{slug}")
+
+    async def public_submit() -> Any:
+        values = {spec["key"]: seed_value(rng, spec, blank_ratio=0.2) for spec in specs}
+        return await client.post(f"/api/f/{slug}/submit", json={"values": values})
+
+    async def admin_list() -> Any:
+        page = rng.randint(1, 20)
+        return await client.get(
+            f"/api/admin/forms/{form_id}/submissions", params={"page": page, "page_size": 50}, headers=headers
+        )
+
+    requests: dict[str, Callable[[], Awaitable[Any]]] = {
+        "public_get": public_get,
+        "public_submit": public_submit,
+        "admin_list": admin_list,
+    }
+    names = [name for name in LOADTEST_SCENARIOS if config.mix.get(name, 0) > 0]
+    weights = [config.mix[name] for name in names]
+    plan = iter(rng.choices(names, weights=weights, k=config.requests))
+    latencies: dict[str, list[float]] = {name: [] for name in names}
+    statuses: dict[str, Counter[str]] = {name: Counter() for name in names}
+    began = time.perf_counter()
+    deadline = began + config.duration_s if config.duration_s > 0 else None
+
+    async def _worker() -> None:
+        for name in plan:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            started = time.perf_counter()
+            try:
+                status = str((await requests[name]()).status_code)
+            except Exception as exc:
+                status = type(exc).__name__
+            latencies[name].append(time.perf_counter() - started)
+            statuses[name][status] += 1
+
+    await asyncio.gather(*(_worker() for _ in range(max(1, config.concurrency))))
+    elapsed = time.perf_counter() - began
+    scenarios = [
+        ScenarioStats(
+            scenario=name,
+            requests=len(latencies[name]),
+            errors=sum(count for status, count in statuses[name].items() if not status.startswith(("2", "3"))),
+            statuses=dict(sorted(statuses[name].items())),
+            latency_ms=_latency_summary(latencies[name]),
+        )
+        for name in names
+    ]
+    completed = sum(stats.requests for stats in scenarios)
+    return {
+        "target": config.base_url or "in-process",
+        # "server": whatever the remote server enforces.
+        "rate_limits": _rate_limit_mode(config),
+        "form_id": form_id,
+        "slug": slug,
+        "concurrency": config.concurrency,
+        "requests": completed,
+        "errors": sum(stats.errors for stats in scenarios),
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(completed / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": _latency_summary([latency for name in names for latency in latencies[name]]),
+        "scenarios": [asdict(stats) for stats in scenarios],
+    }
+
+
+async def _run(config: LoadtestConfig) -> dict[str, Any]:
+    import httpx
+
+    limits = httpx.Limits(max_connections=config.concurrency, max_keepalive_connections=config.concurrency)
+    if config.base_url is not None:
+        async with httpx.AsyncClient(base_url=config.base_url, limits=limits, timeout=30.0) as client:
+            return await _drive(client, config)
+
+    from hitech_forms.app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=None) as client:
+        if config.keep_rate_limits:
+            return await _drive(client, config)
+        with _lifted_rate_limits():
+            return await _drive(client, config)
+
+
+def run_loadtest(config: LoadtestConfig) -> dict[str, Any]:
+    """Drive the app and return totals plus per-scenario status counts and
+    latency percentiles."""
+    return asyncio.run(_run(config))
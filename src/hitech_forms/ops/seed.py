@@ -0,0 +1,170 @@
+"""Synthetic data for capacity planning.
+
+``seed_database`` creates published forms through ``FormService`` and then
+bulk-loads submissions straight through ``SubmissionRepository.load_submissions``,
+skipping per-request validation, before rebuilding the rollups once. Every
+value comes from one ``random.Random(seed)``, so a seed always produces the
+same database.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from typing import Any
+
+from hitech_forms.platform.determinism import utc_now_epoch
+
+DEFAULT_FIELD_MIX: dict[str, int] = {
+    "text": 3,
+    "email": 1,
+    "select": 2,
+    "number": 2,
+    "date": 1,
+    "checkbox": 1,
+}
+SEED_SPAN_SECONDS = 30 * 86400
+_WORDS = (
+    "alpha", "amber", "birch", "cobalt", "delta", "ember", "fjord", "granite", "harbor", "indigo",
+    "juniper", "kelp", "lumen", "maple", "nickel", "onyx", "pine", "quartz", "river", "slate",
+)  # fmt: skip
+
+
+def parse_weights(spec: str, choices: Collection[str], *, kind: str) -> dict[str, int]:
+    """Parse ``name=weight`` pairs over ``choices``; a bare name weighs 1.
+    ``kind`` names the choices in error messages."""
+    mix: dict[str, int] = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip().lower()
+        if name not in choices:
+            raise ValueError(f"unknown {kind}: {name}")
+        try:
+            mix[name] = int(weight) if weight.strip() else 1
+        except ValueError:
+            raise ValueError(f"invalid weight for {name}: {weight}") from None
+        if mix[name] < 0:
+            raise ValueError(f"invalid weight for {name}: {weight}")
+    if not any(mix.values()):
+        raise ValueError(f"{kind} mix needs at least one positive weight")
+    return mix
+
+
+def parse_field_mix(spec: str) -> dict[str, int]:
+    """Parse ``type=weight`` pairs, e.g. ``"text=3,select=2,number=1"``."""
+    from hitech_forms.services.form_service import ALLOWED_FIELD_TYPES
+
+    return parse_weights(spec, ALLOWED_FIELD_TYPES, kind="field type")
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    forms: int = 1
+    fields: int = 6
+    submissions: int = 1000
+    field_mix: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_FIELD_MIX))
+    seed: int = 0
+    batch_size: int = 10000
+    # Fraction of optional fields left blank.
+    blank_ratio: float = 0.2
+
+
+@dataclass(frozen=True)
+class SeedReport:
+    form_ids: list[int]
+    submissions: int
+    elapsed_s: float
+    rows_per_s: float
+
+
+def build_seed_fields(rng: random.Random, *, count: int, field_mix: dict[str, int]) -> list[dict[str, Any]]:
+    types = [name for name in sorted(field_mix) if field_mix[name] > 0]
+    weights = [field_mix[name] for name in types]
+    fields: list[dict[str, Any]] = []
+    for index, field_type in enumerate(rng.choices(types, weights=weights, k=count), start=1):
+        options = [f"option_{option}" for option in range(1, rng.randint(3, 6))] if field_type == "select" else []
+        fields.append(
+            {
+                "key": f"{field_type}_{index}",
+                "label": f"{field_type.title()} {index}",
+                "type": field_type,
+                "required": rng.random() < 0.5,
+                "options": options,
+            }
+        )
+    return fields
+
+
+def seed_value(rng: random.Random, field_spec: dict[str, Any], *, blank_ratio: float) -> str:
+    """A value the public submit path would have stored for ``field_spec``."""
+    field_type = field_spec["type"]
+    if field_type == "checkbox":
+        return rng.choice(("true", "false"))
+    if not field_spec["required"] and rng.random() < blank_ratio:
+        return ""
+    if field_type == "select":
+        return str(rng.choice(field_spec["options"]))
+    if field_type == "number":
+        return str(rng.randint(0, 10_000))
+    if field_type == "date":
+        return f"20{rng.randint(20, 26)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    if field_type == "email":
+        return f"{rng.choice(_WORDS)}.{rng.randint(1, 99999)}@example.com"
+    words = rng.randint(2, 12) if field_type == "textarea" else rng.randint(1, 3)
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def seed_database(config: SeedConfig) -> SeedReport:
+    """Create ``config.forms`` published forms and spread ``config.submissions``
+    across them, timestamped evenly over the ``SEED_SPAN_SECONDS`` before now."""
+    from hitech_forms.db import session_scope
+    from hitech_forms.db.repositories import FormRepository, SubmissionRepository
+    from hitech_forms.services import FormService
+
+    if config.forms < 1 or config.fields < 1 or config.submissions < 0 or config.batch_size < 1:
+        raise ValueError("forms, fields and batch size must be >= 1 and submissions >= 0")
+    began = time.perf_counter()
+    rng = random.Random(config.seed)
+    forms: list[tuple[int, int, list[dict[str, Any]]]] = []
+    with session_scope() as session:
+        service = FormService(FormRepository(session))
+        for index in range(1, config.forms + 1):
+            fields = build_seed_fields(rng, count=config.fields, field_mix=config.field_mix)
+            created = service.command_create_form(title=f"Seed Form {config.seed}-{index}")
+            service.command_replace_fields(form_id=created["id"], fields=fields)
+            published = service.command_publish_form(created["id"])
+            forms.append((int(published["id"]), int(published["active_version_id"]), fields))
+
+    end_epoch = utc_now_epoch()
+    start_epoch = end_epoch - SEED_SPAN_SECONDS
+    for position, (form_id, version_id, fields) in enumerate(forms):
+        # Split as evenly as possible; the first forms take the remainder.
+        share = config.submissions // len(forms) + (1 if position < config.submissions % len(forms) else 0)
+        for start in range(0, share, config.batch_size):
+            rows = [
+                (
+                    start_epoch + offset * SEED_SPAN_SECONDS // share,
+                    {spec["key"]: seed_value(rng, spec, blank_ratio=config.blank_ratio) for spec in fields},
+                )
+                for offset in range(start, min(start + config.batch_size, share))
+            ]
+            with session_scope() as session:
+                SubmissionRepository(session).load_submissions(
+                    form_id=form_id, form_version_id=version_id, rows=rows
+                )
+        with session_scope() as session:
+            repository = SubmissionRepository(session)
+            repository.rebuild_field_stats(form_id)
+            repository.rebuild_submission_rates(form_id)
+
+    elapsed = time.perf_counter() - began
+    return SeedReport(
+        form_ids=[form_id for form_id, _version_id, _fields in forms],
+        submissions=config.submissions,
+        elapsed_s=round(elapsed, 3),
+        rows_per_s=round(config.submissions / elapsed, 1) if elapsed else 0.0,
+    )
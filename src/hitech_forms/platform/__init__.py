@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from .determinism import canonical_json_dumps, ensure_determinism_env, freeze_clock, utc_now_epoch
 from .errors import AppError
-from .feature_flags import FeatureFlags, get_feature_flags
+from .feature_flags import FeatureFlags, get_feature_flags, reset_feature_flags_cache
 from .settings import Settings, get_settings
 from .slug import slugify, stable_slug
 
@@ -11,6 +11,7 @@ __all__ = [
     "get_settings",
     "FeatureFlags",
     "get_feature_flags",
+    "reset_feature_flags_cache",
     "canonical_json_dumps",
     "ensure_determinism_env",
     "utc_now_epoch",
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+
+from hitech_forms.platform.determinism import canonical_json_dumps
+from hitech_forms.platform.errors import bad_request
+
+
+def encode_cursor(values: tuple[int, ...]) -> str:
+    raw = canonical_json_dumps([int(value) for value in values]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(token: str, *, size: int) -> tuple[int, ...]:
+    padded = token.strip() + "=" * (-len(token.strip()) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error, UnicodeEncodeError) as exc:
+        raise bad_request("invalid cursor") from exc
+    if (
+        not isinstance(values, list)
+        or len(values) != size
+        or not all(isinstance(value, int) and not isinstance(value, bool) for value in values)
+    ):
+        raise bad_request("invalid cursor")
+    return tuple(values)
@@ -37,3 +37,7 @@ def conflict(message: str, details: dict[str, Any] | None = None) -> AppError:
 
 def rate_limited(message: str = "rate limit exceeded", details: dict[str, Any] | None = None) -> AppError:
     return AppError(code="rate_limited", message=message, status_code=429, details=details)
+
+
+def service_unavailable(message: str, details: dict[str, Any] | None = None) -> AppError:
+    return AppError(code="service_unavailable", message=message, status_code=503, details=details)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 def _env_bool(name: str, default: bool = False) -> bool:
@@ -11,7 +11,12 @@ def _env_bool(name: str, default: bool = False) -> bool:
 
 @dataclass(frozen=True)
 class FeatureFlags:
-    demo: bool = _env_bool("HFORMS_FLAG_DEMO", False)
+    demo: bool = field(default_factory=lambda: _env_bool("HFORMS_FLAG_DEMO", False))
+    submit_write_queue: bool = field(
+        default_factory=lambda: _env_bool("HFORMS_FLAG_SUBMIT_WRITE_QUEUE", False)
+    )
+    metrics: bool = field(default_factory=lambda: _env_bool("HFORMS_FLAG_METRICS", False))
+    query_profiler: bool = field(default_factory=lambda: _env_bool("HFORMS_FLAG_QUERY_PROFILER", False))
 
 
 _FLAGS: FeatureFlags | None = None
@@ -22,3 +27,8 @@ def get_feature_flags() -> FeatureFlags:
     if _FLAGS is None:
         _FLAGS = FeatureFlags()
     return _FLAGS
+
+
+def reset_feature_flags_cache() -> None:
+    global _FLAGS
+    _FLAGS = None
@@ -19,6 +19,11 @@ def log_event(logger: logging.Logger, event: str, **fields: Any) -> None:
     logger.info(canonical_json_dumps(payload))
 
 
+def log_performance_event(logger: logging.Logger, event: str, **fields: Any) -> None:
+    payload = sorted_dict({"event": event, "performance": True, "ts": utc_now_epoch(), **fields})
+    logger.warning(canonical_json_dumps(payload))
+
+
 def log_security_event(logger: logging.Logger, event: str, **fields: Any) -> None:
     payload = sorted_dict({"event": event, "security": True, "ts": utc_now_epoch(), **fields})
     logger.warning(canonical_json_dumps(payload))
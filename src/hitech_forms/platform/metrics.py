@@ -0,0 +1,288 @@
+"""In-process metrics rendered in the Prometheus text exposition format.
+
+Every metric keeps one shard per thread: the event loop and each threadpool
+worker update their own dicts without locking, and a scrape sums the shards.
+Copying a dict is a single C-level operation under the GIL, so scrapes see
+consistent shards without stopping writers. When a thread exits its shard is
+folded into a retained one, so short-lived threads do not pile up shards.
+Values are per process; with several uvicorn workers, scrape each one or
+aggregate in Prometheus.
+"""
+
+from __future__ import annotations
+
+import abc
+import math
+import threading
+import weakref
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+
+LabelValues = tuple[str, ...]
+_INF_LABEL = 'le="+Inf"'
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS: tuple[float, ...] = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0)
+_STATEMENT_VERBS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "PRAGMA", "BEGIN", "COMMIT", "ROLLBACK"})
+
+
+class _ShardHolder:
+    """Thread-local owner of a shard; collected when its thread exits."""
+
+    __slots__ = ("shard", "__weakref__")
+
+    def __init__(self) -> None:
+        self.shard: dict[LabelValues, object] = {}
+
+
+class _Sharded(abc.ABC):
+    """Base for metrics whose state lives in per-thread shards."""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._local = threading.local()
+        self._shards: list[dict[LabelValues, object]] = []
+        # Totals from shards whose threads have exited; only touched under the lock.
+        self._retired: dict[LabelValues, object] = {}
+        self._register_lock = threading.Lock()
+
+    def _shard(self) -> dict[LabelValues, object]:
+        holder: _ShardHolder | None = getattr(self._local, "holder", None)
+        if holder is None:
+            holder = _ShardHolder()
+            with self._register_lock:
+                self._shards.append(holder.shard)
+            weakref.finalize(holder, self._retire, holder.shard)
+            self._local.holder = holder
+        return holder.shard
+
+    def _retire(self, shard: dict[LabelValues, object]) -> None:
+        with self._register_lock:
+            # By identity: distinct shards with equal contents compare equal.
+            self._shards = [live for live in self._shards if live is not shard]
+            for key, value in shard.items():
+                previous = self._retired.get(key)
+                self._retired[key] = value if previous is None else self._merge(previous, value)
+
+    def _snapshots(self) -> list[dict[LabelValues, object]]:
+        with self._register_lock:
+            shards = [self._retired, *self._shards]
+            return [dict(shard) for shard in shards]
+
+    def reset(self) -> None:
+        with self._register_lock:
+            self._retired.clear()
+            for shard in self._shards:
+                shard.clear()
+
+    def _label_text(self, values: LabelValues, extra: str = "") -> str:
+        pairs = [f'{label}="{_escape(value)}"' for label, value in zip(self.labels, values, strict=True)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self._render_samples()
+
+    @abc.abstractmethod
+    def _merge(self, left: object, right: object) -> object:
+        """Combine two shard values for the same labels into a new value."""
+
+    @abc.abstractmethod
+    def _render_samples(self) -> Iterator[str]: ...
+
+
+class Counter(_Sharded):
+    kind = "counter"
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount  # type: ignore[operator]
+
+    def _merge(self, left: object, right: object) -> object:
+        return left + right  # type: ignore[operator]
+
+    def values(self) -> dict[LabelValues, float]:
+        totals: dict[LabelValues, float] = {}
+        for shard in self._snapshots():
+            for key, value in shard.items():
+                totals[key] = totals.get(key, 0.0) + value  # type: ignore[operator]
+        return totals
+
+    def _render_samples(self) -> Iterator[str]:
+        for key, value in sorted(self.values().items()):
+            yield f"{self.name}{self._label_text(key)} {_number(value)}"
+
+
+class Gauge(Counter):
+    """Up/down value; ``inc`` and ``dec`` may land on different shards."""
+
+    kind = "gauge"
+
+    def dec(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        self.inc(labels, -amount)
+
+
+class _HistogramCell:
+    __slots__ = ("buckets", "count", "total")
+
+    def __init__(self, size: int):
+        self.buckets = [0] * size
+        self.count = 0
+        self.total = 0.0
+
+
+class Histogram(_Sharded):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        shard = self._shard()
+        cell = shard.get(labels)
+        if cell is None:
+            cell = shard[labels] = _HistogramCell(len(self.buckets))
+        assert isinstance(cell, _HistogramCell)
+        # Non-cumulative per bucket; render() accumulates. Values above the
+        # last bound only show up in +Inf (the count).
+        index = bisect_left(self.buckets, value)
+        if index < len(cell.buckets):
+            cell.buckets[index] += 1
+        cell.count += 1
+        cell.total += value
+
+    def _merge(self, left: object, right: object) -> object:
+        # A fresh cell, so snapshots already holding ``left`` never see it change.
+        assert isinstance(left, _HistogramCell) and isinstance(right, _HistogramCell)
+        merged = _HistogramCell(len(self.buckets))
+        merged.buckets = [a + b for a, b in zip(left.buckets, right.buckets, strict=True)]
+        merged.count = left.count + right.count
+        merged.total = left.total + right.total
+        return merged
+
+    def snapshot(self) -> dict[LabelValues, tuple[list[int], int, float]]:
+        merged: dict[LabelValues, tuple[list[int], int, float]] = {}
+        for shard in self._snapshots():
+            for key, cell in shard.items():
+                assert isinstance(cell, _HistogramCell)
+                buckets, count, total = merged.get(key, ([0] * len(self.buckets), 0, 0.0))
+                merged[key] = (
+                    [left + right for left, right in zip(buckets, cell.buckets, strict=True)],
+                    count + cell.count,
+                    total + cell.total,
+                )
+        return merged
+
+    def _render_samples(self) -> Iterator[str]:
+        for key, (buckets, count, total) in sorted(self.snapshot().items()):
+            running = 0
+            for bound, hits in zip(self.buckets, buckets, strict=True):
+                running += hits
+                le = 'le="' + _number(bound) + '"'
+                yield f"{self.name}_bucket{self._label_text(key, le)} {running}"
+            yield f"{self.name}_bucket{self._label_text(key, _INF_LABEL)} {count}"
+            yield f"{self.name}_sum{self._label_text(key)} {_number(total)}"
+            yield f"{self.name}_count{self._label_text(key)} {count}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Sharded] = {}
+
+    def register(self, metric: _Sharded) -> _Sharded:
+        if metric.name in self._metrics:
+            raise ValueError(f"metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, help_text, labels)
+        self.register(metric)
+        return metric
+
+    def gauge(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Gauge:
+        metric = Gauge(name, help_text, labels)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self, name: str, help_text: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        metric = Histogram(name, help_text, labels, buckets)
+        self.register(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.reset()
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "hforms_http_requests_total", "HTTP requests by method, route template and status.", ("method", "route", "status")
+)
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "hforms_http_request_duration_seconds", "HTTP request latency until the response completes.", ("method", "route")
+)
+HTTP_IN_FLIGHT = REGISTRY.gauge("hforms_http_requests_in_flight", "HTTP requests currently being served.")
+DB_QUERIES = REGISTRY.counter("hforms_db_queries_total", "SQL statements executed, by verb.", ("verb",))
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    "hforms_db_query_duration_seconds", "SQL statement execution time, by verb.", ("verb",), DB_BUCKETS
+)
+TEMPLATE_RENDER_SECONDS = REGISTRY.histogram(
+    "hforms_template_render_duration_seconds", "Jinja2 template render time.", ("template",), DB_BUCKETS
+)
+EXPORT_BYTES = REGISTRY.counter("hforms_export_bytes_total", "Export bytes streamed to clients.", ("format",))
+
+
+def statement_verb(statement: str) -> str:
+    """Leading SQL keyword, bounded to a fixed set so labels stay low-cardinality."""
+    head = statement[:32].split(None, 1)
+    verb = head[0].upper() if head else ""
+    return verb if verb in _STATEMENT_VERBS else "OTHER"
+
+
+def count_bytes(chunks: Iterable[bytes], counter: Counter, labels: LabelValues) -> Iterator[bytes]:
+    """Pass ``chunks`` through, adding each one's size to ``counter``."""
+    for chunk in chunks:
+        counter.inc(labels, len(chunk))
+        yield chunk
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
+
+
+def reset_metrics() -> None:
+    REGISTRY.reset()
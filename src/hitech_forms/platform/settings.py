@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import importlib.util
 import os
 from dataclasses import dataclass
 from pathlib import Path
 
+SQLITE_PROFILES = ("wal", "legacy")
+COMPRESSION_ENCODINGS = ("zstd", "br", "gzip")
+ANSWER_STORAGE_MODES = ("rows", "packed")
+DB_DRIVERS = ("sync", "async")
+RATE_LIMIT_BACKENDS = ("memory", "sqlite")
+RATE_LIMIT_ALGORITHMS = ("sliding_window", "token_bucket")
+
 
 @dataclass(frozen=True)
 class Settings:
@@ -13,7 +21,34 @@ class Settings:
     admin_token: str
     timezone: str
     rate_limit_per_minute: int
+    public_submit_rate_limit_per_minute: int
+    rate_limit_backend: str
+    rate_limit_algorithm: str
+    rate_limit_max_keys: int
+    rate_limit_db_path: str
     log_level: str
+    validator_cache_size: int
+    public_form_cache_size: int
+    public_form_cache_ttl_seconds: int
+    sqlite_profile: str
+    sqlite_busy_timeout_ms: int
+    sqlite_cache_size_kib: int
+    sqlite_mmap_size_bytes: int
+    db_pool_size: int
+    db_max_overflow: int
+    write_queue_max_batch: int
+    write_queue_max_delay_ms: int
+    export_shards: int
+    export_shard_min_rows: int
+    export_artifact_dir: str
+    export_artifact_refresh_seconds: int
+    compression_encodings: tuple[str, ...]
+    compression_min_bytes: int
+    answer_storage: str
+    db_driver: str
+    query_profiler_max_queries: int
+    query_profiler_repeat_threshold: int
+    query_profiler_slow_ms: int
 
 
 _SETTINGS: Settings | None = None
@@ -35,7 +70,38 @@ def _load_settings() -> Settings:
         admin_token=os.getenv("HFORMS_ADMIN_TOKEN", "").strip(),
         timezone=os.getenv("HFORMS_TIMEZONE", "UTC").strip().upper(),
         rate_limit_per_minute=_env_int("HFORMS_RATE_LIMIT_PER_MINUTE", 300),
+        public_submit_rate_limit_per_minute=_env_int("HFORMS_PUBLIC_SUBMIT_RATE_LIMIT_PER_MINUTE", 60),
+        rate_limit_backend=os.getenv("HFORMS_RATE_LIMIT_BACKEND", "memory").strip().lower(),
+        rate_limit_algorithm=os.getenv("HFORMS_RATE_LIMIT_ALGORITHM", "sliding_window").strip().lower(),
+        rate_limit_max_keys=_env_int("HFORMS_RATE_LIMIT_MAX_KEYS", 100000),
+        rate_limit_db_path=os.getenv("HFORMS_RATE_LIMIT_DB_PATH", "var/rate_limits.db").strip(),
         log_level=os.getenv("HFORMS_LOG_LEVEL", "INFO").strip().upper(),
+        validator_cache_size=_env_int("HFORMS_VALIDATOR_CACHE_SIZE", 256),
+        public_form_cache_size=_env_int("HFORMS_PUBLIC_FORM_CACHE_SIZE", 512),
+        public_form_cache_ttl_seconds=_env_int("HFORMS_PUBLIC_FORM_CACHE_TTL_SECONDS", 60),
+        sqlite_profile=os.getenv("HFORMS_SQLITE_PROFILE", "wal").strip().lower(),
+        sqlite_busy_timeout_ms=_env_int("HFORMS_SQLITE_BUSY_TIMEOUT_MS", 5000),
+        sqlite_cache_size_kib=_env_int("HFORMS_SQLITE_CACHE_SIZE_KIB", 65536),
+        sqlite_mmap_size_bytes=_env_int("HFORMS_SQLITE_MMAP_SIZE_BYTES", 268435456),
+        db_pool_size=_env_int("HFORMS_DB_POOL_SIZE", 8),
+        db_max_overflow=_env_int("HFORMS_DB_MAX_OVERFLOW", 32),
+        write_queue_max_batch=_env_int("HFORMS_WRITE_QUEUE_MAX_BATCH", 256),
+        write_queue_max_delay_ms=_env_int("HFORMS_WRITE_QUEUE_MAX_DELAY_MS", 2),
+        export_shards=_env_int("HFORMS_EXPORT_SHARDS", 1),
+        export_shard_min_rows=_env_int("HFORMS_EXPORT_SHARD_MIN_ROWS", 100000),
+        export_artifact_dir=os.getenv("HFORMS_EXPORT_ARTIFACT_DIR", "var/exports").strip(),
+        export_artifact_refresh_seconds=_env_int("HFORMS_EXPORT_ARTIFACT_REFRESH_SECONDS", 0),
+        compression_encodings=tuple(
+            item.strip().lower()
+            for item in os.getenv("HFORMS_COMPRESSION_ENCODINGS", ",".join(COMPRESSION_ENCODINGS)).split(",")
+            if item.strip()
+        ),
+        compression_min_bytes=_env_int("HFORMS_COMPRESSION_MIN_BYTES", 1024),
+        answer_storage=os.getenv("HFORMS_ANSWER_STORAGE", "rows").strip().lower(),
+        db_driver=os.getenv("HFORMS_DB_DRIVER", "sync").strip().lower(),
+        query_profiler_max_queries=_env_int("HFORMS_QUERY_PROFILER_MAX_QUERIES", 25),
+        query_profiler_repeat_threshold=_env_int("HFORMS_QUERY_PROFILER_REPEAT_THRESHOLD", 5),
+        query_profiler_slow_ms=_env_int("HFORMS_QUERY_PROFILER_SLOW_MS", 50),
     )
 
 
@@ -48,6 +114,52 @@ def validate_settings(settings: Settings) -> None:
     db_parent.mkdir(parents=True, exist_ok=True)
     if settings.rate_limit_per_minute < 1:
         raise RuntimeError("HFORMS_RATE_LIMIT_PER_MINUTE must be >= 1.")
+    if settings.public_submit_rate_limit_per_minute < 1:
+        raise RuntimeError("HFORMS_PUBLIC_SUBMIT_RATE_LIMIT_PER_MINUTE must be >= 1.")
+    if settings.rate_limit_backend not in RATE_LIMIT_BACKENDS:
+        raise RuntimeError(f"HFORMS_RATE_LIMIT_BACKEND must be one of: {', '.join(RATE_LIMIT_BACKENDS)}.")
+    if settings.rate_limit_algorithm not in RATE_LIMIT_ALGORITHMS:
+        raise RuntimeError(f"HFORMS_RATE_LIMIT_ALGORITHM must be one of: {', '.join(RATE_LIMIT_ALGORITHMS)}.")
+    if settings.rate_limit_max_keys < 1:
+        raise RuntimeError("HFORMS_RATE_LIMIT_MAX_KEYS must be >= 1.")
+    if settings.validator_cache_size < 1:
+        raise RuntimeError("HFORMS_VALIDATOR_CACHE_SIZE must be >= 1.")
+    if settings.public_form_cache_size < 1:
+        raise RuntimeError("HFORMS_PUBLIC_FORM_CACHE_SIZE must be >= 1.")
+    if settings.public_form_cache_ttl_seconds < 0:
+        raise RuntimeError("HFORMS_PUBLIC_FORM_CACHE_TTL_SECONDS must be >= 0.")
+    if settings.sqlite_profile not in SQLITE_PROFILES:
+        raise RuntimeError(f"HFORMS_SQLITE_PROFILE must be one of: {', '.join(SQLITE_PROFILES)}.")
+    if settings.sqlite_busy_timeout_ms < 0:
+        raise RuntimeError("HFORMS_SQLITE_BUSY_TIMEOUT_MS must be >= 0.")
+    if settings.db_pool_size < 1 or settings.db_max_overflow < 0:
+        raise RuntimeError("HFORMS_DB_POOL_SIZE must be >= 1 and HFORMS_DB_MAX_OVERFLOW >= 0.")
+    if settings.write_queue_max_batch < 1 or settings.write_queue_max_delay_ms < 0:
+        raise RuntimeError(
+            "HFORMS_WRITE_QUEUE_MAX_BATCH must be >= 1 and HFORMS_WRITE_QUEUE_MAX_DELAY_MS >= 0."
+        )
+
+    if settings.export_shards < 1 or settings.export_shard_min_rows < 1:
+        raise RuntimeError("HFORMS_EXPORT_SHARDS and HFORMS_EXPORT_SHARD_MIN_ROWS must be >= 1.")
+    if settings.export_artifact_refresh_seconds < 0:
+        raise RuntimeError("HFORMS_EXPORT_ARTIFACT_REFRESH_SECONDS must be >= 0.")
+    unknown_encodings = set(settings.compression_encodings) - set(COMPRESSION_ENCODINGS)
+    if unknown_encodings:
+        raise RuntimeError(f"HFORMS_COMPRESSION_ENCODINGS supports only: {', '.join(COMPRESSION_ENCODINGS)}.")
+    if settings.compression_min_bytes < 0:
+        raise RuntimeError("HFORMS_COMPRESSION_MIN_BYTES must be >= 0.")
+    if settings.answer_storage not in ANSWER_STORAGE_MODES:
+        raise RuntimeError(f"HFORMS_ANSWER_STORAGE must be one of: {', '.join(ANSWER_STORAGE_MODES)}.")
+    if settings.db_driver not in DB_DRIVERS:
+        raise RuntimeError(f"HFORMS_DB_DRIVER must be one of: {', '.join(DB_DRIVERS)}.")
+    if settings.db_driver == "async" and importlib.util.find_spec("aiosqlite") is None:
+        raise RuntimeError("HFORMS_DB_DRIVER=async requires the optional 'aiosqlite' package.")
+    if settings.query_profiler_max_queries < 1:
+        raise RuntimeError("HFORMS_QUERY_PROFILER_MAX_QUERIES must be >= 1.")
+    if settings.query_profiler_repeat_threshold < 2:
+        raise RuntimeError("HFORMS_QUERY_PROFILER_REPEAT_THRESHOLD must be >= 2.")
+    if settings.query_profiler_slow_ms < 0:
+        raise RuntimeError("HFORMS_QUERY_PROFILER_SLOW_MS must be >= 0.")
 
 
 def get_settings() -> Settings:
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import asdict
+from typing import Any
+
+from hitech_forms.contracts import (
+    FormServicePort,
+    PublicFormDocument,
+    SessionRunnerPort,
+    SubmissionServicePort,
+    SubmissionWriterPort,
+)
+from hitech_forms.platform.determinism import utc_now_epoch
+from hitech_forms.platform.slug import slugify
+from hitech_forms.services.public_form_cache import PublishedFormCache, get_public_form_cache
+
+
+class AsyncFormService:
+    """Awaitable public-form queries on top of the sync ``FormService``.
+
+    Cached documents are answered on the event loop without touching the
+    database; misses run the sync service through the session runner.
+    """
+
+    def __init__(
+        self,
+        runner: SessionRunnerPort,
+        build: Callable[[Any], FormServicePort],
+        public_form_cache: PublishedFormCache | None = None,
+    ):
+        self._runner = runner
+        self._build = build
+        self._public_forms = public_form_cache or get_public_form_cache()
+
+    async def query_public_form(self, slug: str) -> dict[str, Any]:
+        return (await self.query_public_form_document(slug)).detail
+
+    async def query_public_form_document(self, slug: str) -> PublicFormDocument:
+        cached = self._public_forms.get(slugify(slug))
+        if cached is not None:
+            return cached
+        return await self._runner.run(lambda session: self._build(session).query_public_form_document(slug))
+
+    def cached_public_form_rendering(self, document: PublicFormDocument, variant: str) -> bytes | None:
+        """Rendered ``variant`` if cached; cheap enough to call on the event loop."""
+        return self._public_forms.get_rendering(document, variant)
+
+    def render_public_form(
+        self, document: PublicFormDocument, variant: str, render: Callable[[], bytes]
+    ) -> bytes:
+        return self._public_forms.get_or_render(document, variant, render)
+
+
+class AsyncSubmissionService:
+    """Awaitable public submit on top of the sync ``SubmissionService``.
+
+    With a write queue the handler only holds a session while validating and
+    then awaits the queue's commit future instead of blocking a thread on it.
+    """
+
+    def __init__(
+        self,
+        runner: SessionRunnerPort,
+        build: Callable[[Any], SubmissionServicePort],
+        writer: SubmissionWriterPort | None = None,
+    ):
+        self._runner = runner
+        self._build = build
+        self._writer = writer
+
+    async def command_submit_public(self, *, slug: str, values: dict[str, str]) -> dict[str, Any]:
+        writer = self._writer
+        if writer is None:
+            return await self._runner.run(
+                lambda session: self._build(session).command_submit_public(slug=slug, values=values)
+            )
+        prepared = await self._runner.run(
+            lambda session: self._build(session).prepare_public_submission(slug=slug, values=values)
+        )
+        # Shielded: a cancelled request must not cancel a write the queue may
+        # already be committing, or report a stored row as failed.
+        summary = await asyncio.shield(asyncio.wrap_future(writer.enqueue(**prepared, now_epoch=utc_now_epoch())))
+        return asdict(summary)
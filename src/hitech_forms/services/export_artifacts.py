@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterable
+from dataclasses import asdict
+from pathlib import Path
+
+from hitech_forms.contracts import ExportArtifact
+from hitech_forms.platform.settings import get_settings
+
+
+class ExportArtifactStore:
+    """Gzip-compressed CSV snapshots per form, plus a JSON manifest each.
+
+    A snapshot is a multi-member gzip file: the first member holds the header
+    and the rows present at build time, every incremental refresh adds one
+    member with the newer rows. Files are never modified in place; each
+    refresh writes a sibling temp file and ``os.replace``s it, so a response
+    that is already streaming keeps reading a complete file.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+        self._lock = threading.Lock()
+
+    @property
+    def lock(self) -> threading.Lock:
+        return self._lock
+
+    def data_path(self, form_id: int) -> Path:
+        return self._root / f"form_{form_id}.csv.gz"
+
+    def manifest_path(self, form_id: int) -> Path:
+        return self._root / f"form_{form_id}.json"
+
+    def get(self, form_id: int) -> ExportArtifact | None:
+        try:
+            raw = json.loads(self.manifest_path(form_id).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        artifact = ExportArtifact(
+            form_id=int(raw["form_id"]),
+            path=str(self.data_path(form_id)),
+            field_keys=tuple(raw["field_keys"]),
+            rows=int(raw["rows"]),
+            high_water_seq=int(raw["high_water_seq"]),
+            high_water_id=int(raw["high_water_id"]),
+            size_bytes=int(raw["size_bytes"]),
+        )
+        if not Path(artifact.path).is_file():
+            return None
+        return artifact
+
+    def write(
+        self,
+        *,
+        form_id: int,
+        chunks: Iterable[bytes],
+        field_keys: tuple[str, ...],
+        rows: int,
+        high_water_seq: int,
+        high_water_id: int,
+        append: bool,
+    ) -> ExportArtifact:
+        """Write a new gzip member (appended to a copy of the current file when
+        ``append`` is set) and publish it together with its manifest."""
+        self._root.mkdir(parents=True, exist_ok=True)
+        target = self.data_path(form_id)
+        fd, tmp_name = tempfile.mkstemp(dir=self._root, prefix=f".form_{form_id}.", suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            if append:
+                shutil.copyfile(target, tmp_path)
+            with open(tmp_path, "ab") as handle:
+                with gzip.GzipFile(filename="", mode="wb", fileobj=handle, mtime=0) as member:
+                    for chunk in chunks:
+                        member.write(chunk)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        artifact = ExportArtifact(
+            form_id=form_id,
+            path=str(target),
+            field_keys=field_keys,
+            rows=rows,
+            high_water_seq=high_water_seq,
+            high_water_id=high_water_id,
+            size_bytes=target.stat().st_size,
+        )
+        self._write_manifest(artifact)
+        return artifact
+
+    def _write_manifest(self, artifact: ExportArtifact) -> None:
+        payload = asdict(artifact)
+        payload.pop("path")
+        payload["field_keys"] = list(artifact.field_keys)
+        fd, tmp_name = tempfile.mkstemp(dir=self._root, prefix=f".form_{artifact.form_id}.", suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, sort_keys=True, separators=(",", ":"))
+        os.replace(tmp_name, self.manifest_path(artifact.form_id))
+
+
+_ARTIFACT_STORE: ExportArtifactStore | None = None
+
+
+def get_export_artifact_store() -> ExportArtifactStore:
+    global _ARTIFACT_STORE
+    if _ARTIFACT_STORE is None:
+        _ARTIFACT_STORE = ExportArtifactStore(Path(get_settings().export_artifact_dir))
+    return _ARTIFACT_STORE
+
+
+def reset_export_artifact_store() -> None:
+    global _ARTIFACT_STORE
+    _ARTIFACT_STORE = None
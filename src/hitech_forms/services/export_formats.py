@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import csv
+import importlib
+import importlib.util
+import io
+import re
+import zipfile
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
+from typing import Any
+from xml.sax.saxutils import escape
+
+from hitech_forms.platform.determinism import canonical_json_dumps
+from hitech_forms.platform.errors import bad_request
+
+ExportRow = tuple[int, int, str | None, str | None]
+ExportRecord = tuple[int, int, list[str]]
+Encoder = Callable[[Sequence[str], Iterable[ExportRecord], int], Iterator[bytes]]
+
+ARROW_BATCH_ROWS = 65536
+XLSX_MAX_DATA_ROWS = 1_048_575
+
+_submission_key = itemgetter(0, 1)
+
+
+def pivot_export_rows(field_keys: Sequence[str], rows: Iterable[ExportRow]) -> Iterator[ExportRecord]:
+    """Fold ordered answer tuples into one record per submission."""
+    for (submission_id, created_at), answers in groupby(rows, key=_submission_key):
+        answer_map = {key: value for _sid, _created, key, value in answers if key is not None}
+        yield submission_id, created_at, [answer_map.get(key) or "" for key in field_keys]
+
+
+def encode_csv(
+    field_keys: Sequence[str], records: Iterable[ExportRecord], chunk_bytes: int, *, header: bool = True
+) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(["submission_id", "created_at", *field_keys])
+    for submission_id, created_at, values in records:
+        writer.writerow([str(submission_id), str(created_at), *values])
+        if buffer.tell() >= chunk_bytes:
+            yield _drain_text(buffer)
+    if buffer.tell():
+        yield _drain_text(buffer)
+
+
+def encode_ndjson(field_keys: Sequence[str], records: Iterable[ExportRecord], chunk_bytes: int) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    for submission_id, created_at, values in records:
+        line = {
+            "submission_id": submission_id,
+            "created_at": created_at,
+            "answers": dict(zip(field_keys, values, strict=True)),
+        }
+        buffer.write(canonical_json_dumps(line))
+        buffer.write("\n")
+        if buffer.tell() >= chunk_bytes:
+            yield _drain_text(buffer)
+    if buffer.tell():
+        yield _drain_text(buffer)
+
+
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    "</Types>"
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Submissions" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    "</Relationships>"
+)
+_XLSX_SHEET_OPEN = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_XLSX_SHEET_CLOSE = "</sheetData></worksheet>"
+_XML_ILLEGAL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+class _ByteSink:
+    """Write-only, non-seekable target so ``zipfile`` emits data descriptors."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def drain(self) -> bytes:
+        drained = b"".join(self._chunks)
+        self._chunks.clear()
+        return drained
+
+
+def _zip_entry(name: str) -> zipfile.ZipInfo:
+    # Fixed timestamp and attributes keep the archive byte-identical across runs.
+    info = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o644 << 16
+    return info
+
+
+def _xlsx_text_cell(value: str) -> str:
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{escape(_XML_ILLEGAL.sub("", value))}</t></is></c>'
+
+
+def _xlsx_row(cells: Iterable[str]) -> str:
+    return f"<row>{''.join(cells)}</row>"
+
+
+def encode_xlsx(field_keys: Sequence[str], records: Iterable[ExportRecord], chunk_bytes: int) -> Iterator[bytes]:
+    sink = _ByteSink()
+    with zipfile.ZipFile(sink, mode="w") as archive:  # type: ignore[call-overload]
+        archive.writestr(_zip_entry("[Content_Types].xml"), _XLSX_CONTENT_TYPES)
+        archive.writestr(_zip_entry("_rels/.rels"), _XLSX_ROOT_RELS)
+        archive.writestr(_zip_entry("xl/workbook.xml"), _XLSX_WORKBOOK)
+        archive.writestr(_zip_entry("xl/_rels/workbook.xml.rels"), _XLSX_WORKBOOK_RELS)
+        with archive.open(_zip_entry("xl/worksheets/sheet1.xml"), mode="w", force_zip64=True) as sheet:
+            buffer = io.StringIO()
+            buffer.write(_XLSX_SHEET_OPEN)
+            buffer.write(_xlsx_row(_xlsx_text_cell(key) for key in ["submission_id", "created_at", *field_keys]))
+            for submission_id, created_at, values in records:
+                buffer.write(
+                    _xlsx_row(
+                        [
+                            f"<c><v>{submission_id}</v></c>",
+                            f"<c><v>{created_at}</v></c>",
+                            *(_xlsx_text_cell(value) for value in values),
+                        ]
+                    )
+                )
+                if buffer.tell() >= chunk_bytes:
+                    sheet.write(_drain_text(buffer))
+                    if drained := sink.drain():
+                        yield drained
+            buffer.write(_XLSX_SHEET_CLOSE)
+            sheet.write(_drain_text(buffer))
+    yield sink.drain()
+
+
+def encode_arrow(field_keys: Sequence[str], records: Iterable[ExportRecord], chunk_bytes: int) -> Iterator[bytes]:
+    """Arrow IPC stream: schema message, one record batch per slice, end-of-stream marker."""
+    pa: Any = importlib.import_module("pyarrow")
+    schema = pa.schema(
+        [
+            ("submission_id", pa.int64()),
+            ("created_at", pa.int64()),
+            *((key, pa.string()) for key in field_keys),
+        ]
+    )
+    yield schema.serialize().to_pybytes()
+    columns: list[list[Any]] = [[] for _ in range(len(field_keys) + 2)]
+    for submission_id, created_at, values in records:
+        columns[0].append(submission_id)
+        columns[1].append(created_at)
+        for column, value in zip(columns[2:], values, strict=True):
+            column.append(value)
+        if len(columns[0]) >= ARROW_BATCH_ROWS:
+            yield pa.record_batch(columns, schema=schema).serialize().to_pybytes()
+            columns = [[] for _ in columns]
+    if columns[0]:
+        yield pa.record_batch(columns, schema=schema).serialize().to_pybytes()
+    yield b"\xff\xff\xff\xff\x00\x00\x00\x00"
+
+
+def _drain_text(buffer: io.StringIO) -> bytes:
+    data = buffer.getvalue().encode("utf-8")
+    buffer.seek(0)
+    buffer.truncate(0)
+    return data
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    name: str
+    media_type: str
+    encode: Encoder
+    requires_module: str | None = None
+    max_rows: int | None = None
+
+    def ensure_available(self) -> None:
+        if self.requires_module and importlib.util.find_spec(self.requires_module) is None:
+            raise bad_request(
+                f"export format '{self.name}' requires the optional '{self.requires_module}' package"
+            )
+
+
+EXPORT_FORMATS: dict[str, ExportFormat] = {
+    "csv": ExportFormat("csv", "text/csv; charset=utf-8", encode_csv),
+    "ndjson": ExportFormat("ndjson", "application/x-ndjson; charset=utf-8", encode_ndjson),
+    "xlsx": ExportFormat(
+        "xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        encode_xlsx,
+        max_rows=XLSX_MAX_DATA_ROWS,
+    ),
+    "arrow": ExportFormat(
+        "arrow", "application/vnd.apache.arrow.stream", encode_arrow, requires_module="pyarrow"
+    ),
+}
+
+
+def get_export_format(name: str) -> ExportFormat:
+    export_format = EXPORT_FORMATS.get(name)
+    if export_format is None:
+        raise bad_request("unsupported export format")
+    return export_format
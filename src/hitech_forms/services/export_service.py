@@ -1,48 +1,223 @@
 from __future__ import annotations
 
-import csv
-import io
-from collections.abc import Iterator
+import tempfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from typing import IO
 
 from hitech_forms.contracts import (
     EXPORT_VERSION_V1,
-    FIELD_ORDER,
+    ExportArtifact,
+    ExportStream,
     FormRepositoryPort,
     SubmissionRepositoryPort,
 )
 from hitech_forms.platform.errors import bad_request
+from hitech_forms.services.export_artifacts import ExportArtifactStore
+from hitech_forms.services.export_formats import encode_csv, get_export_format, pivot_export_rows
+
+EXPORT_CHUNK_BYTES = 64 * 1024
+EXPORT_FETCH_BATCH = 5000
+
+ShardReader = Callable[[], AbstractContextManager[SubmissionRepositoryPort]]
 
 
 class ExportService:
-    def __init__(self, form_repo: FormRepositoryPort, submission_repo: SubmissionRepositoryPort):
+    def __init__(
+        self,
+        form_repo: FormRepositoryPort,
+        submission_repo: SubmissionRepositoryPort,
+        *,
+        chunk_bytes: int = EXPORT_CHUNK_BYTES,
+        fetch_batch: int = EXPORT_FETCH_BATCH,
+        shard_reader: ShardReader | None = None,
+        shards: int = 1,
+        shard_min_rows: int = 1,
+        artifacts: ExportArtifactStore | None = None,
+    ):
         self._form_repo = form_repo
         self._submission_repo = submission_repo
+        self._chunk_bytes = chunk_bytes
+        self._fetch_batch = fetch_batch
+        self._shard_reader = shard_reader
+        self._shards = shards
+        self._shard_min_rows = shard_min_rows
+        self._artifacts = artifacts
+
+    def stream_form_csv(self, *, form_id: int, export_version: str = "v1") -> Iterator[bytes]:
+        return self.stream_form_export(
+            form_id=form_id, export_format="csv", export_version=export_version
+        ).chunks
 
-    def stream_form_csv(self, *, form_id: int, export_version: str = "v1") -> Iterator[str]:
+    def stream_form_export(
+        self,
+        *,
+        form_id: int,
+        export_format: str,
+        export_version: str = "v1",
+        since_seq: int | None = None,
+        since_id: int | None = None,
+    ) -> ExportStream:
         if export_version != EXPORT_VERSION_V1:
             raise bad_request("unsupported export version")
-        form = self._form_repo.get_form(form_id)
-        version = self._form_repo.get_active_version(form)
-        fields = self._form_repo.get_fields_for_version(version.id)
-        ordered_field_keys = [
-            field.field_key
-            for field in sorted(fields, key=lambda x: (getattr(x, FIELD_ORDER[0]), getattr(x, FIELD_ORDER[1])))
+        if (since_seq is not None and since_seq < 0) or (since_id is not None and since_id < 0):
+            raise bad_request("since_seq and since_id must be >= 0")
+        spec = get_export_format(export_format)
+        spec.ensure_available()
+        form, _version, fields = self._form_repo.get_active_form(form_id)
+        ordered_field_keys = [field.field_key for field in fields]
+        if spec.max_rows is not None and self._submission_repo.count_submissions(form.id) > spec.max_rows:
+            raise bad_request(f"export format '{spec.name}' is limited to {spec.max_rows} submissions")
+        # The export is bounded by the high-water mark read up front, so rows
+        # committed while streaming are left for the next incremental call.
+        high_water_seq, high_water_id = self._submission_repo.export_high_water(form.id)
+        incremental = since_seq is not None or since_id is not None
+        split_keys = self._plan_shards(form.id) if spec.name == "csv" and not incremental else []
+        if self._shard_reader is not None and split_keys:
+            chunks = self._encode_sharded(
+                self._shard_reader, form.id, ordered_field_keys, split_keys, high_water_seq
+            )
+        else:
+            rows = self._submission_repo.iter_export_rows(
+                form_id=form.id,
+                field_keys=ordered_field_keys,
+                batch_size=self._fetch_batch,
+                since_seq=since_seq,
+                since_id=since_id,
+                max_seq=high_water_seq,
+            )
+            records = pivot_export_rows(ordered_field_keys, rows)
+            chunks = spec.encode(ordered_field_keys, records, self._chunk_bytes)
+        return ExportStream(
+            filename=f"form_{form.id}.{spec.name}",
+            media_type=spec.media_type,
+            chunks=chunks,
+            high_water_seq=high_water_seq,
+            high_water_id=high_water_id,
+        )
+
+    def get_csv_artifact(self, form_id: int) -> ExportArtifact | None:
+        form = self._form_repo.get_form_summary(form_id)
+        return self._require_artifacts().get(form.id)
+
+    def refresh_csv_artifact(self, *, form_id: int, rebuild: bool = False) -> ExportArtifact:
+        artifacts = self._require_artifacts()
+        form, _version, fields = self._form_repo.get_active_form(form_id)
+        field_keys = tuple(field.field_key for field in fields)
+        with artifacts.lock:
+            high_water_seq, high_water_id = self._submission_repo.export_high_water(form.id)
+            total = self._submission_repo.count_export_rows(form.id, max_seq=high_water_seq)
+            current = None if rebuild else artifacts.get(form.id)
+            since_seq: int | None = None
+            if current is not None and current.field_keys == field_keys:
+                if (current.high_water_seq, current.rows) == (high_water_seq, total):
+                    return current
+                fresh = self._submission_repo.count_export_rows(
+                    form.id, since_seq=current.high_water_seq, max_seq=high_water_seq
+                )
+                # Deletions below the old high-water mark cannot be expressed as
+                # an append; fall back to a full rebuild.
+                if current.rows + fresh == total:
+                    since_seq = current.high_water_seq
+            rows = self._submission_repo.iter_export_rows(
+                form_id=form.id,
+                field_keys=field_keys,
+                batch_size=self._fetch_batch,
+                since_seq=since_seq,
+                max_seq=high_water_seq,
+            )
+            return artifacts.write(
+                form_id=form.id,
+                chunks=encode_csv(
+                    field_keys,
+                    pivot_export_rows(field_keys, rows),
+                    self._chunk_bytes,
+                    header=since_seq is None,
+                ),
+                field_keys=field_keys,
+                rows=total,
+                high_water_seq=high_water_seq,
+                high_water_id=high_water_id,
+                append=since_seq is not None,
+            )
+
+    def refresh_csv_artifacts(self, *, rebuild: bool = False) -> list[ExportArtifact]:
+        return [
+            self.refresh_csv_artifact(form_id=form_id, rebuild=rebuild)
+            for form_id in self._submission_repo.list_form_ids_with_submissions()
         ]
-        header = ["submission_id", "created_at", *ordered_field_keys]
-
-        buffer = io.StringIO()
-        writer = csv.writer(buffer, lineterminator="\n")
-        writer.writerow(header)
-        yield buffer.getvalue()
-        buffer.seek(0)
-        buffer.truncate(0)
-
-        for submission in self._submission_repo.iter_submissions_for_export(form.id):
-            answer_map = {answer.field_key: answer.value_text for answer in submission.answers}
-            row = [str(submission.id), str(submission.created_at)]
-            for key in ordered_field_keys:
-                row.append(answer_map.get(key, ""))
-            writer.writerow(row)
-            yield buffer.getvalue()
-            buffer.seek(0)
-            buffer.truncate(0)
+
+    def _require_artifacts(self) -> ExportArtifactStore:
+        if self._artifacts is None:
+            raise bad_request("export snapshots are not configured")
+        return self._artifacts
+
+    def _plan_shards(self, form_id: int) -> list[tuple[int, int]]:
+        if self._shard_reader is None or self._shards < 2:
+            return []
+        if self._submission_repo.count_submissions(form_id) < max(self._shard_min_rows, self._shards):
+            return []
+        return self._submission_repo.export_split_keys(form_id=form_id, parts=self._shards)
+
+    def _encode_sharded(
+        self,
+        reader: ShardReader,
+        form_id: int,
+        field_keys: list[str],
+        split_keys: list[tuple[int, int]],
+        max_seq: int,
+    ) -> Iterator[bytes]:
+        # Shard i covers (split_keys[i-1], split_keys[i]] on separate read-only
+        # connections, the last one everything after the final key up to
+        # max_seq; finished shards are spooled and replayed strictly in order,
+        # so the concatenation equals the serial export.
+        yield from encode_csv(field_keys, (), self._chunk_bytes)
+        bounds = list(zip([None, *split_keys], [*split_keys, None], strict=True))
+        executor = ThreadPoolExecutor(max_workers=len(bounds), thread_name_prefix="hforms-export")
+        futures: list[Future[IO[bytes]]] = [
+            executor.submit(self._spool_shard, reader, form_id, field_keys, after, until, max_seq)
+            for after, until in bounds
+        ]
+        try:
+            for future in futures:
+                with future.result() as spool:
+                    spool.seek(0)
+                    while chunk := spool.read(self._chunk_bytes):
+                        yield chunk
+        finally:
+            for future in futures:
+                if future.cancel():
+                    continue
+                if future.exception() is None:
+                    future.result().close()
+            executor.shutdown(wait=True)
+
+    def _spool_shard(
+        self,
+        reader: ShardReader,
+        form_id: int,
+        field_keys: list[str],
+        after: tuple[int, int] | None,
+        until: tuple[int, int] | None,
+        max_seq: int,
+    ) -> IO[bytes]:
+        # Ownership passes to the caller, which replays and closes the spool.
+        spool = tempfile.SpooledTemporaryFile(max_size=self._chunk_bytes * 64)  # noqa: SIM115
+        try:
+            with reader() as repo:
+                rows = repo.iter_export_rows(
+                    form_id=form_id,
+                    field_keys=field_keys,
+                    batch_size=self._fetch_batch,
+                    after=after,
+                    until=until,
+                    max_seq=max_seq,
+                )
+                records = pivot_export_rows(field_keys, rows)
+                for chunk in encode_csv(field_keys, records, self._chunk_bytes, header=False):
+                    spool.write(chunk)
+        except BaseException:
+            spool.close()
+            raise
+        return spool
@@ -1,40 +1,58 @@
 from __future__ import annotations
 
+import hashlib
 import json
+from collections.abc import Callable
 from dataclasses import asdict
 
 from hitech_forms.contracts import (
     FIELD_ORDER,
+    FORM_LIST_ORDER,
     FieldDTO,
     FormDetailDTO,
     FormRepositoryPort,
     FormSummaryDTO,
+    PublicFormDocument,
 )
-from hitech_forms.db.models import Field, Form
-from hitech_forms.platform.determinism import stable_sorted, utc_now_epoch
+from hitech_forms.db.models import Field, Form, FormVersion
+from hitech_forms.platform.determinism import canonical_json_dumps, stable_sorted, utc_now_epoch
 from hitech_forms.platform.errors import bad_request, conflict, not_found
 from hitech_forms.platform.slug import slugify, stable_slug
+from hitech_forms.services.pagination import build_page, resolve_page_request
+from hitech_forms.services.public_form_cache import PublishedFormCache, get_public_form_cache
+from hitech_forms.services.submission_validation import (
+    SubmissionValidatorCache,
+    get_submission_validator_cache,
+)
 
 ALLOWED_FIELD_TYPES = {"text", "textarea", "number", "email", "select", "checkbox", "date"}
 
 
 class FormService:
-    def __init__(self, form_repo: FormRepositoryPort):
+    def __init__(
+        self,
+        form_repo: FormRepositoryPort,
+        validator_cache: SubmissionValidatorCache | None = None,
+        public_form_cache: PublishedFormCache | None = None,
+    ):
         self._form_repo = form_repo
-
-    def query_list_forms(self, *, page: int, page_size: int) -> dict:
-        safe_page = 1 if page < 1 else page
-        safe_size = 20 if page_size < 1 else min(page_size, 100)
-        offset = (safe_page - 1) * safe_size
-        forms, total = self._form_repo.list_forms(offset=offset, limit=safe_size)
-        items = [asdict(self._to_form_summary(row)) for row in forms]
-        return {
-            "items": items,
-            "total": total,
-            "page": safe_page,
-            "page_size": safe_size,
-            "has_next": offset + safe_size < total,
-        }
+        self._validators = validator_cache or get_submission_validator_cache()
+        self._public_forms = public_form_cache or get_public_form_cache()
+
+    def query_list_forms(
+        self, *, page: int, page_size: int, cursor: str | None = None, include_total: bool = True
+    ) -> dict:
+        request = resolve_page_request(page=page, page_size=page_size, cursor=cursor)
+        rows = self._form_repo.list_forms(
+            after=request.after, offset=request.offset, limit=request.fetch_limit
+        )
+        return build_page(
+            rows=rows,
+            request=request,
+            order=FORM_LIST_ORDER,
+            to_item=lambda row: asdict(self._to_form_summary(row)),
+            total=self._form_repo.count_forms() if include_total else None,
+        )
 
     def command_create_form(self, *, title: str, slug: str | None = None) -> dict:
         title_value = title.strip()
@@ -45,14 +63,16 @@ class FormService:
         final_slug = stable_slug(base, taken)
         now_epoch = utc_now_epoch()
         created = self._form_repo.create_form(title=title_value, slug=final_slug, now_epoch=now_epoch)
-        return asdict(self._to_form_detail(created))
+        return asdict(self._to_form_detail(*created))
+
+    def query_form_summary(self, form_id: int) -> dict:
+        return asdict(self._to_form_summary(self._form_repo.get_form_summary(form_id)))
 
     def query_form_detail(self, form_id: int) -> dict:
-        form = self._form_repo.get_form(form_id)
-        return asdict(self._to_form_detail(form))
+        return asdict(self._to_form_detail(*self._form_repo.get_active_form(form_id)))
 
     def command_update_form(self, *, form_id: int, title: str, slug: str | None) -> dict:
-        form = self._form_repo.get_form(form_id)
+        form, version, fields = self._form_repo.get_active_form(form_id)
         title_value = title.strip()
         if not title_value:
             raise bad_request("title is required")
@@ -65,15 +85,18 @@ class FormService:
             slug=sanitized_slug,
             now_epoch=utc_now_epoch(),
         )
-        return asdict(self._to_form_detail(updated))
+        self._invalidate_after_commit(form.id)
+        return asdict(self._to_form_detail(updated, version, fields))
 
     def command_delete_form(self, form_id: int) -> None:
         form = self._form_repo.get_form(form_id)
         self._form_repo.delete_form(form)
+        self._invalidate_after_commit(form_id)
 
     def command_replace_fields(self, *, form_id: int, fields: list[dict]) -> dict:
-        form = self._form_repo.get_form(form_id)
-        active_version = self._form_repo.get_active_version(form)
+        # The old fields are deleted unseen, so they are not loaded; the reply
+        # is built from the rows just inserted rather than by reloading the form.
+        form, active_version, _ = self._form_repo.get_active_form(form_id, with_fields=False)
         if active_version.status == "published":
             raise conflict(
                 "published form version is immutable",
@@ -81,28 +104,63 @@ class FormService:
             )
         normalized = self._normalize_fields(fields)
         now_epoch = utc_now_epoch()
-        self._form_repo.replace_fields(
+        inserted = self._form_repo.replace_fields(
             form_version_id=active_version.id,
             field_inputs=normalized,
             now_epoch=now_epoch,
         )
         form.updated_at = now_epoch
-        refreshed = self._form_repo.get_form(form_id)
-        return asdict(self._to_form_detail(refreshed))
+        self._invalidate_after_commit(form_id)
+        return asdict(self._to_form_detail(form, active_version, inserted))
 
     def command_publish_form(self, form_id: int) -> dict:
-        form = self._form_repo.get_form(form_id)
-        active_fields = self._form_repo.get_fields_for_version(form.active_version_id or 0)
+        form, active_version, active_fields = self._form_repo.get_active_form(form_id)
         if not active_fields:
             raise bad_request("cannot publish form without fields")
-        published = self._form_repo.publish_form(form=form, now_epoch=utc_now_epoch())
-        return asdict(self._to_form_detail(published))
+        published = self._form_repo.publish_form(form=form, version=active_version, now_epoch=utc_now_epoch())
+        self._invalidate_after_commit(form_id)
+        return asdict(self._to_form_detail(published, active_version, active_fields))
 
     def query_public_form(self, slug: str) -> dict:
-        form = self._form_repo.get_form_by_slug(slugify(slug))
+        return self.query_public_form_document(slug).detail
+
+    def query_public_form_document(self, slug: str) -> PublicFormDocument:
+        normalized_slug = slugify(slug)
+        cached = self._public_forms.get(normalized_slug)
+        if cached is not None:
+            return cached
+        form, version, fields = self._form_repo.get_active_form_by_slug(normalized_slug)
         if form.status != "published":
             raise not_found("published form not found")
-        return asdict(self._to_form_detail(form))
+        detail = asdict(self._to_form_detail(form, version, fields))
+        body = canonical_json_dumps(detail).encode("utf-8")
+        # updated_at has one-second resolution, so a short body digest keeps two
+        # edits within the same second from sharing an ETag.
+        digest = hashlib.sha256(body).hexdigest()[:12]
+        document = PublicFormDocument(
+            form_id=form.id,
+            slug=form.slug,
+            etag=f'"{detail["active_version_id"]}-{form.updated_at}-{digest}"',
+            detail=detail,
+            body=body,
+        )
+        self._public_forms.put(document)
+        return document
+
+    def render_public_form(
+        self, document: PublicFormDocument, variant: str, render: Callable[[], bytes]
+    ) -> bytes:
+        return self._public_forms.get_or_render(document, variant, render)
+
+    def _invalidate_after_commit(self, form_id: int) -> None:
+        validators = self._validators
+        public_forms = self._public_forms
+
+        def _invalidate() -> None:
+            validators.invalidate_form(form_id)
+            public_forms.invalidate_form(form_id)
+
+        self._form_repo.after_commit(_invalidate)
 
     def _to_form_summary(self, form: Form) -> FormSummaryDTO:
         return FormSummaryDTO(
@@ -114,12 +172,11 @@ class FormService:
             updated_at=form.updated_at,
         )
 
-    def _to_form_detail(self, form: Form) -> FormDetailDTO:
-        active = self._form_repo.get_active_version(form)
+    def _to_form_detail(self, form: Form, active: FormVersion, rows: list[Field]) -> FormDetailDTO:
         fields = [
             self._to_field_dto(row)
             for row in stable_sorted(
-                active.fields,
+                rows,
                 key=lambda x: (getattr(x, FIELD_ORDER[0]), getattr(x, FIELD_ORDER[1])),
             )
         ]
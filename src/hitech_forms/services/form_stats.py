@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+STAT_PERCENTILES = (25, 50, 75, 90, 99)
+_RATIO_DIGITS = 6
+
+
+def _ratio(part: int, whole: int) -> float | None:
+    return round(part / whole, _RATIO_DIGITS) if whole else None
+
+
+def select_aggregates(options: Sequence[str], value_counts: Mapping[str, int]) -> dict[str, Any]:
+    """Counts per configured option in option order; values recorded under an
+    older version's options follow, sorted."""
+    listed = [{"value": option, "count": value_counts.get(option, 0)} for option in options]
+    listed.extend(
+        {"value": value, "count": count} for value, count in sorted(value_counts.items()) if value not in options
+    )
+    return {"options": listed}
+
+
+def checkbox_aggregates(value_counts: Mapping[str, int]) -> dict[str, Any]:
+    checked = value_counts.get("true", 0)
+    unchecked = value_counts.get("false", 0)
+    return {"true": checked, "false": unchecked, "true_ratio": _ratio(checked, checked + unchecked)}
+
+
+def number_aggregates(value_counts: Mapping[str, int]) -> dict[str, Any]:
+    """Min, max, mean and nearest-rank percentiles over the value histogram."""
+    weighted: list[tuple[float, int]] = []
+    for raw, count in value_counts.items():
+        try:
+            number = float(raw)
+        except ValueError:
+            continue
+        if math.isfinite(number):
+            weighted.append((number, count))
+    weighted.sort()
+    total = sum(count for _number, count in weighted)
+    if not total:
+        return {"min": None, "max": None, "mean": None, "percentiles": {}}
+    percentiles: dict[str, float] = {}
+    ranks = iter(STAT_PERCENTILES)
+    percentile = next(ranks, None)
+    seen = 0
+    for number, count in weighted:
+        seen += count
+        while percentile is not None and seen >= math.ceil(percentile / 100 * total):
+            percentiles[f"p{percentile}"] = number
+            percentile = next(ranks, None)
+    return {
+        "min": weighted[0][0],
+        "max": weighted[-1][0],
+        "mean": round(math.fsum(number * count for number, count in weighted) / total, _RATIO_DIGITS),
+        "percentiles": percentiles,
+    }
+
+
+def date_aggregates(value_counts: Mapping[str, int]) -> dict[str, Any]:
+    """Earliest/latest date and a per-month (``YYYY-MM``) histogram."""
+    histogram: dict[str, int] = {}
+    for value, count in value_counts.items():
+        month = value[:7]
+        histogram[month] = histogram.get(month, 0) + count
+    dates = sorted(value_counts)
+    return {
+        "min": dates[0] if dates else None,
+        "max": dates[-1] if dates else None,
+        "histogram": {month: histogram[month] for month in sorted(histogram)},
+    }
+
+
+def field_aggregates(field_type: str, options: Sequence[str], value_counts: Mapping[str, int]) -> dict[str, Any]:
+    if field_type == "select":
+        return select_aggregates(options, value_counts)
+    if field_type == "checkbox":
+        return checkbox_aggregates(value_counts)
+    if field_type == "number":
+        return number_aggregates(value_counts)
+    if field_type == "date":
+        return date_aggregates(value_counts)
+    return {}
+
+
+def fill_rate(filled: int, submission_count: int) -> float | None:
+    return _ratio(filled, submission_count)
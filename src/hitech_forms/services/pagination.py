@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from hitech_forms.platform.cursor import decode_cursor, encode_cursor
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    page: int | None
+    page_size: int
+    after: tuple[int, int] | None
+    offset: int
+
+    @property
+    def fetch_limit(self) -> int:
+        # One extra row tells us whether a next page exists without a COUNT(*).
+        return self.page_size + 1
+
+
+def resolve_page_request(*, page: int, page_size: int, cursor: str | None) -> PageRequest:
+    safe_size = DEFAULT_PAGE_SIZE if page_size < 1 else min(page_size, MAX_PAGE_SIZE)
+    if cursor:
+        created_at, row_id = decode_cursor(cursor, size=2)
+        return PageRequest(page=None, page_size=safe_size, after=(created_at, row_id), offset=0)
+    safe_page = 1 if page < 1 else page
+    return PageRequest(page=safe_page, page_size=safe_size, after=None, offset=(safe_page - 1) * safe_size)
+
+
+def build_page(
+    *,
+    rows: Sequence[Any],
+    request: PageRequest,
+    order: tuple[str, str],
+    to_item: Callable[[Any], dict[str, Any]],
+    total: int | None,
+) -> dict[str, Any]:
+    visible = rows[: request.page_size]
+    has_next = len(rows) > request.page_size
+    next_cursor = None
+    if has_next and visible:
+        last = visible[-1]
+        next_cursor = encode_cursor((getattr(last, order[0]), getattr(last, order[1])))
+    return {
+        "items": [to_item(row) for row in visible],
+        "total": total,
+        "page": request.page,
+        "page_size": request.page_size,
+        "has_next": has_next,
+        "next_cursor": next_cursor,
+    }
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from hitech_forms.contracts import PublicFormDocument
+from hitech_forms.platform.cache import BoundedLRUCache
+from hitech_forms.platform.settings import get_settings
+
+
+@dataclass(frozen=True)
+class _CachedDocument:
+    document: PublicFormDocument
+    expires_at: float
+
+
+class PublishedFormCache:
+    """Serialized published forms keyed by slug, plus their rendered variants.
+
+    Invalidation is in-process only; ``ttl_seconds`` bounds how long another
+    worker process can serve a form that was changed elsewhere.
+    """
+
+    def __init__(self, *, max_entries: int, ttl_seconds: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._documents: BoundedLRUCache[str, _CachedDocument] = BoundedLRUCache(max_entries)
+        self._renderings: BoundedLRUCache[tuple[int, str, str, str], bytes] = BoundedLRUCache(max_entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0
+
+    def get(self, slug: str) -> PublicFormDocument | None:
+        if not self.enabled:
+            return None
+        cached = self._documents.get(slug)
+        if cached is None:
+            return None
+        if cached.expires_at <= time.monotonic():
+            self._documents.discard(slug)
+            return None
+        return cached.document
+
+    def put(self, document: PublicFormDocument) -> None:
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + self._ttl_seconds
+        self._documents.put(document.slug, _CachedDocument(document=document, expires_at=expires_at))
+
+    def get_rendering(self, document: PublicFormDocument, variant: str) -> bytes | None:
+        if not self.enabled:
+            return None
+        return self._renderings.get((document.form_id, document.slug, document.etag, variant))
+
+    def get_or_render(self, document: PublicFormDocument, variant: str, render: Callable[[], bytes]) -> bytes:
+        if not self.enabled:
+            return render()
+        key = (document.form_id, document.slug, document.etag, variant)
+        return self._renderings.get_or_create(key, render)
+
+    def invalidate_form(self, form_id: int) -> None:
+        self._documents.discard_where(lambda _slug, cached: cached.document.form_id == form_id)
+        self._renderings.discard_where(lambda key, _body: key[0] == form_id)
+
+    def clear(self) -> None:
+        self._documents.clear()
+        self._renderings.clear()
+
+
+_PUBLIC_FORM_CACHE: PublishedFormCache | None = None
+
+
+def get_public_form_cache() -> PublishedFormCache:
+    global _PUBLIC_FORM_CACHE
+    if _PUBLIC_FORM_CACHE is None:
+        settings = get_settings()
+        _PUBLIC_FORM_CACHE = PublishedFormCache(
+            max_entries=settings.public_form_cache_size,
+            ttl_seconds=settings.public_form_cache_ttl_seconds,
+        )
+    return _PUBLIC_FORM_CACHE
+
+
+def reset_public_form_cache() -> None:
+    global _PUBLIC_FORM_CACHE
+    _PUBLIC_FORM_CACHE = None
@@ -1,49 +1,70 @@
 from __future__ import annotations
 
 import json
-import re
+from collections.abc import Iterable
 from dataclasses import asdict
-from datetime import date
+from typing import Any
 
 from hitech_forms.contracts import (
-    ANSWER_ORDER,
-    FIELD_ORDER,
+    RATE_GRANULARITIES,
+    SUBMISSION_ORDER,
+    FieldStatsDTO,
     FormRepositoryPort,
+    FormStatsDTO,
     SubmissionDetailDTO,
+    SubmissionRatePoint,
+    SubmissionRateSeriesDTO,
     SubmissionRepositoryPort,
+    SubmissionSearch,
     SubmissionSummaryDTO,
+    SubmissionWriterPort,
 )
-from hitech_forms.db.models import Field
 from hitech_forms.platform.determinism import utc_now_epoch
-from hitech_forms.platform.errors import bad_request
+from hitech_forms.platform.errors import AppError, bad_request, not_found
 from hitech_forms.platform.slug import slugify
+from hitech_forms.services.form_stats import field_aggregates, fill_rate
+from hitech_forms.services.pagination import build_page, resolve_page_request
+from hitech_forms.services.submission_validation import (
+    CompiledSubmissionValidator,
+    SubmissionValidatorCache,
+    get_submission_validator_cache,
+)
 
-_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+MAX_BULK_CHUNK_SIZE = 5000
+MAX_BULK_REPORTED_ERRORS = 1000
+DEFAULT_RATE_POINTS = 60
+MAX_RATE_POINTS = 1440
 
 
 class SubmissionService:
-    def __init__(self, form_repo: FormRepositoryPort, submission_repo: SubmissionRepositoryPort):
+    def __init__(
+        self,
+        form_repo: FormRepositoryPort,
+        submission_repo: SubmissionRepositoryPort,
+        validator_cache: SubmissionValidatorCache | None = None,
+        writer: SubmissionWriterPort | None = None,
+    ):
         self._form_repo = form_repo
         self._submission_repo = submission_repo
+        self._validators = validator_cache or get_submission_validator_cache()
+        self._writer = writer
+
+    def prepare_public_submission(self, *, slug: str, values: dict[str, str]) -> dict:
+        """Validate a public submission without writing it: the keyword
+        arguments for a ``SubmissionWriterPort`` apart from ``now_epoch``."""
+        ref = self._form_repo.get_active_version_ref_by_slug(slugify(slug))
+        validator = self._published_validator(ref)
+        return {
+            "form_id": validator.form_id,
+            "form_version_id": validator.form_version_id,
+            "answers": validator.validate(values),
+        }
 
     def command_submit_public(self, *, slug: str, values: dict[str, str]) -> dict:
-        form = self._form_repo.get_form_by_slug(slugify(slug))
-        if form.status != "published":
-            raise bad_request("form is not published")
-        version = self._form_repo.get_active_version(form)
-        if version.status != "published":
-            raise bad_request(
-                "active form version is not published",
-                details={"form_id": form.id, "form_version_id": version.id},
-            )
-        fields = self._form_repo.get_fields_for_version(version.id)
-        normalized_answers = self._validate_submission(fields, values)
-        submission = self._submission_repo.create_submission(
-            form_id=form.id,
-            form_version_id=version.id,
-            answers=normalized_answers,
-            now_epoch=utc_now_epoch(),
-        )
+        prepared = self.prepare_public_submission(slug=slug, values=values)
+        if self._writer is not None:
+            return asdict(self._writer.submit(**prepared, now_epoch=utc_now_epoch()))
+        submission = self._submission_repo.create_submission(**prepared, now_epoch=utc_now_epoch())
         return asdict(
             SubmissionSummaryDTO(
                 id=submission.id,
@@ -54,17 +75,84 @@ class SubmissionService:
             )
         )
 
-    def query_list_submissions(self, *, form_id: int, page: int, page_size: int) -> dict:
-        safe_page = 1 if page < 1 else page
-        safe_size = 20 if page_size < 1 else min(page_size, 100)
-        offset = (safe_page - 1) * safe_size
-        rows, total = self._submission_repo.list_submissions(
+    def command_bulk_submit(
+        self, *, form_id: int, lines: Iterable[bytes | str], chunk_size: int = 1000
+    ) -> dict:
+        safe_chunk = 1 if chunk_size < 1 else min(chunk_size, MAX_BULK_CHUNK_SIZE)
+        validator = self._published_validator(self._form_repo.get_active_version_ref(form_id))
+        accepted = 0
+        rejected = 0
+        errors: list[dict[str, Any]] = []
+        seq_ranges: list[list[int]] = []
+        pending: list[dict[str, str]] = []
+
+        def _flush() -> None:
+            nonlocal accepted
+            if not pending:
+                return
+            seqs = self._submission_repo.bulk_create_submissions(
+                form_id=validator.form_id,
+                form_version_id=validator.form_version_id,
+                answers=pending,
+                now_epoch=utc_now_epoch(),
+            )
+            self._submission_repo.commit()
+            accepted += len(seqs)
+            if seq_ranges and seq_ranges[-1][1] + 1 == seqs[0]:
+                seq_ranges[-1][1] = seqs[-1]
+            else:
+                seq_ranges.append([seqs[0], seqs[-1]])
+            pending.clear()
+
+        for line_no, raw_line in enumerate(lines, start=1):
+            if not raw_line.strip():
+                continue
+            try:
+                pending.append(validator.validate(_bulk_values(raw_line)))
+            except AppError as exc:
+                rejected += 1
+                if len(errors) < MAX_BULK_REPORTED_ERRORS:
+                    errors.append({"line": line_no, "code": exc.code, "message": exc.message})
+                continue
+            if len(pending) >= safe_chunk:
+                _flush()
+        _flush()
+        return {
+            "form_id": validator.form_id,
+            "form_version_id": validator.form_version_id,
+            "accepted": accepted,
+            "rejected": rejected,
+            "errors": errors,
+            "errors_truncated": rejected > len(errors),
+            "seq_ranges": seq_ranges,
+        }
+
+    def query_list_submissions(
+        self,
+        *,
+        form_id: int,
+        page: int,
+        page_size: int,
+        cursor: str | None = None,
+        include_total: bool = True,
+        q: str | None = None,
+        field: str | None = None,
+        value: str | None = None,
+    ) -> dict:
+        request = resolve_page_request(page=page, page_size=page_size, cursor=cursor)
+        search = _resolve_search(q=q, field=field, value=value)
+        rows = self._submission_repo.list_submissions(
             form_id=form_id,
-            offset=offset,
-            limit=safe_size,
+            after=request.after,
+            offset=request.offset,
+            limit=request.fetch_limit,
+            search=search,
         )
-        items = [
-            asdict(
+        return build_page(
+            rows=rows,
+            request=request,
+            order=SUBMISSION_ORDER,
+            to_item=lambda row: asdict(
                 SubmissionSummaryDTO(
                     id=row.id,
                     form_id=row.form_id,
@@ -72,23 +160,18 @@ class SubmissionService:
                     submission_seq=row.submission_seq,
                     created_at=row.created_at,
                 )
-            )
-            for row in rows
-        ]
-        return {
-            "items": items,
-            "total": total,
-            "page": safe_page,
-            "page_size": safe_size,
-            "has_next": offset + safe_size < total,
-        }
+            ),
+            # Search results have no maintained count; has_next still comes from the
+            # limit + 1 fetch.
+            total=self._submission_repo.count_submissions(form_id)
+            if include_total and search is None
+            else None,
+        )
 
     def query_submission_detail(self, *, form_id: int, submission_id: int) -> dict:
         row = self._submission_repo.get_submission(form_id=form_id, submission_id=submission_id)
-        answers = {
-            item.field_key: item.value_text
-            for item in sorted(row.answers, key=lambda x: getattr(x, ANSWER_ORDER[0]))
-        }
+        answer_map = self._submission_repo.get_answer_map(row)
+        answers = {key: answer_map[key] for key in sorted(answer_map)}
         return asdict(
             SubmissionDetailDTO(
                 id=row.id,
@@ -100,45 +183,123 @@ class SubmissionService:
             )
         )
 
-    def _validate_submission(self, fields: list[Field], values: dict[str, str]) -> dict[str, str]:
-        normalized: dict[str, str] = {}
-        for field in sorted(fields, key=lambda x: (getattr(x, FIELD_ORDER[0]), getattr(x, FIELD_ORDER[1]))):
-            incoming = values.get(field.field_key, "")
-            normalized_value = self._normalize_by_type(field, incoming)
-            if field.required and not normalized_value:
-                raise bad_request(f"field '{field.label}' is required")
-            normalized[field.field_key] = normalized_value
-        return normalized
-
-    def _normalize_by_type(self, field: Field, incoming: str) -> str:
-        raw = str(incoming or "").strip()
-        if field.type in {"text", "textarea"}:
-            return raw
-        if field.type == "number":
-            if not raw:
-                return ""
-            try:
-                float(raw)
-            except ValueError as exc:
-                raise bad_request(f"field '{field.label}' must be a number") from exc
-            return raw
-        if field.type == "email":
-            if raw and not _EMAIL_RE.match(raw):
-                raise bad_request(f"field '{field.label}' must be a valid email")
-            return raw
-        if field.type == "checkbox":
-            return "true" if raw.lower() in {"1", "true", "on", "yes"} else "false"
-        if field.type == "date":
-            if not raw:
-                return ""
-            try:
-                parsed = date.fromisoformat(raw)
-            except ValueError as exc:
-                raise bad_request(f"field '{field.label}' must be YYYY-MM-DD") from exc
-            return parsed.isoformat()
-        if field.type == "select":
+    def command_delete_submission(self, *, form_id: int, submission_id: int) -> None:
+        self._submission_repo.delete_submission(form_id=form_id, submission_id=submission_id)
+
+    def query_form_stats(self, form_id: int) -> dict:
+        """Per-field aggregates for the active version's fields, read from the
+        maintained rollups rather than from the answers themselves."""
+        _form, version, fields = self._form_repo.get_active_form(form_id)
+        submission_count = self._submission_repo.count_submissions(form_id)
+        fill_counts = self._submission_repo.get_field_fill_counts(form_id)
+        value_counts = self._submission_repo.get_field_value_counts(form_id)
+        field_stats = []
+        for field in fields:
             options = [str(item) for item in json.loads(field.config_json or "{}").get("options", [])]
-            if raw and raw not in options:
-                raise bad_request(f"field '{field.label}' has invalid option")
-            return raw
-        raise bad_request(f"unsupported field type '{field.type}'")
+            filled = fill_counts.get(field.field_key, 0)
+            field_stats.append(
+                FieldStatsDTO(
+                    key=field.field_key,
+                    label=field.label,
+                    field_type=field.type,
+                    filled=filled,
+                    fill_rate=fill_rate(filled, submission_count),
+                    aggregates=field_aggregates(field.type, options, value_counts.get(field.field_key, {})),
+                )
+            )
+        return asdict(
+            FormStatsDTO(
+                form_id=form_id,
+                form_version_id=version.id,
+                submission_count=submission_count,
+                fields=field_stats,
+            )
+        )
+
+    def query_submission_rates(
+        self,
+        *,
+        form_id: int,
+        granularity: str,
+        start: int | None = None,
+        end: int | None = None,
+    ) -> dict:
+        """Zero-filled arrival counts per bucket for the window ``[start, end]``.
+
+        Both bounds snap to whole buckets; ``end`` defaults to now and ``start``
+        to ``DEFAULT_RATE_POINTS`` buckets before it.
+        """
+        bucket_seconds = RATE_GRANULARITIES.get(granularity)
+        if bucket_seconds is None:
+            raise bad_request(f"granularity must be one of: {', '.join(RATE_GRANULARITIES)}")
+        self._form_repo.get_form_summary(form_id)
+        window_end = utc_now_epoch() if end is None else end
+        end_exclusive = window_end - window_end % bucket_seconds + bucket_seconds
+        if start is None:
+            window_start = end_exclusive - DEFAULT_RATE_POINTS * bucket_seconds
+        else:
+            window_start = start - start % bucket_seconds
+        buckets = (end_exclusive - window_start) // bucket_seconds
+        if buckets < 1:
+            raise bad_request("start must not be after end")
+        if buckets > MAX_RATE_POINTS:
+            raise bad_request(f"window spans more than {MAX_RATE_POINTS} buckets")
+        counts = self._submission_repo.get_rate_buckets(
+            form_id=form_id, bucket_seconds=bucket_seconds, start=window_start, end=end_exclusive
+        )
+        points = [
+            SubmissionRatePoint(bucket_start=bucket_start, count=counts.get(bucket_start, 0))
+            for bucket_start in range(window_start, end_exclusive, bucket_seconds)
+        ]
+        return asdict(
+            SubmissionRateSeriesDTO(
+                form_id=form_id,
+                granularity=granularity,
+                bucket_seconds=bucket_seconds,
+                start=window_start,
+                end=end_exclusive,
+                total=sum(point.count for point in points),
+                points=points,
+            )
+        )
+
+    def _published_validator(self, ref: Any) -> CompiledSubmissionValidator:
+        if ref.form_status != "published":
+            raise bad_request("form is not published")
+        if ref.form_version_id is None:
+            raise not_found("active form version not found")
+        if ref.version_status != "published":
+            raise bad_request(
+                "active form version is not published",
+                details={"form_id": ref.form_id, "form_version_id": ref.form_version_id},
+            )
+        form_version_id = int(ref.form_version_id)
+        return self._validators.get_or_compile(
+            form_id=ref.form_id,
+            form_version_id=form_version_id,
+            published_at=int(ref.published_at or 0),
+            load_fields=lambda: self._form_repo.get_fields_for_version(form_version_id),
+        )
+
+
+def _bulk_values(raw_line: bytes | str) -> dict[str, str]:
+    try:
+        payload = json.loads(raw_line)
+    except ValueError as exc:
+        raise bad_request("line is not valid JSON") from exc
+    values = payload.get("values") if isinstance(payload, dict) else None
+    if not isinstance(values, dict):
+        raise bad_request("line must be an object with a 'values' object")
+    return {str(key): "" if value is None else str(value) for key, value in values.items()}
+
+
+def _resolve_search(*, q: str | None, field: str | None, value: str | None) -> SubmissionSearch | None:
+    q = (q or "").strip() or None
+    field = (field or "").strip() or None
+    if q is None and field is None and value is None:
+        return None
+    if q is not None:
+        return SubmissionSearch(q=q, field=field)
+    if field is None or value is None:
+        raise bad_request("search needs q, or field together with value")
+    return SubmissionSearch(field=field, value=value.strip())
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+from typing import Any
+
+from hitech_forms.contracts import FIELD_ORDER
+from hitech_forms.platform.cache import BoundedLRUCache
+from hitech_forms.platform.errors import bad_request
+from hitech_forms.platform.settings import get_settings
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_CHECKBOX_TRUE = frozenset({"1", "true", "on", "yes"})
+
+Normalizer = Callable[[str], str]
+
+
+def _normalize_text(raw: str) -> str:
+    return raw
+
+
+def _normalize_number(label: str, raw: str) -> str:
+    if not raw:
+        return ""
+    try:
+        float(raw)
+    except ValueError as exc:
+        raise bad_request(f"field '{label}' must be a number") from exc
+    return raw
+
+
+def _normalize_email(label: str, raw: str) -> str:
+    if raw and not _EMAIL_RE.match(raw):
+        raise bad_request(f"field '{label}' must be a valid email")
+    return raw
+
+
+def _normalize_checkbox(raw: str) -> str:
+    return "true" if raw.lower() in _CHECKBOX_TRUE else "false"
+
+
+def _normalize_date(label: str, raw: str) -> str:
+    if not raw:
+        return ""
+    try:
+        parsed = date.fromisoformat(raw)
+    except ValueError as exc:
+        raise bad_request(f"field '{label}' must be YYYY-MM-DD") from exc
+    return parsed.isoformat()
+
+
+def _normalize_select(label: str, options: frozenset[str], raw: str) -> str:
+    if raw and raw not in options:
+        raise bad_request(f"field '{label}' has invalid option")
+    return raw
+
+
+def _reject_unsupported(field_type: str, _raw: str) -> str:
+    raise bad_request(f"unsupported field type '{field_type}'")
+
+
+def _build_normalizer(field: Any) -> Normalizer:
+    field_type = str(field.type)
+    label = str(field.label)
+    if field_type in {"text", "textarea"}:
+        return _normalize_text
+    if field_type == "number":
+        return partial(_normalize_number, label)
+    if field_type == "email":
+        return partial(_normalize_email, label)
+    if field_type == "checkbox":
+        return _normalize_checkbox
+    if field_type == "date":
+        return partial(_normalize_date, label)
+    if field_type == "select":
+        config = json.loads(field.config_json or "{}")
+        options = frozenset(str(item) for item in config.get("options", []))
+        return partial(_normalize_select, label, options)
+    return partial(_reject_unsupported, field_type)
+
+
+@dataclass(frozen=True)
+class CompiledField:
+    key: str
+    label: str
+    field_type: str
+    required: bool
+    normalize: Normalizer
+
+
+@dataclass(frozen=True)
+class CompiledSubmissionValidator:
+    form_id: int
+    form_version_id: int
+    fields: tuple[CompiledField, ...]
+
+    def validate(self, values: Mapping[str, str]) -> dict[str, str]:
+        normalized: dict[str, str] = {}
+        for field in self.fields:
+            normalized_value = field.normalize(str(values.get(field.key, "") or "").strip())
+            if field.required and not normalized_value:
+                raise bad_request(f"field '{field.label}' is required")
+            normalized[field.key] = normalized_value
+        return normalized
+
+
+def compile_submission_validator(
+    *, form_id: int, form_version_id: int, fields: Iterable[Any]
+) -> CompiledSubmissionValidator:
+    ordered = sorted(fields, key=lambda x: (getattr(x, FIELD_ORDER[0]), getattr(x, FIELD_ORDER[1])))
+    return CompiledSubmissionValidator(
+        form_id=form_id,
+        form_version_id=form_version_id,
+        fields=tuple(
+            CompiledField(
+                key=str(row.field_key),
+                label=str(row.label),
+                field_type=str(row.type),
+                required=bool(row.required),
+                normalize=_build_normalizer(row),
+            )
+            for row in ordered
+        ),
+    )
+
+
+class SubmissionValidatorCache:
+    """Compiled validators for published (immutable) form versions.
+
+    Entries are keyed by ``(form_version_id, published_at)`` so that a version id
+    reused by SQLite after a delete can never resolve to a stale validator.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self._entries: BoundedLRUCache[tuple[int, int], CompiledSubmissionValidator] = BoundedLRUCache(
+            max_entries
+        )
+
+    def get_or_compile(
+        self,
+        *,
+        form_id: int,
+        form_version_id: int,
+        published_at: int,
+        load_fields: Callable[[], Iterable[Any]],
+    ) -> CompiledSubmissionValidator:
+        return self._entries.get_or_create(
+            (form_version_id, published_at),
+            lambda: compile_submission_validator(
+                form_id=form_id, form_version_id=form_version_id, fields=load_fields()
+            ),
+        )
+
+    def invalidate_form(self, form_id: int) -> None:
+        self._entries.discard_where(lambda _key, validator: validator.form_id == form_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_VALIDATOR_CACHE: SubmissionValidatorCache | None = None
+
+
+def get_submission_validator_cache() -> SubmissionValidatorCache:
+    global _VALIDATOR_CACHE
+    if _VALIDATOR_CACHE is None:
+        _VALIDATOR_CACHE = SubmissionValidatorCache(get_settings().validator_cache_size)
+    return _VALIDATOR_CACHE
+
+
+def reset_submission_validator_cache() -> None:
+    global _VALIDATOR_CACHE
+    _VALIDATOR_CACHE = None
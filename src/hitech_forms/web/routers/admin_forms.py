@@ -141,8 +141,7 @@ def build_admin_forms_web_router() -> APIRouter:
         token: str = Form(""),
         form_service: FormServicePort = Depends(get_form_service),
     ):
-        form_service.command_publish_form(form_id=form_id)
-        detail = form_service.query_form_detail(form_id)
+        detail = form_service.command_publish_form(form_id=form_id)
         return redirect(f"/f/{detail['slug']}?token={token}")
 
     @router.post("/{form_id}/delete")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from urllib.parse import urlencode
+
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
 
@@ -17,12 +19,28 @@ def build_admin_submissions_web_router() -> APIRouter:
         form_id: int,
         page: int = 1,
         page_size: int = 20,
+        cursor: str | None = None,
+        q: str | None = None,
+        field: str | None = None,
+        value: str | None = None,
         form_service: FormServicePort = Depends(get_form_service),
         submission_service: SubmissionServicePort = Depends(get_submission_service),
     ):
         token = query_token(request)
         detail = form_service.query_form_detail(form_id)
-        submissions = submission_service.query_list_submissions(form_id=form_id, page=page, page_size=page_size)
+        # Empty inputs from the search form mean "no filter"; a field picked
+        # with neither text nor a value filters nothing either.
+        search = {"q": q or None, "field": field or None, "value": (value or None) if field else None}
+        if search["q"] is None and search["value"] is None:
+            search["field"] = None
+        submissions = submission_service.query_list_submissions(
+            form_id=form_id,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            include_total=False,
+            **search,
+        )
         return templates.TemplateResponse(
             request,
             "admin/submissions/list.html",
@@ -31,7 +49,11 @@ def build_admin_submissions_web_router() -> APIRouter:
                 "form": detail,
                 "submissions": submissions["items"],
                 "page": submissions["page"],
+                "page_size": submissions["page_size"],
                 "has_next": submissions["has_next"],
+                "next_cursor": submissions["next_cursor"],
+                "search": search,
+                "search_query": urlencode({key: item for key, item in search.items() if item is not None}),
             },
         )
 
@@ -44,14 +66,14 @@ def build_admin_submissions_web_router() -> APIRouter:
         submission_service: SubmissionServicePort = Depends(get_submission_service),
     ):
         token = query_token(request)
-        detail = form_service.query_form_detail(form_id)
+        summary = form_service.query_form_summary(form_id)
         submission = submission_service.query_submission_detail(form_id=form_id, submission_id=submission_id)
         return templates.TemplateResponse(
             request,
             "admin/submissions/detail.html",
             {
                 "token": token,
-                "form": detail,
+                "form": summary,
                 "submission": submission,
             },
         )
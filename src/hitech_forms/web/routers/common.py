@@ -1,12 +1,33 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
+from typing import Any
 
 from fastapi import Request
 from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import Template
+
+from hitech_forms.platform.feature_flags import get_feature_flags
+from hitech_forms.platform.metrics import TEMPLATE_RENDER_SECONDS
+
+
+class _TimedTemplate(Template):
+    """Records render time per template in ``hforms_template_render_duration_seconds``."""
+
+    def render(self, *args: Any, **kwargs: Any) -> str:
+        if not get_feature_flags().metrics:
+            return super().render(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            TEMPLATE_RENDER_SECONDS.observe(time.perf_counter() - started, (self.name or "<string>",))
+
 
 templates = Jinja2Templates(directory=str(Path(__file__).resolve().parents[1] / "templates"))
+templates.env.template_class = _TimedTemplate
 
 
 def query_token(request: Request) -> str:
@@ -2,9 +2,15 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
+from starlette.concurrency import run_in_threadpool
 
-from hitech_forms.app.dependencies import get_form_service, get_submission_service
-from hitech_forms.contracts import FormServicePort, SubmissionServicePort
+from hitech_forms.app.dependencies import (
+    get_async_form_service,
+    get_async_submission_service,
+    public_submit_guard,
+)
+from hitech_forms.app.responses import HTML_MEDIA_TYPE, conditional_response, variant_etag
+from hitech_forms.contracts import AsyncFormServicePort, AsyncSubmissionServicePort
 from hitech_forms.web.routers.common import redirect, templates
 
 
@@ -12,28 +18,43 @@ def build_public_forms_web_router() -> APIRouter:
     router = APIRouter(prefix="/f")
 
     @router.get("/{slug}", response_class=HTMLResponse)
-    def public_form_page(request: Request, slug: str, form_service: FormServicePort = Depends(get_form_service)):
-        form_detail = form_service.query_public_form(slug)
-        return templates.TemplateResponse(
-            request,
-            "public/form.html",
-            {"form": form_detail, "error": "", "submitted": False},
+    async def public_form_page(
+        request: Request, slug: str, form_service: AsyncFormServicePort = Depends(get_async_form_service)
+    ):
+        document = await form_service.query_public_form_document(slug)
+        html = form_service.cached_public_form_rendering(document, "public/form.html")
+        if html is None:
+            # Rendering Jinja is CPU work; keep it off the event loop on a miss.
+            html = await run_in_threadpool(
+                form_service.render_public_form,
+                document,
+                "public/form.html",
+                lambda: templates.get_template("public/form.html")
+                .render({"request": request, "form": document.detail, "error": "", "submitted": False})
+                .encode("utf-8"),
+            )
+        return conditional_response(
+            request.headers.get("if-none-match"),
+            body=html,
+            etag=variant_etag(document.etag, "html"),
+            media_type=HTML_MEDIA_TYPE,
         )
 
-    @router.post("/{slug}/submit")
+    @router.post("/{slug}/submit", dependencies=[Depends(public_submit_guard)])
     async def public_submit_form_action(
         request: Request,
         slug: str,
-        form_service: FormServicePort = Depends(get_form_service),
-        submission_service: SubmissionServicePort = Depends(get_submission_service),
+        form_service: AsyncFormServicePort = Depends(get_async_form_service),
+        submission_service: AsyncSubmissionServicePort = Depends(get_async_submission_service),
     ):
         raw_form = await request.form()
         values = {str(key): str(value) for key, value in raw_form.multi_items()}
         try:
-            submission_service.command_submit_public(slug=slug, values=values)
+            await submission_service.command_submit_public(slug=slug, values=values)
         except Exception as exc:
-            form_detail = form_service.query_public_form(slug)
-            return templates.TemplateResponse(
+            form_detail = await form_service.query_public_form(slug)
+            return await run_in_threadpool(
+                templates.TemplateResponse,
                 request,
                 "public/form.html",
                 {"form": form_detail, "error": str(exc), "submitted": False},
@@ -37,15 +37,29 @@ def runtime_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict[str, st
     monkeypatch.setenv("HFORMS_ADMIN_TOKEN", "test-admin-token")
     monkeypatch.setenv("HFORMS_TIMEZONE", "UTC")
     monkeypatch.setenv("HFORMS_RATE_LIMIT_PER_MINUTE", "999999")
+    monkeypatch.setenv("HFORMS_PUBLIC_SUBMIT_RATE_LIMIT_PER_MINUTE", "999999")
     monkeypatch.setenv("PYTHONHASHSEED", "0")
     monkeypatch.setenv("HFORMS_FIXED_NOW", "1700000000")
+    monkeypatch.setenv("HFORMS_EXPORT_ARTIFACT_DIR", str(tmp_path / "exports"))
     _run_alembic_upgrade(db_path)
 
+    from hitech_forms.app.security.rate_limit import reset_rate_limiter
     from hitech_forms.db.engine import reset_engine_cache
+    from hitech_forms.platform.feature_flags import reset_feature_flags_cache
+    from hitech_forms.platform.metrics import reset_metrics
     from hitech_forms.platform.settings import reset_settings_cache
+    from hitech_forms.services.export_artifacts import reset_export_artifact_store
+    from hitech_forms.services.public_form_cache import reset_public_form_cache
+    from hitech_forms.services.submission_validation import reset_submission_validator_cache
 
     reset_settings_cache()
     reset_engine_cache()
+    reset_submission_validator_cache()
+    reset_public_form_cache()
+    reset_feature_flags_cache()
+    reset_export_artifact_store()
+    reset_rate_limiter()
+    reset_metrics()
     return {"db_path": str(db_path), "admin_token": "test-admin-token"}
 
 
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pytest
+
+
+def test_bench_report_covers_every_scenario(runtime_env):
+    pytest.importorskip("httpx")
+    from hitech_forms.ops.bench import SCENARIOS, BenchConfig, compare_reports, run_benchmarks
+
+    report = run_benchmarks(BenchConfig(submissions=120, requests=4, export_runs=1, warmup=1))
+
+    assert report["meta"]["submissions"] == 120
+    results = {result["scenario"]: result for result in report["results"]}
+    assert list(results) == list(SCENARIOS)
+    for result in results.values():
+        assert result["operations"] > 0
+        assert 0 < result["p50_ms"] <= result["p95_ms"] <= result["max_ms"]
+    # The export carries every seeded row, not just one page.
+    assert results["export_csv"]["bytes_per_op"] > 120 * 40
+    ratios = compare_reports(report, report)
+    assert {row["ops_per_s_ratio"] for row in ratios} == {1.0}
+
+
+def test_bench_rejects_unknown_scenarios(runtime_env):
+    from hitech_forms.ops.bench import BenchConfig, run_benchmarks
+
+    with pytest.raises(ValueError):
+        run_benchmarks(BenchConfig(scenarios=("public_get", "nope")))
@@ -71,3 +71,253 @@ async def test_export_large_dataset(client, runtime_env):
     export = await client.get(f"/api/admin/forms/{form_id}/export.csv", headers=headers)
     assert export.status_code == 200
     assert len(export.text.strip().splitlines()) == 121
+
+
+@pytest.mark.anyio
+async def test_export_chunking_is_byte_identical(client, runtime_env):
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token}
+    published = await create_published_form(client, token)
+    form_id = published["id"]
+
+    for idx in range(40):
+        values = {"name": f'Quote "{idx}", comma', "email": f"chunk{idx}@example.com", "priority": "low"}
+        response = await client.post(f"/api/f/{published['slug']}/submit", json={"values": values})
+        assert response.status_code == 201
+
+    from hitech_forms.db import session_scope
+    from hitech_forms.db.repositories import FormRepository, SubmissionRepository
+    from hitech_forms.services import ExportService
+
+    with session_scope() as session:
+        service = ExportService(FormRepository(session), SubmissionRepository(session), chunk_bytes=64, fetch_batch=7)
+        chunks = list(service.stream_form_csv(form_id=form_id))
+
+    export = await client.get(f"/api/admin/forms/{form_id}/export.csv", headers=headers)
+    assert len(chunks) > 10
+    assert b"".join(chunks) == export.content
+    lines = export.text.splitlines()
+    assert lines[1].endswith(',"Quote ""0"", comma",chunk0@example.com,low,false')
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("shards", [2, 3, 7])
+async def test_sharded_export_matches_serial_bytes(client, runtime_env, monkeypatch, shards):
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token}
+    published = await create_published_form(client, token)
+    form_id = published["id"]
+    for idx in range(25):
+        values = {"name": f"Shard {idx}", "email": f"shard{idx}@example.com", "priority": "high"}
+        response = await client.post(f"/api/f/{published['slug']}/submit", json={"values": values})
+        assert response.status_code == 201
+
+    serial = await client.get(f"/api/admin/forms/{form_id}/export.csv", headers=headers)
+
+    from hitech_forms.app.dependencies import build_export_service
+    from hitech_forms.db import session_scope
+    from hitech_forms.platform.settings import reset_settings_cache
+
+    monkeypatch.setenv("HFORMS_EXPORT_SHARDS", str(shards))
+    monkeypatch.setenv("HFORMS_EXPORT_SHARD_MIN_ROWS", "10")
+    reset_settings_cache()
+    with session_scope() as session:
+        service = build_export_service(session)
+        assert len(service._plan_shards(form_id)) == shards - 1
+        sharded = b"".join(service.stream_form_csv(form_id=form_id))
+    assert sharded == serial.content
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("counter_drift", [-10, 5])
+async def test_sharded_export_keeps_every_row_when_the_counter_drifts(
+    client, runtime_env, monkeypatch, counter_drift
+):
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token}
+    published = await create_published_form(client, token)
+    form_id = published["id"]
+    for idx in range(40):
+        values = {"name": f"Drift {idx}", "email": f"drift{idx}@example.com", "priority": "low"}
+        response = await client.post(f"/api/f/{published['slug']}/submit", json={"values": values})
+        assert response.status_code == 201
+    serial = await client.get(f"/api/admin/forms/{form_id}/export.csv", headers=headers)
+
+    from sqlalchemy import text
+
+    from hitech_forms.app.dependencies import build_export_service
+    from hitech_forms.db import session_scope
+    from hitech_forms.platform.settings import reset_settings_cache
+
+    with session_scope() as session:
+        session.execute(
+            text("UPDATE submission_counters SET submission_count = submission_count + :drift WHERE form_id = :form_id"),
+            {"drift": counter_drift, "form_id": form_id},
+        )
+    monkeypatch.setenv("HFORMS_EXPORT_SHARDS", "4")
+    monkeypatch.setenv("HFORMS_EXPORT_SHARD_MIN_ROWS", "1")
+    reset_settings_cache()
+    with session_scope() as session:
+        service = build_export_service(session)
+        assert service._plan_shards(form_id)
+        sharded = b"".join(service.stream_form_csv(form_id=form_id))
+    assert sharded == serial.content
+    assert len(sharded.splitlines()) == 41
+
+
+async def _seed_format_submissions(client, token):
+    published = await create_published_form(client, token)
+    for idx in range(5):
+        values = {"name": f"Fmt <{idx}> & co", "email": f"fmt{idx}@example.com", "priority": "low"}
+        response = await client.post(f"/api/f/{published['slug']}/submit", json={"values": values})
+        assert response.status_code == 201
+    return published["id"]
+
+
+@pytest.mark.anyio
+async def test_export_ndjson_and_xlsx_formats(client, runtime_env):
+    import io
+    import json
+    import zipfile
+    from xml.etree import ElementTree
+
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token}
+    form_id = await _seed_format_submissions(client, token)
+
+    ndjson = await client.get(f"/api/admin/forms/{form_id}/export.ndjson", headers=headers)
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [record["answers"]["name"] for record in records] == [f"Fmt <{idx}> & co" for idx in range(5)]
+    assert list(records[0]["answers"]) == ["email", "name", "notify", "priority"]
+
+    first = await client.get(f"/api/admin/forms/{form_id}/export.xlsx", headers=headers)
+    second = await client.get(f"/api/admin/forms/{form_id}/export.xlsx", headers=headers)
+    assert first.status_code == 200
+    assert first.content == second.content
+    with zipfile.ZipFile(io.BytesIO(first.content)) as archive:
+        assert archive.testzip() is None
+        sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+    ns = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+    rows = sheet.findall("s:sheetData/s:row", ns)
+    assert len(rows) == 6
+    assert [t.text for t in rows[0].iter(f"{{{ns['s']}}}t")] == [
+        "submission_id",
+        "created_at",
+        "name",
+        "email",
+        "priority",
+        "notify",
+    ]
+    assert [t.text for t in rows[1].iter(f"{{{ns['s']}}}t")][0] == "Fmt <0> & co"
+
+    unknown = await client.get(f"/api/admin/forms/{form_id}/export.pdf", headers=headers)
+    assert unknown.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_export_arrow_stream_round_trips(client, runtime_env):
+    pa = pytest.importorskip("pyarrow")
+    token = runtime_env["admin_token"]
+    form_id = await _seed_format_submissions(client, token)
+
+    export = await client.get(f"/api/admin/forms/{form_id}/export.arrow", headers={"X-Admin-Token": token})
+    assert export.status_code == 200
+    table = pa.ipc.open_stream(export.content).read_all()
+    assert table.column_names == ["submission_id", "created_at", "name", "email", "priority", "notify"]
+    assert table.num_rows == 5
+
+
+@pytest.mark.anyio
+async def test_incremental_export_since_high_water(client, runtime_env):
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token}
+    published = await create_published_form(client, token)
+    form_id = published["id"]
+
+    async def _submit(idx):
+        values = {"name": f"Sync {idx}", "email": f"sync{idx}@example.com", "priority": "low"}
+        response = await client.post(f"/api/f/{published['slug']}/submit", json={"values": values})
+        assert response.status_code == 201
+        return response.json()
+
+    for idx in range(3):
+        await _submit(idx)
+    full = await client.get(f"/api/admin/forms/{form_id}/export.csv", headers=headers)
+    assert full.headers["x-export-high-water-seq"] == "3"
+    high_water_id = int(full.headers["x-export-high-water-id"])
+
+    latest = [await _submit(idx) for idx in range(3, 5)]
+    by_seq = await client.get(f"/api/admin/forms/{form_id}/export.csv?since_seq=3", headers=headers)
+    lines = by_seq.text.splitlines()
+    assert lines[0] == full.text.splitlines()[0]
+    assert [line.split(",")[0] for line in lines[1:]] == [str(item["id"]) for item in latest]
+    assert by_seq.headers["x-export-high-water-seq"] == "5"
+
+    by_id = await client.get(
+        f"/api/admin/forms/{form_id}/export.ndjson?since_id={high_water_id}", headers=headers
+    )
+    assert len(by_id.text.splitlines()) == 2
+
+    caught_up = await client.get(f"/api/admin/forms/{form_id}/export.csv?since_seq=5", headers=headers)
+    assert caught_up.text.splitlines() == lines[:1]
+
+    # Deleting the high-water submission must not let the next one reuse its id.
+    last_id = latest[-1]["id"]
+    deleted = await client.delete(f"/api/admin/forms/{form_id}/submissions/{last_id}", headers=headers)
+    assert deleted.status_code == 200
+    replacement = await _submit(5)
+    assert replacement["id"] > last_id
+    after_delete = await client.get(
+        f"/api/admin/forms/{form_id}/export.ndjson?since_id={last_id}", headers=headers
+    )
+    assert len(after_delete.text.splitlines()) == 1
+
+
+@pytest.mark.anyio
+async def test_export_snapshot_builds_appends_and_serves_ranges(client, runtime_env):
+    import gzip
+
+    from hitech_forms.app.export_refresher import ExportArtifactRefresher
+
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token}
+    published = await create_published_form(client, token)
+    form_id = published["id"]
+    snapshot_url = f"/api/admin/forms/{form_id}/export.csv?snapshot=true"
+
+    async def _submit(idx):
+        values = {"name": f"Snap {idx}", "email": f"snap{idx}@example.com", "priority": "low"}
+        response = await client.post(f"/api/f/{published['slug']}/submit", json={"values": values})
+        assert response.status_code == 201
+        return response.json()
+
+    created = [await _submit(idx) for idx in range(3)]
+    assert (await client.get(snapshot_url, headers=headers)).status_code == 404
+
+    refresher = ExportArtifactRefresher(interval_seconds=60)
+
+    async def _assert_snapshot_matches_live(expected_members):
+        refresher.refresh_once()
+        snapshot = await client.get(snapshot_url, headers=headers)
+        live = await client.get(f"/api/admin/forms/{form_id}/export.csv", headers=headers)
+        assert snapshot.status_code == 200
+        assert snapshot.headers["content-type"] == "application/gzip"
+        assert gzip.decompress(snapshot.content) == live.content
+        assert snapshot.headers["x-export-high-water-seq"] == live.headers["x-export-high-water-seq"]
+        assert snapshot.content.count(b"\x1f\x8b\x08") == expected_members
+        return snapshot
+
+    first = await _assert_snapshot_matches_live(1)
+    for idx in range(3, 5):
+        await _submit(idx)
+    await _assert_snapshot_matches_live(2)
+
+    ranged = await client.get(snapshot_url, headers={**headers, "Range": "bytes=0-9"})
+    assert ranged.status_code == 206
+    assert ranged.content == first.content[:10]
+
+    deleted = await client.delete(f"/api/admin/forms/{form_id}/submissions/{created[0]['id']}", headers=headers)
+    assert deleted.status_code == 200
+    await _assert_snapshot_matches_live(1)
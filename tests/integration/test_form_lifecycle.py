@@ -160,3 +160,102 @@ async def test_field_reorder_is_deterministic(client, runtime_env):
     second = await client.put(f"/api/admin/forms/{form_id}/fields", json=reordered, headers=headers)
     assert second.status_code == 200
     assert [field["key"] for field in second.json()["fields"]] == ["c", "a", "b"]
+
+
+@pytest.mark.anyio
+async def test_public_form_etag_and_cache_invalidation(client, runtime_env):
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token}
+    published = await create_published_form(client, token)
+    slug = published["slug"]
+
+    first = await client.get(f"/api/f/{slug}")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith(f'"{published["active_version_id"]}-{published["updated_at"]}-')
+
+    not_modified = await client.get(f"/api/f/{slug}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    # The HTML page is a different representation and has its own validator.
+    page = await client.get(f"/f/{slug}", headers={"If-None-Match": etag})
+    assert page.status_code == 200
+    page_etag = page.headers["etag"]
+    assert page_etag != etag
+    cached_page = await client.get(f"/f/{slug}", headers={"If-None-Match": page_etag})
+    assert cached_page.status_code == 304
+    cross_variant = await client.get(f"/api/f/{slug}", headers={"If-None-Match": page_etag})
+    assert cross_variant.status_code == 200
+
+    renamed = await client.put(
+        f"/api/admin/forms/{published['id']}",
+        json={"title": "Renamed Intake", "slug": slug},
+        headers=headers,
+    )
+    assert renamed.status_code == 200
+    refreshed = await client.get(f"/api/f/{slug}", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json()["title"] == "Renamed Intake"
+    html = await client.get(f"/f/{slug}")
+    assert "Renamed Intake" in html.text
+
+
+@pytest.mark.anyio
+async def test_public_form_page_renders_off_the_event_loop(client, runtime_env, monkeypatch):
+    import threading
+
+    from hitech_forms.web.routers.common import templates
+
+    published = await create_published_form(client, runtime_env["admin_token"])
+    render_threads = []
+    get_template = templates.get_template
+
+    def _recording_get_template(name, *args, **kwargs):
+        render_threads.append(threading.get_ident())
+        return get_template(name, *args, **kwargs)
+
+    monkeypatch.setattr(templates, "get_template", _recording_get_template)
+    for _ in range(2):
+        assert (await client.get(f"/f/{published['slug']}")).status_code == 200
+    # One miss, rendered on a worker thread; the second request is a cache hit.
+    assert len(render_threads) == 1
+    assert render_threads[0] != threading.get_ident()
+
+
+@pytest.mark.anyio
+async def test_cursor_pagination_matches_offset_pages(client, runtime_env):
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token}
+    published = await create_published_form(client, token)
+    form_id = published["id"]
+    for idx in range(7):
+        response = await client.post(
+            f"/api/f/{published['slug']}/submit",
+            json={"values": {"name": f"Page {idx}", "email": f"page{idx}@example.com", "priority": "low"}},
+        )
+        assert response.status_code == 201
+
+    seen: list[int] = []
+    cursor = None
+    while True:
+        query = f"page_size=3&include_total=false{f'&cursor={cursor}' if cursor else ''}"
+        page = await client.get(f"/api/admin/forms/{form_id}/submissions?{query}", headers=headers)
+        assert page.status_code == 200
+        payload = page.json()
+        assert payload["total"] is None
+        seen.extend(item["submission_seq"] for item in payload["items"])
+        cursor = payload["next_cursor"]
+        if not payload["has_next"]:
+            assert cursor is None
+            break
+    assert seen == list(range(1, 8))
+
+    offset_page = await client.get(f"/api/admin/forms/{form_id}/submissions?page=3&page_size=3", headers=headers)
+    assert [item["submission_seq"] for item in offset_page.json()["items"]] == [7]
+    assert offset_page.json()["total"] == 7
+
+    html = await client.get(f"/admin/forms/{form_id}/submissions?page_size=3&token={token}")
+    assert html.status_code == 200
+    assert "cursor=" in html.text
+
+    invalid = await client.get(f"/api/admin/forms/{form_id}/submissions?cursor=bogus", headers=headers)
+    assert invalid.status_code == 400
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+
+async def _create_stats_form(client, token: str) -> dict:
+    headers = {"X-Admin-Token": token}
+    created = await client.post("/api/admin/forms", json={"title": "Event Feedback"}, headers=headers)
+    form_id = created.json()["id"]
+    fields = [
+        {"key": "name", "label": "Name", "type": "text", "required": False, "options": []},
+        {"key": "rating", "label": "Rating", "type": "select", "required": False, "options": ["bad", "ok", "great"]},
+        {"key": "again", "label": "Again", "type": "checkbox", "required": False, "options": []},
+        {"key": "spend", "label": "Spend", "type": "number", "required": False, "options": []},
+        {"key": "visited", "label": "Visited", "type": "date", "required": False, "options": []},
+    ]
+    replaced = await client.put(f"/api/admin/forms/{form_id}/fields", json={"fields": fields}, headers=headers)
+    assert replaced.status_code == 200
+    published = await client.post(f"/api/admin/forms/{form_id}/publish", headers=headers)
+    assert published.status_code == 200
+    return published.json()
+
+
+@pytest.mark.anyio
+async def test_form_stats_are_maintained_incrementally_and_rebuildable(client, runtime_env, monkeypatch):
+    from hitech_forms.db import session_scope
+    from hitech_forms.db.models import FieldFillCount, FieldValueCount
+    from hitech_forms.db.repositories import SubmissionRepository
+    from hitech_forms.platform.settings import reset_settings_cache
+
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token}
+    published = await _create_stats_form(client, token)
+    form_id = published["id"]
+
+    rows = [
+        {"name": "Ada", "rating": "great", "again": "on", "spend": "10", "visited": "2026-01-05"},
+        {"name": "", "rating": "ok", "again": "", "spend": "20.5", "visited": "2026-01-20"},
+        {"name": "Lin", "rating": "great", "again": "yes", "spend": "", "visited": "2026-02-01"},
+        {"name": "Bo", "rating": "", "again": "", "spend": "40", "visited": ""},
+    ]
+    ids = []
+    for values in rows[:2]:
+        response = await client.post(f"/api/f/{published['slug']}/submit", json={"values": values})
+        ids.append(response.json()["id"])
+    # One row-stored and one packed submission are deleted again, and both
+    # must be taken back out of the rollups.
+    row_stored = await client.post(
+        f"/api/f/{published['slug']}/submit",
+        json={"values": {"name": "Gone too", "rating": "bad", "again": "on", "spend": "500"}},
+    )
+    deleted = await client.delete(f"/api/admin/forms/{form_id}/submissions/{row_stored.json()['id']}", headers=headers)
+    assert deleted.status_code == 200
+    monkeypatch.setenv("HFORMS_ANSWER_STORAGE", "packed")
+    reset_settings_cache()
+    body = "\n".join(json.dumps({"values": values}) for values in rows[2:] + [{"name": "Gone", "spend": "999"}])
+    bulk = await client.post(f"/api/admin/forms/{form_id}/submissions:bulk", content=body, headers=headers)
+    assert bulk.json()["accepted"] == 3
+    listed = await client.get(f"/api/admin/forms/{form_id}/submissions?page_size=10", headers=headers)
+    gone_id = listed.json()["items"][-1]["id"]
+    deleted = await client.delete(f"/api/admin/forms/{form_id}/submissions/{gone_id}", headers=headers)
+    assert deleted.status_code == 200
+
+    response = await client.get(f"/api/admin/forms/{form_id}/stats", headers=headers)
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["submission_count"] == 4
+    by_key = {field["key"]: field for field in stats["fields"]}
+    assert [field["key"] for field in stats["fields"]] == ["name", "rating", "again", "spend", "visited"]
+    assert (by_key["name"]["filled"], by_key["name"]["fill_rate"], by_key["name"]["aggregates"]) == (3, 0.75, {})
+    assert by_key["rating"]["aggregates"]["options"] == [
+        {"value": "bad", "count": 0},
+        {"value": "ok", "count": 1},
+        {"value": "great", "count": 2},
+    ]
+    assert by_key["again"]["aggregates"] == {"true": 2, "false": 2, "true_ratio": 0.5}
+    assert by_key["spend"]["aggregates"] == {
+        "min": 10.0,
+        "max": 40.0,
+        "mean": 23.5,
+        "percentiles": {"p25": 10.0, "p50": 20.5, "p75": 40.0, "p90": 40.0, "p99": 40.0},
+    }
+    assert by_key["visited"]["aggregates"] == {
+        "min": "2026-01-05",
+        "max": "2026-02-01",
+        "histogram": {"2026-01": 2, "2026-02": 1},
+    }
+
+    with session_scope() as session:
+        session.query(FieldValueCount).delete()
+        session.query(FieldFillCount).delete()
+    with session_scope() as session:
+        assert SubmissionRepository(session).rebuild_field_stats() > 0
+    rebuilt = await client.get(f"/api/admin/forms/{form_id}/stats", headers=headers)
+    assert rebuilt.json() == stats
+
+
+@pytest.mark.anyio
+async def test_submission_rates_are_bucketed_per_minute_hour_and_day(client, runtime_env, monkeypatch):
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token}
+    published = await _create_stats_form(client, token)
+    form_id = published["id"]
+    for now in (1700000000, 1700000010, 1700000100, 1700003700):
+        monkeypatch.setenv("HFORMS_FIXED_NOW", str(now))
+        response = await client.post(f"/api/f/{published['slug']}/submit", json={"values": {"name": "x"}})
+        assert response.status_code == 201
+
+    minutes = await client.get(
+        f"/api/admin/forms/{form_id}/submission-rates?granularity=minute&start=1699999990&end=1700000100",
+        headers=headers,
+    )
+    assert minutes.status_code == 200
+    payload = minutes.json()
+    assert (payload["start"], payload["end"], payload["total"]) == (1699999980, 1700000160, 3)
+    assert payload["points"] == [
+        {"bucket_start": 1699999980, "count": 2},
+        {"bucket_start": 1700000040, "count": 0},
+        {"bucket_start": 1700000100, "count": 1},
+    ]
+
+    hours = (await client.get(f"/api/admin/forms/{form_id}/submission-rates?granularity=hour", headers=headers)).json()
+    assert len(hours["points"]) == 60
+    assert hours["points"][-2:] == [
+        {"bucket_start": 1699999200, "count": 3},
+        {"bucket_start": 1700002800, "count": 1},
+    ]
+    days = (await client.get(f"/api/admin/forms/{form_id}/submission-rates?granularity=day", headers=headers)).json()
+    assert days["total"] == 4
+
+    listed = await client.get(f"/api/admin/forms/{form_id}/submissions?page_size=10", headers=headers)
+    last_id = listed.json()["items"][-1]["id"]
+    deleted = await client.delete(f"/api/admin/forms/{form_id}/submissions/{last_id}", headers=headers)
+    assert deleted.status_code == 200
+    maintained = (await client.get(f"/api/admin/forms/{form_id}/submission-rates?granularity=day", headers=headers)).json()
+    assert maintained["total"] == 3
+
+    from hitech_forms.db import session_scope
+    from hitech_forms.db.repositories import SubmissionRepository
+
+    urls = [
+        f"/api/admin/forms/{form_id}/submission-rates?granularity={granularity}&start=1699999990"
+        for granularity in ("minute", "hour", "day")
+    ]
+    before = [(await client.get(url, headers=headers)).json() for url in urls]
+    with session_scope() as session:
+        SubmissionRepository(session).rebuild_submission_rates(form_id)
+    assert [(await client.get(url, headers=headers)).json() for url in urls] == before
+
+    bad = await client.get(f"/api/admin/forms/{form_id}/submission-rates?granularity=week", headers=headers)
+    assert bad.status_code == 400
+    too_wide = await client.get(
+        f"/api/admin/forms/{form_id}/submission-rates?granularity=minute&start=0", headers=headers
+    )
+    assert too_wide.status_code == 400
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+from tests.helpers import create_published_form
+
+
+def _samples(text: str) -> dict[str, float]:
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, _, value = line.rpartition(" ")
+            samples[name] = float(value)
+    return samples
+
+
+@pytest.fixture()
+def metrics_enabled(runtime_env, monkeypatch):
+    from hitech_forms.db.engine import reset_engine_cache
+    from hitech_forms.platform.feature_flags import reset_feature_flags_cache
+
+    monkeypatch.setenv("HFORMS_FLAG_METRICS", "true")
+    reset_feature_flags_cache()
+    # The engine reads the flag when it attaches its statement listeners.
+    reset_engine_cache()
+    return runtime_env
+
+
+@pytest.mark.anyio
+async def test_metrics_endpoint_reports_requests_queries_templates_and_exports(metrics_enabled, client):
+    token = metrics_enabled["admin_token"]
+    published = await create_published_form(client, token)
+    slug, form_id = published["slug"], published["id"]
+    values = {"name": "Metric", "email": "metric@example.com", "priority": "normal", "notify": "false"}
+    assert (await client.post(f"/api/f/{slug}/submit", json={"values": values})).status_code == 201
+    assert (await client.get(f"/f/{slug}")).status_code == 200
+    export = await client.get(f"/api/admin/forms/{form_id}/export.csv", headers={"X-Admin-Token": token})
+    assert (await client.get("/api/nope")).status_code == 404
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = _samples(response.text)
+
+    assert samples['hforms_http_requests_total{method="POST",route="/api/f/{slug}/submit",status="201"}'] == 1
+    assert samples['hforms_http_requests_total{method="GET",route="unmatched",status="404"}'] == 1
+    assert samples['hforms_http_request_duration_seconds_count{method="GET",route="/f/{slug}"}'] == 1
+    # The scrape itself is still in flight.
+    assert samples["hforms_http_requests_in_flight"] == 1
+    assert samples['hforms_db_queries_total{verb="INSERT"}'] >= 1
+    assert samples['hforms_db_query_duration_seconds_count{verb="SELECT"}'] >= 1
+    assert samples['hforms_template_render_duration_seconds_count{template="public/form.html"}'] == 1
+    assert samples['hforms_export_bytes_total{format="csv"}'] == len(export.content)
+
+
+@pytest.mark.anyio
+async def test_metrics_endpoint_is_off_by_default(client, runtime_env):
+    from hitech_forms.platform.metrics import HTTP_REQUESTS
+
+    assert (await client.get("/api/health")).status_code == 200
+    assert (await client.get("/metrics")).status_code == 404
+    assert HTTP_REQUESTS.values() == {}
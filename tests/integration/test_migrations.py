@@ -5,7 +5,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, inspect, text
 
 ROOT = Path(__file__).resolve().parents[2]
 
@@ -43,9 +43,73 @@ def test_migration_replay_and_reflection(runtime_env):
         "form_versions",
         "fields",
         "submissions",
+        "submission_counters",
+        "submission_rate_buckets",
         "answers",
+        "field_fill_counts",
+        "field_value_counts",
+        "submission_search",
+        "submission_search_config",
+        "submission_search_content",
+        "submission_search_data",
+        "submission_search_docsize",
+        "submission_search_idx",
     }
 
     forms_indexes = {index["name"] for index in inspector.get_indexes("forms")}
     assert "ix_forms_slug" in forms_indexes
     assert "ix_forms_created_at" in forms_indexes
+
+
+def test_submission_counters_backfill_from_existing_rows(runtime_env):
+    env = os.environ.copy()
+    env["HFORMS_DB_PATH"] = runtime_env["db_path"]
+    env["HFORMS_ADMIN_TOKEN"] = runtime_env["admin_token"]
+    env["HFORMS_TIMEZONE"] = "UTC"
+    env["PYTHONHASHSEED"] = "0"
+
+    _run_alembic("downgrade", "0002_submission_seq", env=env)
+    engine = create_engine(f"sqlite:///{runtime_env['db_path']}")
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO forms (id, title, slug) VALUES (1, 'A', 'a'), (2, 'B', 'b')"))
+        conn.execute(text("INSERT INTO form_versions (id, form_id) VALUES (1, 1), (2, 2)"))
+        conn.execute(
+            text(
+                "INSERT INTO submissions (form_id, form_version_id, submission_seq) "
+                "VALUES (1, 1, 1), (1, 1, 2), (1, 1, 3), (2, 2, 1)"
+            )
+        )
+    _run_alembic("upgrade", "head", env=env)
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT form_id, last_seq FROM submission_counters ORDER BY form_id")
+        ).all()
+    assert [tuple(row) for row in rows] == [(1, 3), (2, 1)]
+
+
+def test_packed_answers_are_unpacked_on_downgrade(runtime_env):
+    env = os.environ.copy()
+    env["HFORMS_DB_PATH"] = runtime_env["db_path"]
+    env["HFORMS_ADMIN_TOKEN"] = runtime_env["admin_token"]
+    env["HFORMS_TIMEZONE"] = "UTC"
+    env["PYTHONHASHSEED"] = "0"
+
+    engine = create_engine(f"sqlite:///{runtime_env['db_path']}")
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO forms (id, title, slug) VALUES (1, 'A', 'a')"))
+        conn.execute(text("INSERT INTO form_versions (id, form_id) VALUES (1, 1)"))
+        conn.execute(
+            text(
+                "INSERT INTO submissions (id, form_id, form_version_id, submission_seq, created_at, answers_packed) "
+                """VALUES (1, 1, 1, 1, 7, '{"email":"a@example.com","name":"Ada"}')"""
+            )
+        )
+    engine.dispose()
+    _run_alembic("downgrade", "0005_submission_counts", env=env)
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT submission_id, field_key, value_text, created_at FROM answers ORDER BY id")
+        ).all()
+    assert [tuple(row) for row in rows] == [(1, "email", "a@example.com", 7), (1, "name", "Ada", 7)]
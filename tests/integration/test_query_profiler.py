@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from tests.helpers import create_published_form
+
+
+def _enable_profiler(monkeypatch, **env: str) -> None:
+    from hitech_forms.db.engine import reset_engine_cache
+    from hitech_forms.platform.feature_flags import reset_feature_flags_cache
+    from hitech_forms.platform.settings import reset_settings_cache
+
+    monkeypatch.setenv("HFORMS_FLAG_QUERY_PROFILER", "true")
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    reset_settings_cache()
+    reset_feature_flags_cache()
+    # Engine listeners are attached when the engine is built.
+    reset_engine_cache()
+
+
+def _profiles(caplog) -> list[dict]:
+    events = [json.loads(record.getMessage()) for record in caplog.records if record.name == "hitech_forms.db.profiler"]
+    return [event for event in events if event["event"] == "query_profile"]
+
+
+def test_repeated_statement_shapes_are_reported(runtime_env, monkeypatch):
+    from sqlalchemy import select
+
+    from hitech_forms.db import session_scope
+    from hitech_forms.db.models import Form
+    from hitech_forms.db.query_profiler import profile_queries
+
+    _enable_profiler(monkeypatch, HFORMS_QUERY_PROFILER_REPEAT_THRESHOLD="3")
+    with profile_queries() as profile, session_scope() as session:
+        for form_id in range(4):
+            session.execute(select(Form.id).where(Form.id == form_id)).all()
+        session.execute(select(Form.id).where(Form.id.in_([1, 2, 3]))).all()
+        session.execute(select(Form.id).where(Form.id.in_([4, 5]))).all()
+
+    findings = profile.findings(max_queries=100, repeat_threshold=3)
+    assert findings is not None
+    assert findings["too_many_queries"] is False
+    assert [item["count"] for item in findings["repeated"]] == [4]
+    assert "WHERE forms.id = ?" in findings["repeated"][0]["shape"]
+    # IN lists of different lengths share one shape.
+    assert sum(1 for shape in profile.shapes if "(?...)" in shape) == 1
+    assert profile.findings(max_queries=100, repeat_threshold=5) is None
+
+
+@pytest.mark.anyio
+async def test_request_profile_logs_query_count_and_slow_plans(client, runtime_env, monkeypatch, caplog):
+    token = runtime_env["admin_token"]
+    published = await create_published_form(client, token)
+    _enable_profiler(
+        monkeypatch,
+        HFORMS_QUERY_PROFILER_MAX_QUERIES="1",
+        HFORMS_QUERY_PROFILER_SLOW_MS="0",
+    )
+    caplog.set_level("WARNING", logger="hitech_forms.db.profiler")
+
+    response = await client.get(
+        f"/api/admin/forms/{published['id']}/submissions", headers={"X-Admin-Token": token}
+    )
+    assert response.status_code == 200
+
+    [profile] = _profiles(caplog)
+    assert (profile["route"], profile["method"], profile["status"]) == (
+        "/api/admin/forms/{form_id}/submissions",
+        "GET",
+        200,
+    )
+    assert profile["too_many_queries"] is True
+    assert profile["query_count"] == profile["slow_count"] >= 2
+    plans = [line for entry in profile["slow"] for line in entry["plan"]]
+    assert any("submissions" in line for line in plans)
+
+
+@pytest.mark.anyio
+async def test_profiler_is_silent_when_flag_is_off(client, runtime_env, caplog):
+    caplog.set_level("WARNING", logger="hitech_forms.db.profiler")
+    await create_published_form(client, runtime_env["admin_token"])
+    assert _profiles(caplog) == []
+
+
+@pytest.mark.anyio
+async def test_admin_form_commands_do_not_reload_the_form(client, runtime_env, monkeypatch, caplog):
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token}
+    created = await client.post("/api/admin/forms", json={"title": "Reload Check"}, headers=headers)
+    form_id = created.json()["id"]
+    fields = [
+        {"key": "name", "label": "Name", "type": "text", "required": True, "options": []},
+        {"key": "tier", "label": "Tier", "type": "select", "required": False, "options": ["a", "b"]},
+    ]
+    await client.put(f"/api/admin/forms/{form_id}/fields", json={"fields": fields[:1]}, headers=headers)
+    # Every request over one statement is logged; any shape run twice is "repeated".
+    _enable_profiler(
+        monkeypatch,
+        HFORMS_QUERY_PROFILER_MAX_QUERIES="1",
+        HFORMS_QUERY_PROFILER_REPEAT_THRESHOLD="2",
+    )
+    caplog.set_level("WARNING", logger="hitech_forms.db.profiler")
+
+    replaced = await client.put(f"/api/admin/forms/{form_id}/fields", json={"fields": fields}, headers=headers)
+    assert replaced.status_code == 200
+    detail = await client.get(f"/api/admin/forms/{form_id}", headers=headers)
+    assert replaced.json() == detail.json()
+    assert [field["key"] for field in detail.json()["fields"]] == ["name", "tier"]
+
+    published = await client.post(
+        f"/admin/forms/{form_id}/publish", data={"token": token}, params={"token": token}, follow_redirects=False
+    )
+    assert published.status_code == 303
+    assert published.headers["location"] == f"/f/{detail.json()['slug']}?token={token}"
+
+    profiles = {profile["method"] + " " + profile["route"]: profile for profile in _profiles(caplog)}
+    replace = profiles["PUT /api/admin/forms/{form_id}/fields"]
+    publish = profiles["POST /admin/forms/{form_id}/publish"]
+    # Load form and active version, delete the old fields, one INSERT per new
+    # field (the ORM needs each RETURNING id) and at most one UPDATE of the form.
+    assert replace["query_count"] <= 2 + len(fields) + 1
+    assert not any(item["shape"].startswith("SELECT") for item in replace["repeated"])
+    # Load form, active version and fields, then update the form and the version.
+    assert (publish["query_count"], publish["repeated"]) == (3, [])
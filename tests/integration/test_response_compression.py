@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import gzip
+
+import pytest
+from tests.helpers import create_published_form
+
+from hitech_forms.app.compression import negotiate_encoding
+
+
+def test_negotiate_encoding_honours_quality_and_preference():
+    preferred = ("zstd", "br", "gzip")
+    assert negotiate_encoding("gzip, deflate", preferred) == "gzip"
+    assert negotiate_encoding("gzip;q=0, identity", preferred) is None
+    assert negotiate_encoding("*", preferred) == "gzip"
+    assert negotiate_encoding("", preferred) is None
+    assert negotiate_encoding("gzip", ()) is None
+
+
+@pytest.mark.anyio
+async def test_export_and_large_json_are_gzip_compressed(client, runtime_env):
+    token = runtime_env["admin_token"]
+    published = await create_published_form(client, token)
+    form_id = published["id"]
+    for idx in range(40):
+        values = {"name": f"Zip {idx}", "email": f"zip{idx}@example.com", "priority": "low"}
+        response = await client.post(f"/api/f/{published['slug']}/submit", json={"values": values})
+        assert response.status_code == 201
+
+    identity = await client.get(
+        f"/api/admin/forms/{form_id}/export.csv",
+        headers={"X-Admin-Token": token, "Accept-Encoding": "identity"},
+    )
+    assert "content-encoding" not in identity.headers
+
+    compressed_headers = {"X-Admin-Token": token, "Accept-Encoding": "gzip"}
+    export = await client.get(f"/api/admin/forms/{form_id}/export.csv", headers=compressed_headers)
+    assert export.headers["content-encoding"] == "gzip"
+    assert export.headers["vary"] == "Accept-Encoding"
+    assert export.content == identity.content
+
+    listing = await client.get(
+        f"/api/admin/forms/{form_id}/submissions?page_size=100", headers=compressed_headers
+    )
+    assert listing.headers["content-encoding"] == "gzip"
+    assert len(listing.json()["items"]) == 40
+
+    small = await client.get(f"/api/admin/forms/{form_id}", headers=compressed_headers)
+    assert "content-encoding" not in small.headers
+
+    async with client.stream(
+        "GET", f"/api/admin/forms/{form_id}/export.csv", headers=compressed_headers
+    ) as raw:
+        wire = b"".join([chunk async for chunk in raw.aiter_raw()])
+    assert gzip.decompress(wire) == identity.content
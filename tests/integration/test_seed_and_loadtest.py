@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("storage", ["rows", "packed"])
+async def test_seed_loads_consistent_forms_and_rollups(client, runtime_env, monkeypatch, storage):
+    from hitech_forms.ops.seed import SeedConfig, parse_field_mix, seed_database
+    from hitech_forms.platform.settings import reset_settings_cache
+
+    monkeypatch.setenv("HFORMS_ANSWER_STORAGE", storage)
+    reset_settings_cache()
+    headers = {"X-Admin-Token": runtime_env["admin_token"]}
+    mix = parse_field_mix("text=1,select=1,number=1,checkbox=1")
+    report = seed_database(SeedConfig(forms=2, fields=5, submissions=301, field_mix=mix, seed=7, batch_size=64))
+    assert report.submissions == 301
+    first, second = report.form_ids
+
+    listed = (await client.get(f"/api/admin/forms/{first}/submissions?page_size=100", headers=headers)).json()
+    assert listed["total"] == 151
+    assert [item["submission_seq"] for item in listed["items"]] == list(range(1, 101))
+    created = [item["created_at"] for item in listed["items"]]
+    assert created == sorted(created)
+    other = (await client.get(f"/api/admin/forms/{second}/submissions", headers=headers)).json()
+    assert other["total"] == 150
+
+    stats = (await client.get(f"/api/admin/forms/{first}/stats", headers=headers)).json()
+    assert stats["submission_count"] == 151
+    rates = (await client.get(f"/api/admin/forms/{first}/submission-rates?granularity=day", headers=headers)).json()
+    assert rates["total"] == 151
+
+    detail = (await client.get(f"/api/admin/forms/{first}/submissions/{listed['items'][0]['id']}", headers=headers))
+    word = next(value.split()[0] for value in detail.json()["answers"].values() if value and not value[0].isdigit())
+    found = (await client.get(f"/api/admin/forms/{first}/submissions?q={word}", headers=headers)).json()
+    assert listed["items"][0]["id"] in {item["id"] for item in found["items"]}
+
+    # Same seed, same data: stats of a second run match the first form's.
+    again = seed_database(SeedConfig(forms=2, fields=5, submissions=301, field_mix=mix, seed=7, batch_size=200))
+    repeated = (await client.get(f"/api/admin/forms/{again.form_ids[0]}/stats", headers=headers)).json()
+    assert repeated["fields"] == stats["fields"]
+
+
+def test_seed_rejects_unknown_field_types():
+    from hitech_forms.ops.seed import parse_field_mix
+
+    with pytest.raises(ValueError):
+        parse_field_mix("text=1,file=2")
+    with pytest.raises(ValueError):
+        parse_field_mix("text=0")
+
+
+def test_loadtest_reports_latency_per_scenario(runtime_env):
+    pytest.importorskip("httpx")
+    from hitech_forms.ops.loadtest import LoadtestConfig, parse_mix, run_loadtest
+    from hitech_forms.ops.seed import SeedConfig, seed_database
+
+    seed_database(SeedConfig(submissions=50))
+    mix = parse_mix("public_get=2,public_submit=1,admin_list=1")
+    report = run_loadtest(LoadtestConfig(concurrency=4, requests=40, mix=mix))
+
+    assert report["requests"] == 40
+    assert report["errors"] == 0
+    assert {stats["scenario"] for stats in report["scenarios"]} == {"public_get", "public_submit", "admin_list"}
+    for stats in report["scenarios"]:
+        assert stats["latency_ms"]["p50"] <= stats["latency_ms"]["p99"] <= stats["latency_ms"]["max"]
+    submits = next(stats for stats in report["scenarios"] if stats["scenario"] == "public_submit")
+    assert set(submits["statuses"]) == {"201"}
+
+
+def test_loadtest_lifts_rate_limits_in_process(runtime_env, monkeypatch):
+    pytest.importorskip("httpx")
+    from hitech_forms.ops.loadtest import LoadtestConfig, parse_mix, run_loadtest
+    from hitech_forms.ops.seed import SeedConfig, seed_database
+    from hitech_forms.platform.settings import get_settings, reset_settings_cache
+
+    seed_database(SeedConfig(submissions=5))
+    monkeypatch.setenv("HFORMS_PUBLIC_SUBMIT_RATE_LIMIT_PER_MINUTE", "2")
+    reset_settings_cache()
+    mix = parse_mix("public_submit=1")
+
+    lifted = run_loadtest(LoadtestConfig(concurrency=2, requests=10, mix=mix))
+    assert lifted["rate_limits"] == "lifted"
+    assert lifted["scenarios"][0]["statuses"] == {"201": 10}
+    assert get_settings().public_submit_rate_limit_per_minute == 2
+
+    enforced = run_loadtest(LoadtestConfig(concurrency=2, requests=10, mix=mix, keep_rate_limits=True))
+    assert enforced["rate_limits"] == "enforced"
+    assert enforced["scenarios"][0]["statuses"].get("429", 0) > 0
+
+
+def test_loadtest_rejects_unknown_scenarios():
+    from hitech_forms.ops.loadtest import parse_mix
+
+    with pytest.raises(ValueError, match="unknown scenario"):
+        parse_mix("public_get=1,nope=2")
+    with pytest.raises(ValueError, match="scenario mix needs"):
+        parse_mix("public_get=0")
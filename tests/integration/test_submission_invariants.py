@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 
 import pytest
 from tests.helpers import create_published_form
@@ -125,3 +126,285 @@ async def test_submission_references_published_version_used_at_submit_time(clien
     payload = submitted.json()
     assert payload["form_id"] == form_id
     assert payload["form_version_id"] == active_version_id
+
+
+@pytest.mark.anyio
+async def test_bulk_submit_ndjson_reports_row_errors_and_contiguous_seqs(client, runtime_env):
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token, "Content-Type": "application/x-ndjson"}
+    published = await create_published_form(client, token)
+    form_id = published["id"]
+
+    lines = [
+        json.dumps({"values": {"name": f"Bulk {idx}", "email": f"bulk{idx}@example.com", "priority": "low"}})
+        for idx in range(5)
+    ]
+    lines.insert(2, json.dumps({"values": {"name": "Bad", "email": "not-an-email", "priority": "low"}}))
+    lines.insert(4, "{not json")
+    body = ("\n".join(lines) + "\n").encode("utf-8")
+
+    async def _chunks():
+        # Small chunks so lines straddle the reads of the streamed body.
+        for start in range(0, len(body), 16):
+            yield body[start : start + 16]
+
+    response = await client.post(
+        f"/api/admin/forms/{form_id}/submissions:bulk?chunk_size=2",
+        content=_chunks(),
+        headers=headers,
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report["accepted"] == 5
+    assert report["rejected"] == 2
+    assert [error["line"] for error in report["errors"]] == [3, 5]
+    assert report["seq_ranges"] == [[1, 5]]
+
+    listed = await client.get(f"/api/admin/forms/{form_id}/submissions", headers={"X-Admin-Token": token})
+    assert listed.json()["total"] == 5
+    single = await client.post(
+        f"/api/f/{published['slug']}/submit",
+        json={"values": {"name": "After", "email": "after@example.com", "priority": "high"}},
+    )
+    assert single.json()["submission_seq"] == 6
+
+
+@pytest.mark.anyio
+async def test_write_queue_group_commits_concurrent_submits(client, runtime_env, monkeypatch):
+    from hitech_forms.db.write_queue import shutdown_submission_write_queue
+    from hitech_forms.platform.feature_flags import reset_feature_flags_cache
+
+    monkeypatch.setenv("HFORMS_FLAG_SUBMIT_WRITE_QUEUE", "true")
+    reset_feature_flags_cache()
+    token = runtime_env["admin_token"]
+    published = await create_published_form(client, token)
+    try:
+
+        async def _submit(idx: int) -> dict:
+            response = await client.post(
+                f"/api/f/{published['slug']}/submit",
+                json={"values": {"name": f"Queued {idx}", "email": f"q{idx}@example.com", "priority": "low"}},
+            )
+            assert response.status_code == 201
+            return response.json()
+
+        created = await asyncio.gather(*[_submit(idx) for idx in range(15)])
+        assert sorted(item["submission_seq"] for item in created) == list(range(1, 16))
+        assert {item["form_version_id"] for item in created} == {published["active_version_id"]}
+    finally:
+        shutdown_submission_write_queue()
+        monkeypatch.delenv("HFORMS_FLAG_SUBMIT_WRITE_QUEUE")
+        reset_feature_flags_cache()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("write_queue", ["false", "true"])
+async def test_async_db_driver_serves_public_routes(client, runtime_env, monkeypatch, write_queue):
+    pytest.importorskip("aiosqlite")
+    from hitech_forms.db import dispose_async_engine
+    from hitech_forms.db.write_queue import shutdown_submission_write_queue
+    from hitech_forms.platform.feature_flags import reset_feature_flags_cache
+    from hitech_forms.platform.settings import reset_settings_cache
+
+    token = runtime_env["admin_token"]
+    published = await create_published_form(client, token)
+    monkeypatch.setenv("HFORMS_DB_DRIVER", "async")
+    monkeypatch.setenv("HFORMS_FLAG_SUBMIT_WRITE_QUEUE", write_queue)
+    reset_settings_cache()
+    reset_feature_flags_cache()
+    try:
+        fetched = await client.get(f"/api/f/{published['slug']}")
+        assert fetched.status_code == 200
+        assert fetched.json()["id"] == published["id"]
+        page = await client.get(f"/f/{published['slug']}")
+        assert page.status_code == 200
+
+        async def _submit(idx: int) -> dict:
+            response = await client.post(
+                f"/api/f/{published['slug']}/submit",
+                json={"values": {"name": f"Async {idx}", "email": f"a{idx}@example.com", "priority": "low"}},
+            )
+            assert response.status_code == 201
+            return response.json()
+
+        created = await asyncio.gather(*[_submit(idx) for idx in range(10)])
+        assert sorted(item["submission_seq"] for item in created) == list(range(1, 11))
+
+        rejected = await client.post(f"/f/{published['slug']}/submit", data={"name": "No email"})
+        assert rejected.status_code == 400
+        missing = await client.get("/api/f/no-such-form")
+        assert missing.status_code == 404
+    finally:
+        shutdown_submission_write_queue()
+        await dispose_async_engine()
+
+    listed = await client.get(
+        f"/api/admin/forms/{published['id']}/submissions", headers={"X-Admin-Token": token}
+    )
+    assert listed.json()["total"] == 10
+
+
+@pytest.mark.anyio
+async def test_maintained_submission_count_tracks_insert_and_delete(client, runtime_env):
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token}
+    published = await create_published_form(client, token)
+    form_id = published["id"]
+    created = []
+    for idx in range(3):
+        response = await client.post(
+            f"/api/f/{published['slug']}/submit",
+            json={"values": {"name": f"Count {idx}", "email": f"count{idx}@example.com", "priority": "low"}},
+        )
+        created.append(response.json())
+
+    deleted = await client.delete(f"/api/admin/forms/{form_id}/submissions/{created[1]['id']}", headers=headers)
+    assert deleted.status_code == 200
+    missing = await client.delete(f"/api/admin/forms/{form_id}/submissions/{created[1]['id']}", headers=headers)
+    assert missing.status_code == 404
+
+    listed = await client.get(f"/api/admin/forms/{form_id}/submissions", headers=headers)
+    assert listed.json()["total"] == 2
+    assert [item["submission_seq"] for item in listed.json()["items"]] == [1, 3]
+
+    from hitech_forms.db import session_scope
+    from hitech_forms.db.models import SubmissionCounter
+    from hitech_forms.db.repositories import SubmissionRepository
+
+    with session_scope() as session:
+        session.get(SubmissionCounter, form_id).submission_count = 99
+    with session_scope() as session:
+        assert SubmissionRepository(session).repair_submission_counters() == 1
+    repaired = await client.get(f"/api/admin/forms/{form_id}/submissions", headers=headers)
+    assert repaired.json()["total"] == 2
+
+
+@pytest.mark.anyio
+async def test_packed_answer_storage_reads_like_rows(client, runtime_env, monkeypatch):
+    from hitech_forms.platform.settings import reset_settings_cache
+
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token}
+    published = await create_published_form(client, token)
+    form_id = published["id"]
+
+    async def _submit(idx):
+        values = {"name": f"Pack, {idx}", "email": f"pack{idx}@example.com", "priority": "low"}
+        response = await client.post(f"/api/f/{published['slug']}/submit", json={"values": values})
+        assert response.status_code == 201
+        return response.json()["id"]
+
+    row_ids = [await _submit(0), await _submit(1)]
+    rows_detail = await client.get(f"/api/admin/forms/{form_id}/submissions/{row_ids[0]}", headers=headers)
+
+    monkeypatch.setenv("HFORMS_ANSWER_STORAGE", "packed")
+    reset_settings_cache()
+    packed_ids = [await _submit(0), await _submit(2)]
+    bulk = await client.post(
+        f"/api/admin/forms/{form_id}/submissions:bulk",
+        headers=headers,
+        content=json.dumps({"values": {"name": "Bulk", "email": "bulk@example.com", "priority": "high"}}),
+    )
+    assert bulk.json()["accepted"] == 1
+
+    from hitech_forms.db import session_scope
+    from hitech_forms.db.models import Answer, Submission
+
+    with session_scope() as session:
+        assert session.query(Answer).filter(Answer.submission_id.in_(packed_ids)).count() == 0
+        assert session.get(Submission, packed_ids[0]).answers_packed is not None
+
+    packed_detail = await client.get(f"/api/admin/forms/{form_id}/submissions/{packed_ids[0]}", headers=headers)
+    assert packed_detail.json()["answers"] == rows_detail.json()["answers"]
+
+    export = await client.get(f"/api/admin/forms/{form_id}/export.csv", headers=headers)
+    lines = export.text.splitlines()
+    assert len(lines) == 6
+    assert lines[1].split(",", 2)[2] == lines[3].split(",", 2)[2]
+    assert lines[5].endswith(",Bulk,bulk@example.com,high,false")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("storage", ["rows", "packed"])
+async def test_submission_search_full_text_and_exact(client, runtime_env, monkeypatch, storage):
+    from hitech_forms.platform.settings import reset_settings_cache
+
+    monkeypatch.setenv("HFORMS_ANSWER_STORAGE", storage)
+    reset_settings_cache()
+    token = runtime_env["admin_token"]
+    headers = {"X-Admin-Token": token}
+    published = await create_published_form(client, token)
+    form_id = published["id"]
+    people = [
+        ("Ada Lovelace", "ada@example.com"),
+        ("Grace Hopper", "grace@example.com"),
+        ("Ada Byron", "byron@example.org"),
+        # Tokenizes to nothing, so only a plain equality lookup can find it.
+        ("-", "dash@example.org"),
+    ]
+    ids = []
+    for name, email in people:
+        response = await client.post(
+            f"/api/f/{published['slug']}/submit",
+            json={"values": {"name": name, "email": email, "priority": "low"}},
+        )
+        ids.append(response.json()["id"])
+    other = await create_published_form(client, token)
+    await client.post(
+        f"/api/f/{other['slug']}/submit",
+        json={"values": {"name": "Ada Other", "email": "ada@example.com", "priority": "low"}},
+    )
+
+    async def _search(query):
+        response = await client.get(f"/api/admin/forms/{form_id}/submissions?{query}", headers=headers)
+        assert response.status_code == 200
+        return [item["id"] for item in response.json()["items"]]
+
+    assert await _search("q=ada") == [ids[0], ids[2]]
+    assert await _search("q=lov*") == [ids[0]]
+    assert await _search("q=ada&field=email") == [ids[0]]
+    assert await _search("field=email&value=grace@example.com") == [ids[1]]
+    assert await _search("field=email&value=grace") == []
+    assert await _search("field=name&value=-") == [ids[3]]
+    assert await _search('field=na"me&value=-') == []
+    assert await _search('q="OR"') == []
+    assert await _search("q=ada&page_size=1") == [ids[0]]
+
+    bad = await client.get(f"/api/admin/forms/{form_id}/submissions?field=email", headers=headers)
+    assert bad.status_code == 400
+
+    page = await client.get(f"/admin/forms/{form_id}/submissions?q=hopper&field=&value=&token={token}")
+    assert page.status_code == 200
+    assert f"/admin/forms/{form_id}/submissions/{ids[1]}?" in page.text
+    assert f"/admin/forms/{form_id}/submissions/{ids[0]}?" not in page.text
+    # Picking a field without typing a value does not filter.
+    unfiltered = await client.get(f"/admin/forms/{form_id}/submissions?q=&field=name&value=&token={token}")
+    assert unfiltered.status_code == 200
+    assert all(f"/admin/forms/{form_id}/submissions/{item}?" in unfiltered.text for item in ids)
+
+    deleted = await client.delete(f"/api/admin/forms/{form_id}/submissions/{ids[0]}", headers=headers)
+    assert deleted.status_code == 200
+    assert await _search("q=ada") == [ids[2]]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+async def test_public_submit_is_rate_limited(client, runtime_env, monkeypatch, tmp_path, backend):
+    from hitech_forms.app.security.rate_limit import reset_rate_limiter
+    from hitech_forms.platform.settings import reset_settings_cache
+
+    monkeypatch.setenv("HFORMS_PUBLIC_SUBMIT_RATE_LIMIT_PER_MINUTE", "2")
+    monkeypatch.setenv("HFORMS_RATE_LIMIT_BACKEND", backend)
+    monkeypatch.setenv("HFORMS_RATE_LIMIT_DB_PATH", str(tmp_path / "rate_limits.db"))
+    reset_settings_cache()
+    reset_rate_limiter()
+    published = await create_published_form(client, runtime_env["admin_token"])
+    values = {"name": "Limited", "email": "limited@example.com", "priority": "normal", "notify": "false"}
+
+    statuses = [
+        (await client.post(f"/api/f/{published['slug']}/submit", json={"values": values})).status_code
+        for _ in range(3)
+    ]
+    assert statuses == [201, 201, 429]
+    web = await client.post(f"/f/{published['slug']}/submit", data=values)
+    assert web.status_code == 429
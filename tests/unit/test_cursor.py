@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import pytest
+
+from hitech_forms.platform.cursor import decode_cursor, encode_cursor
+from hitech_forms.platform.errors import AppError
+
+
+def test_cursor_round_trip_is_opaque_and_stable():
+    token = encode_cursor((1700000000, 42))
+    assert "=" not in token
+    assert token == encode_cursor((1700000000, 42))
+    assert decode_cursor(token, size=2) == (1700000000, 42)
+
+
+@pytest.mark.parametrize("token", ["", "not-base64!", encode_cursor((1,)), "WyJhIiwxXQ"])
+def test_invalid_cursor_is_bad_request(token):
+    with pytest.raises(AppError) as exc:
+        decode_cursor(token, size=2)
+    assert exc.value.code == "bad_request"
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import threading
+
+from hitech_forms.platform.metrics import MetricsRegistry, statement_verb
+
+
+def test_sharded_counters_sum_across_threads():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs.", ("kind",))
+
+    def _work() -> None:
+        for _ in range(1000):
+            counter.inc(("a",))
+
+    threads = [threading.Thread(target=_work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.inc(("b",), 2.5)
+
+    assert counter.values() == {("a",): 8000.0, ("b",): 2.5}
+    assert registry.render().splitlines() == [
+        "# HELP jobs_total Jobs.",
+        "# TYPE jobs_total counter",
+        'jobs_total{kind="a"} 8000',
+        'jobs_total{kind="b"} 2.5',
+    ]
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, ('/f/{slug}"',))
+
+    assert registry.render().splitlines()[2:] == [
+        'latency_seconds_bucket{route="/f/{slug}\\"",le="0.1"} 2',
+        'latency_seconds_bucket{route="/f/{slug}\\"",le="1"} 3',
+        'latency_seconds_bucket{route="/f/{slug}\\"",le="+Inf"} 4',
+        'latency_seconds_sum{route="/f/{slug}\\""} 3.65',
+        'latency_seconds_count{route="/f/{slug}\\""} 4',
+    ]
+
+
+def test_exited_threads_fold_their_shards():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs.")
+    histogram = registry.histogram("job_seconds", "Job time.", buckets=(0.1, 1.0))
+
+    def _work() -> None:
+        counter.inc()
+        histogram.observe(0.5)
+
+    for _ in range(50):
+        thread = threading.Thread(target=_work)
+        thread.start()
+        thread.join()
+
+    # Only the retained base shard remains; no totals are lost.
+    assert counter._shards == [] and histogram._shards == []
+    assert counter.values() == {(): 50.0}
+    assert histogram.snapshot() == {(): ([0, 50], 50, 25.0)}
+    registry.reset()
+    assert counter.values() == {} and histogram.snapshot() == {}
+
+
+def test_statement_verb_is_bounded():
+    assert statement_verb("\n  select 1") == "SELECT"
+    assert statement_verb("INSERT INTO submissions VALUES (?)") == "INSERT"
+    assert statement_verb("VACUUM") == "OTHER"
+    assert statement_verb("") == "OTHER"
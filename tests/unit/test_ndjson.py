@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import anyio
+
+from hitech_forms.app.ndjson import iter_body_lines
+
+
+def _split(chunks: list[bytes], max_line_bytes: int = 16) -> list[bytes]:
+    async def _stream():
+        for chunk in chunks:
+            yield chunk
+
+    async def _main() -> list[bytes]:
+        stream = _stream()
+        return await anyio.to_thread.run_sync(lambda: list(iter_body_lines(stream, max_line_bytes=max_line_bytes)))
+
+    return anyio.run(_main)
+
+
+def test_lines_span_chunk_boundaries():
+    assert _split([b'{"a"', b':1}\n{"b":2}\n\n{"c"', b":3}", b""]) == [b'{"a":1}', b'{"b":2}', b"", b'{"c":3}']
+    assert _split([b"one\n", b"two\n"]) == [b"one", b"two"]
+
+
+def test_overlong_lines_are_cut_and_the_rest_skipped():
+    long = b"x" * 40
+    assert _split([b"ok\n" + long[:20], long[20:] + b"\nnext\n"]) == [b"ok", b"x" * 16, b"next"]
+    assert _split([long + b"\n" + long]) == [b"x" * 16, b"x" * 16]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+
+from hitech_forms.app.security.rate_limit import (
+    InMemoryRateLimiter,
+    SlidingWindow,
+    SqliteRateLimiter,
+    TokenBucket,
+)
+from hitech_forms.platform.errors import AppError
+
+
+class FakeClock:
+    def __init__(self, now: float = 1700000040.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _allowed(limiter, key: str = "1.2.3.4", limit: int = 3) -> bool:
+    try:
+        limiter.check(key=key, scope="test", limit_per_minute=limit)
+    except AppError as exc:
+        assert exc.code == "rate_limited"
+        return False
+    return True
+
+
+def test_sliding_window_weights_previous_minute():
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(SlidingWindow(), clock=clock)
+    assert [_allowed(limiter) for _ in range(4)] == [True, True, True, False]
+    # 30s into the next window half of the previous three still count.
+    clock.now += 90
+    assert [_allowed(limiter) for _ in range(3)] == [True, True, False]
+    # A window with no traffic in between resets the weight entirely.
+    clock.now += 120
+    assert [_allowed(limiter) for _ in range(4)] == [True, True, True, False]
+
+
+def test_token_bucket_refills_continuously():
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(TokenBucket(), clock=clock)
+    assert [_allowed(limiter) for _ in range(4)] == [True, True, True, False]
+    clock.now += 20
+    assert [_allowed(limiter) for _ in range(2)] == [True, False]
+
+
+def test_memory_limiter_is_bounded():
+    clock = FakeClock()
+    limiter = InMemoryRateLimiter(max_keys=2, clock=clock)
+    for key in ("a", "b", "c"):
+        assert _allowed(limiter, key)
+    assert len(limiter) == 2
+    clock.now += 121
+    assert _allowed(limiter, "d")
+    assert len(limiter) == 1
+
+
+@pytest.mark.parametrize("algorithm", [SlidingWindow, TokenBucket])
+def test_sqlite_limiter_is_shared_between_instances(tmp_path, algorithm):
+    clock = FakeClock()
+    path = str(tmp_path / "limits.db")
+    first = SqliteRateLimiter(path, algorithm(), clock=clock)
+    second = SqliteRateLimiter(path, algorithm(), clock=clock)
+    assert [_allowed(limiter) for limiter in (first, second, first, second)] == [True, True, True, False]
+    assert _allowed(second, key="other")
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from hitech_forms.platform.cache import BoundedLRUCache
+from hitech_forms.platform.errors import AppError
+from hitech_forms.services.submission_validation import (
+    SubmissionValidatorCache,
+    compile_submission_validator,
+)
+
+
+def _field(field_id: int, key: str, field_type: str, *, position: int, required: bool = False, config: str = "{}"):
+    return SimpleNamespace(
+        id=field_id,
+        field_key=key,
+        label=key.title(),
+        type=field_type,
+        required=1 if required else 0,
+        position=position,
+        config_json=config,
+    )
+
+
+def _fields():
+    return [
+        _field(3, "priority", "select", position=2, required=True, config='{"options":["low","high"]}'),
+        _field(1, "name", "text", position=0, required=True),
+        _field(2, "notify", "checkbox", position=1),
+    ]
+
+
+def test_compiled_validator_orders_fields_and_normalizes():
+    validator = compile_submission_validator(form_id=1, form_version_id=10, fields=_fields())
+    assert [field.key for field in validator.fields] == ["name", "notify", "priority"]
+    assert validator.validate({"name": "  Ada ", "notify": "on", "priority": "high"}) == {
+        "name": "Ada",
+        "notify": "true",
+        "priority": "high",
+    }
+
+
+def test_compiled_validator_rejects_invalid_input():
+    validator = compile_submission_validator(form_id=1, form_version_id=10, fields=_fields())
+    with pytest.raises(AppError) as missing:
+        validator.validate({"priority": "low"})
+    assert missing.value.message == "field 'Name' is required"
+    with pytest.raises(AppError) as invalid:
+        validator.validate({"name": "Ada", "priority": "urgent"})
+    assert invalid.value.message == "field 'Priority' has invalid option"
+
+
+def test_validator_cache_compiles_once_and_invalidates_per_form():
+    cache = SubmissionValidatorCache(max_entries=4)
+    loads: list[int] = []
+
+    def _load():
+        loads.append(1)
+        return _fields()
+
+    first = cache.get_or_compile(form_id=1, form_version_id=10, published_at=5, load_fields=_load)
+    second = cache.get_or_compile(form_id=1, form_version_id=10, published_at=5, load_fields=_load)
+    assert first is second
+    assert len(loads) == 1
+
+    cache.invalidate_form(1)
+    cache.get_or_compile(form_id=1, form_version_id=10, published_at=5, load_fields=_load)
+    assert len(loads) == 2
+
+
+def test_bounded_lru_cache_evicts_least_recently_used():
+    cache: BoundedLRUCache[str, int] = BoundedLRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
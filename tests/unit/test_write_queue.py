@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from hitech_forms.contracts import SubmissionSummaryDTO
+from hitech_forms.db.write_queue import SubmissionWriteQueue
+from hitech_forms.platform.errors import AppError
+from hitech_forms.services.async_services import AsyncSubmissionService
+
+
+class _StuckWriteQueue(SubmissionWriteQueue):
+    def __init__(self) -> None:
+        super().__init__(max_batch=1, max_delay_ms=0)
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def _commit(self, batch):
+        self.writing.set()
+        self.release.wait(5)
+        return [pending.payload["form_id"] for pending in batch]
+
+
+def _enqueue(writer: SubmissionWriteQueue, form_id: int):
+    return writer.enqueue(form_id=form_id, form_version_id=1, answers={}, now_epoch=0)
+
+
+def test_stop_fails_writes_the_stuck_writer_never_took():
+    writer = _StuckWriteQueue()
+    in_flight = _enqueue(writer, 1)
+    assert writer.writing.wait(5)
+    queued = [_enqueue(writer, form_id) for form_id in (2, 3)]
+
+    writer.stop(timeout=0.05)
+
+    for future in queued:
+        error = future.exception(timeout=1)
+        assert isinstance(error, AppError)
+        assert error.status_code == 503
+    writer.release.set()
+    # The batch already being written still completes normally.
+    assert in_flight.result(timeout=5) == 1
+
+
+class _MiscountingWriteQueue(SubmissionWriteQueue):
+    def __init__(self) -> None:
+        super().__init__(max_batch=1, max_delay_ms=0)
+        self.calls = 0
+
+    def _commit(self, batch):
+        self.calls += 1
+        # The first batch comes back short, which fails while resolving futures.
+        return [] if self.calls == 1 else [pending.payload["form_id"] for pending in batch]
+
+
+def test_writer_survives_a_batch_that_fails_while_resolving():
+    writer = _MiscountingWriteQueue()
+    assert isinstance(_enqueue(writer, 1).exception(timeout=5), ValueError)
+    thread = writer._thread
+    assert _enqueue(writer, 2).result(timeout=5) == 2
+    assert writer._thread is thread
+    writer.stop()
+
+
+def test_replacement_writer_does_not_share_the_stuck_writers_queue():
+    writer = _StuckWriteQueue()
+    in_flight = _enqueue(writer, 1)
+    assert writer.writing.wait(5)
+    stuck = writer._thread
+    writer.stop(timeout=0.05)
+
+    later = _enqueue(writer, 2)
+    assert writer._thread is not stuck
+    writer.release.set()
+    assert in_flight.result(timeout=5) == 1
+    assert later.result(timeout=5) == 2
+    assert stuck is not None
+    stuck.join(5)
+    assert not stuck.is_alive()
+    writer.stop()
+
+
+class _GatedWriteQueue(SubmissionWriteQueue):
+    """Holds the first batch until released and records what it commits."""
+
+    def __init__(self) -> None:
+        super().__init__(max_batch=1, max_delay_ms=0)
+        self.writing = threading.Event()
+        self.release = threading.Event()
+        self.committed: list[int] = []
+        self.futures: list = []
+
+    def enqueue(self, **kwargs):
+        future = super().enqueue(**kwargs)
+        self.futures.append(future)
+        return future
+
+    def _commit(self, batch):
+        self.writing.set()
+        self.release.wait(5)
+        form_ids = [pending.payload["form_id"] for pending in batch]
+        self.committed.extend(form_ids)
+        return [SubmissionSummaryDTO(id=f, form_id=f, form_version_id=1, submission_seq=f, created_at=0) for f in form_ids]
+
+
+def test_writer_skips_cancelled_writes():
+    writer = _GatedWriteQueue()
+    in_flight = _enqueue(writer, 1)
+    assert writer.writing.wait(5)
+    abandoned = _enqueue(writer, 2)
+    assert abandoned.cancel()
+    writer.release.set()
+
+    assert in_flight.result(timeout=5).form_id == 1
+    assert _enqueue(writer, 3).result(timeout=5).form_id == 3
+    assert writer.committed == [1, 3]
+    writer.stop()
+
+
+class _InlineRunner:
+    async def run(self, work):
+        return work(None)
+
+
+class _Preparer:
+    def prepare_public_submission(self, *, slug, values):
+        return {"form_id": int(values["id"]), "form_version_id": 1, "answers": {}}
+
+
+def test_cancelled_async_submit_commits_and_leaves_the_writer_running():
+    writer = _GatedWriteQueue()
+    service = AsyncSubmissionService(_InlineRunner(), lambda session: _Preparer(), writer)
+
+    async def _scenario():
+        first = asyncio.ensure_future(service.command_submit_public(slug="s", values={"id": "1"}))
+        assert await asyncio.to_thread(writer.writing.wait, 5)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        writer.release.set()
+        return await asyncio.wait_for(service.command_submit_public(slug="s", values={"id": "2"}), 5)
+
+    assert asyncio.run(_scenario())["form_id"] == 2
+    # The cancelled request's row was already being written: it commits and
+    # its future resolves instead of being cancelled under the writer.
+    assert writer.committed == [1, 2]
+    assert writer.futures[0].result(timeout=5).form_id == 1
+    writer.stop()